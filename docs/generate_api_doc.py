@@ -16,6 +16,7 @@ model.DurativeAction
 model.Parameter
 model.State
 model.UPState
+model.UPCompiledState
 model.metrics.PlanQualityMetric
 model.metrics.MinimizeActionCosts
 model.metrics.MinimizeSequentialPlanLength
@@ -27,6 +27,7 @@ from unified_planning.engines.plan_validator import (
 )
 from unified_planning.engines.oversubscription_planner import OversubscriptionPlanner
 from unified_planning.engines.replanner import Replanner
+from unified_planning.engines.best_first_search import BestFirstSearchPlanner
 from unified_planning.engines.results import (
     Result,
     LogMessage,
@@ -49,6 +50,7 @@ from unified_planning.engines.mixins.sequential_simulator import (
 from unified_planning.engines.mixins.oneshot_planner import OptimalityGuarantee
 from unified_planning.engines.mixins.anytime_planner import AnytimeGuarantee
 from unified_planning.engines.mixins.compiler import CompilationKind
+from unified_planning.engines.compilation_cache import CompilationCache
 from unified_planning.engines.mixins.portfolio import PortfolioSelectorMixin
 
 __all__ = [
@@ -60,11 +62,13 @@ __all__ = [
     "SequentialPlanValidator",
     "SequentialSimulatorMixin",
     "UPSequentialSimulator",
+    "BestFirstSearchPlanner",
     "Event",
     "InstantaneousEvent",
     "Engine",
     "OptimalityGuarantee",
     "CompilationKind",
+    "CompilationCache",
     "Credits",
     "Result",
     "LogMessage",
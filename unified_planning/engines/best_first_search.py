@@ -0,0 +1,362 @@
+# Copyright 2021-2023 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import heapq
+import time
+import tracemalloc
+from fractions import Fraction
+from itertools import count
+from typing import IO, Callable, Dict, List, Optional, Tuple, Type, Union
+import unified_planning as up
+from unified_planning.engines.engine import Engine
+from unified_planning.engines.heuristics import (
+    Heuristic,
+    HAdd,
+    HFF,
+    HMax,
+    LandmarkCount,
+)
+from unified_planning.engines.mixins.oneshot_planner import (
+    OneshotPlannerMixin,
+    OptimalityGuarantee,
+)
+from unified_planning.engines.results import (
+    PlanGenerationResult,
+    PlanGenerationResultStatus,
+)
+from unified_planning.engines.sequential_simulator import UPSequentialSimulator
+from unified_planning.exceptions import (
+    UPConflictingEffectsException,
+    UPInvalidActionError,
+    UPUsageError,
+)
+from unified_planning.model import FNode, MinimizeActionCosts, ProblemKind, State
+from unified_planning.model.walkers import StateEvaluator
+from unified_planning.plans import ActionInstance, SequentialPlan
+
+SEARCH_ALGORITHMS = ("gbfs", "astar", "wastar")
+
+HEURISTICS: Dict[str, Optional[Type[Heuristic]]] = {
+    "goal_count": None,
+    "blind": None,
+    "hadd": HAdd,
+    "hmax": HMax,
+    "hff": HFF,
+    "lmcount": LandmarkCount,
+}
+
+# Number of expanded nodes between two checks of the memory limit
+MEMORY_CHECK_INTERVAL = 1000
+
+
+class BestFirstSearchPlanner(Engine, OneshotPlannerMixin):
+    """
+    Native python implementation of a best-first search oneshot planner.
+
+    The search explores the states created by the
+    :class:`~unified_planning.engines.UPSequentialSimulator` (using its ``compiled_state``
+    mode), detecting duplicates on the hashed states, and supports the following ``search``
+    algorithms:
+
+    *   | ``gbfs``: greedy best-first search, the open list is ordered by the heuristic value only;
+    *   | ``astar``: A* search, the open list is ordered by ``g + h``;
+    *   | ``wastar``: weighted A* search, the open list is ordered by ``g + weight * h``.
+
+    The heuristic is the one given to the ``solve`` method; if no heuristic is given, the
+    ``heuristic`` param selects one of the following:
+
+    *   | ``goal_count``: the number of unsatisfied goals (the default for ``gbfs``);
+    *   | ``blind``: ``0`` in every state (the default for ``astar`` and ``wastar``);
+    *   | ``hadd``, ``hmax``, ``hff`` and ``lmcount``: the heuristics of the
+        | :mod:`~unified_planning.engines.heuristics` package.
+
+    ``astar`` with the ``blind`` or the ``hmax`` heuristic finds an optimal plan, but the
+    result is ``SOLVED_SATISFICING`` also in this case, as the planner does not guarantee
+    the optimality with its default params. A heuristic
+    returning ``None`` marks the state as a dead-end, that is pruned from the search.
+
+    The cost of a plan is given by the :class:`~unified_planning.model.metrics.MinimizeActionCosts`
+    quality metric of the problem, if present, otherwise every action costs ``1``.
+
+    The ``max_nodes`` param limits the number of expanded states, while the ``max_memory``
+    param (in MB) limits the memory allocated by the search, measured with :mod:`tracemalloc`
+    from the start of the search.
+    """
+
+    def __init__(
+        self,
+        search: str = "gbfs",
+        weight: Union[float, int, str] = 2,
+        max_nodes: Optional[Union[int, str]] = None,
+        max_memory: Optional[Union[float, int, str]] = None,
+        heuristic: Optional[str] = None,
+        **kwargs,
+    ):
+        Engine.__init__(self)
+        OneshotPlannerMixin.__init__(self)
+        if search not in SEARCH_ALGORITHMS:
+            raise UPUsageError(
+                f"Unknown search algorithm {search}; supported algorithms are {', '.join(SEARCH_ALGORITHMS)}."
+            )
+        self._search = search
+        self._weight = float(weight)
+        if self._weight < 1:
+            raise UPUsageError("The weight of the weighted A* must be at least 1.")
+        self._max_nodes = int(max_nodes) if max_nodes is not None else None
+        self._max_memory = float(max_memory) if max_memory is not None else None
+        if heuristic is None:
+            heuristic = "goal_count" if search == "gbfs" else "blind"
+        if heuristic not in HEURISTICS:
+            raise UPUsageError(
+                f"Unknown heuristic {heuristic}; supported heuristics are {', '.join(HEURISTICS)}."
+            )
+        self._heuristic = heuristic
+
+    @property
+    def name(self) -> str:
+        return "up_best_first_search"
+
+    @staticmethod
+    def supported_kind() -> ProblemKind:
+        supported_kind = UPSequentialSimulator.supported_kind()
+        supported_kind.unset_quality_metrics("OVERSUBSCRIPTION")
+        supported_kind.unset_quality_metrics("TEMPORAL_OVERSUBSCRIPTION")
+        supported_kind.unset_quality_metrics("MAKESPAN")
+        supported_kind.unset_quality_metrics("FINAL_VALUE")
+        supported_kind.unset_oversubscription_kind("INT_NUMBERS_IN_OVERSUBSCRIPTION")
+        supported_kind.unset_oversubscription_kind("REAL_NUMBERS_IN_OVERSUBSCRIPTION")
+        return supported_kind
+
+    @staticmethod
+    def supports(problem_kind: ProblemKind) -> bool:
+        return problem_kind <= BestFirstSearchPlanner.supported_kind()
+
+    @staticmethod
+    def satisfies(optimality_guarantee: OptimalityGuarantee) -> bool:
+        # The optimality depends on the search and heuristic params, that are not known
+        # here, so the plans are never reported as optimal
+        return optimality_guarantee == OptimalityGuarantee.SATISFICING
+
+    def _memory_exceeded(self, baseline: int) -> bool:
+        if self._max_memory is None:
+            return False
+        current, _ = tracemalloc.get_traced_memory()
+        return (current - baseline) / (1024 * 1024) > self._max_memory
+
+    def _solve(
+        self,
+        problem: "up.model.AbstractProblem",
+        heuristic: Optional[Callable[["up.model.state.State"], Optional[float]]] = None,
+        timeout: Optional[float] = None,
+        output_stream: Optional[IO[str]] = None,
+    ) -> "up.engines.results.PlanGenerationResult":
+        # the allocations are traced only if a memory limit is set, as tracing slows
+        # down the search; if the tracing was already started it is left running
+        start_tracing = self._max_memory is not None and not tracemalloc.is_tracing()
+        if start_tracing:
+            tracemalloc.start()
+        try:
+            return self._search_plan(problem, heuristic, timeout, output_stream)
+        finally:
+            if start_tracing:
+                tracemalloc.stop()
+
+    def _search_plan(
+        self,
+        problem: "up.model.AbstractProblem",
+        heuristic: Optional[Callable[["up.model.state.State"], Optional[float]]],
+        timeout: Optional[float],
+        output_stream: Optional[IO[str]],
+    ) -> "up.engines.results.PlanGenerationResult":
+        assert isinstance(problem, up.model.Problem)
+        start = time.time()
+        memory_baseline = (
+            tracemalloc.get_traced_memory()[0] if self._max_memory is not None else 0
+        )
+        simulator = UPSequentialSimulator(problem, compiled_state=True)
+        se = StateEvaluator(problem)
+
+        cost_metric: Optional[MinimizeActionCosts] = None
+        for qm in problem.quality_metrics:
+            if isinstance(qm, MinimizeActionCosts):
+                cost_metric = qm
+        # Map from the grounded action to its constant cost and its cost expression; the
+        # constant cost is None if the cost depends on the state where the action is applied
+        costs: Dict[
+            Tuple["up.model.Action", Tuple[FNode, ...]],
+            Tuple[Optional[Union[int, Fraction]], FNode],
+        ] = {}
+
+        def action_cost(
+            state: State, action: "up.model.Action", params: Tuple[FNode, ...]
+        ) -> Union[int, Fraction]:
+            if cost_metric is None:
+                return 1
+            key = (action, params)
+            cached = costs.get(key, None)
+            if cached is None:
+                action_cost_exp = cost_metric.get_action_cost(action)
+                if action_cost_exp is None:
+                    raise UPUsageError(
+                        f"The action {action.name} has no cost in the MinimizeActionCosts metric."
+                    )
+                cost = action_cost_exp.substitute(
+                    dict(zip(action.parameters, params))
+                ).simplify()
+                cached = (cost.constant_value() if cost.is_constant() else None, cost)
+                costs[key] = cached
+            value, cost = cached
+            if value is not None:
+                return value
+            return se.evaluate(cost, state).constant_value()
+
+        if heuristic is None:
+            if self._heuristic == "goal_count":
+                heuristic = lambda s: len(simulator.get_unsatisfied_goals(s))
+            elif self._heuristic == "blind":
+                heuristic = lambda s: 0
+            else:
+                heuristic_class = HEURISTICS[self._heuristic]
+                assert heuristic_class is not None
+                heuristic = heuristic_class(problem)
+        weight = self._weight if self._search == "wastar" else 1.0
+
+        def priority(g: Union[int, Fraction], h: float) -> float:
+            if self._search == "gbfs":
+                return h
+            return float(g) + weight * h
+
+        initial_state = simulator.get_initial_state()
+        pruned = False
+        expanded = 0
+        # the expanded nodes after which the memory limit is checked again
+        next_memory_check = 0
+        generated = 1
+        plan: Optional[SequentialPlan] = None
+        status: Optional[PlanGenerationResultStatus] = None
+
+        # For every reached state, the best cost found, the parent state and the
+        # action used to reach it
+        best_g: Dict[State, Union[int, Fraction]] = {initial_state: 0}
+        parents: Dict[
+            State, Optional[Tuple[State, "up.model.Action", Tuple[FNode, ...]]]
+        ] = {initial_state: None}
+        # Open list ordered by (priority, h, insertion order); the insertion order
+        # breaks the ties in FIFO order, avoiding the comparison of the states
+        open_list: List[tuple] = []
+        tie_breaker = count()
+        h_init = heuristic(initial_state)
+        if h_init is None:
+            pruned = True
+        else:
+            heapq.heappush(
+                open_list,
+                (
+                    priority(0, h_init),
+                    h_init,
+                    next(tie_breaker),
+                    initial_state,
+                    0,
+                    None,
+                ),
+            )
+
+        while open_list:
+            if timeout is not None and time.time() - start > timeout:
+                status = PlanGenerationResultStatus.TIMEOUT
+                break
+            if self._max_nodes is not None and expanded >= self._max_nodes:
+                status = PlanGenerationResultStatus.UNSOLVABLE_INCOMPLETELY
+                break
+            if self._max_memory is not None and expanded >= next_memory_check:
+                next_memory_check = expanded + MEMORY_CHECK_INTERVAL
+                if self._memory_exceeded(memory_baseline):
+                    status = PlanGenerationResultStatus.MEMOUT
+                    break
+            _, _, _, state, g, parent_applicable = heapq.heappop(open_list)
+            if best_g[state] < g:
+                # A cheaper path to this state was found after it was inserted
+                continue
+            if simulator.is_goal(state):
+                plan = self._extract_plan(state, parents)
+                status = PlanGenerationResultStatus.SOLVED_SATISFICING
+                break
+            expanded += 1
+            if parent_applicable is None:
+                applicable = list(simulator.get_applicable_actions(state))
+            else:
+                applicable = list(
+                    simulator.get_applicable_actions_from_parent(
+                        state, parent_applicable
+                    )
+                )
+            for action, params in applicable:
+                try:
+                    child = simulator.apply_unsafe(state, action, params)
+                except (UPConflictingEffectsException, UPInvalidActionError):
+                    continue
+                child_g = g + action_cost(state, action, params)
+                if child in best_g and best_g[child] <= child_g:
+                    continue
+                h = heuristic(child)
+                generated += 1
+                if h is None:
+                    pruned = True
+                    continue
+                best_g[child] = child_g
+                parents[child] = (state, action, params)
+                heapq.heappush(
+                    open_list,
+                    (
+                        priority(child_g, h),
+                        h,
+                        next(tie_breaker),
+                        child,
+                        child_g,
+                        applicable,
+                    ),
+                )
+
+        if status is None:
+            if pruned:
+                status = PlanGenerationResultStatus.UNSOLVABLE_INCOMPLETELY
+            else:
+                status = PlanGenerationResultStatus.UNSOLVABLE_PROVEN
+        metrics = {
+            "search": self._search,
+            "expanded_nodes": str(expanded),
+            "generated_nodes": str(generated),
+            "search_time": str(time.time() - start),
+        }
+        if output_stream is not None:
+            for key, value in metrics.items():
+                output_stream.write(f"{key}: {value}\n")
+        return PlanGenerationResult(status, plan, self.name, metrics=metrics)
+
+    def _extract_plan(
+        self,
+        state: State,
+        parents: Dict[
+            State, Optional[Tuple[State, "up.model.Action", Tuple[FNode, ...]]]
+        ],
+    ) -> SequentialPlan:
+        actions: List[ActionInstance] = []
+        parent = parents[state]
+        while parent is not None:
+            state, action, params = parent
+            actions.append(ActionInstance(action, params))
+            parent = parents[state]
+        actions.reverse()
+        return SequentialPlan(actions)
@@ -0,0 +1,388 @@
+# Copyright 2021-2023 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+This module defines the `CompilationCache`, a persistent cache of the results of
+the compilers, shared between different runs of the library.
+"""
+
+
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+from enum import Enum
+from fractions import Fraction
+from functools import partial
+from typing import Any, Dict, List, Optional, Tuple
+
+import unified_planning as up
+from unified_planning.exceptions import UPUsageError
+from unified_planning.plans import ActionInstance
+
+
+# A map-back table maps the name of every action of a compiled problem to None, if the
+# action has no counterpart, or to the name of the action it comes from and, when the
+# compiler changes the parameters, to the encoded actual parameters of that action.
+MapBackTable = Dict[str, Optional[Tuple[str, Optional[List[Tuple[str, Any]]]]]]
+
+# The extension of the files of the cache
+FILE_EXTENSION = ".upcache"
+
+# The types of the values of the encoded parameters, by kind
+PARAMETER_TYPES = {"o": str, "b": bool, "i": int, "r": str}
+
+# The encoding of the length of the JSON header, at the start of the files of the cache
+HEADER_LENGTH = struct.Struct(">I")
+
+
+class _NotCacheable(Exception):
+    """Raised when a compilation can't be stored in the cache."""
+
+    pass
+
+
+class CompilationCache:
+    """
+    A persistent cache of the :class:`~unified_planning.engines.CompilerResult` returned by
+    the compilers; it is enabled by setting it as the
+    :func:`compilation_cache <unified_planning.environment.Environment.compilation_cache>`
+    of the `Environment` of the compiled problems.
+
+    Every result is stored in a file of the given directory, named after the hash of the
+    problem, of the name, version and options of the compiler and of the `CompilationKind`;
+    the compiled problem is stored in the protobuf format, after a JSON header with the
+    name of the engine and the map-back function, as tables from the names of the compiled
+    actions to the original ones; the cache requires the `protobuf` package.
+    No code is executed to load a file: a file that is not valid is deleted and the
+    problem is compiled again.
+    The results are stored only for `Problems` compiled by the compilers whose map-back
+    function replaces or lifts the actions (like all the compilers of this library and
+    their pipelines); the others are always compiled.
+
+    When the files in the directory exceed `max_size` bytes, the least recently used
+    are deleted.
+    """
+
+    def __init__(self, path: str, max_size: int = 2**30):
+        try:
+            import unified_planning.grpc.generated.unified_planning_pb2
+        except ImportError:
+            raise UPUsageError(
+                "The CompilationCache requires the protobuf package to be installed."
+            )
+        self._path = path
+        self._max_size = max_size
+        os.makedirs(path, exist_ok=True)
+
+    @property
+    def path(self) -> str:
+        """Returns the directory where the compiled problems are stored."""
+        return self._path
+
+    @property
+    def max_size(self) -> int:
+        """Returns the maximum size in bytes of the files of this cache."""
+        return self._max_size
+
+    def get(
+        self,
+        compiler: "up.engines.engine.Engine",
+        problem: "up.model.AbstractProblem",
+        compilation_kind: Optional["up.engines.CompilationKind"],
+    ) -> Optional["up.engines.results.CompilerResult"]:
+        """
+        Returns the stored result of the compilation of the given problem with the given
+        compiler and `CompilationKind`, or None if it is not stored.
+
+        :param compiler: The compiler of the problem.
+        :param problem: The compiled problem.
+        :param compilation_kind: The `CompilationKind` of the compilation; None for the
+            :class:`~unified_planning.engines.CompilersPipeline`.
+        :return: The stored `CompilerResult`, if any.
+        """
+        import unified_planning.grpc.generated.unified_planning_pb2 as proto
+        from unified_planning.grpc.proto_reader import ProtobufReader  # type: ignore[attr-defined]
+
+        try:
+            key = self._key(compiler, problem, compilation_kind)
+        except _NotCacheable:
+            return None
+        assert isinstance(problem, up.model.Problem)
+        file_name = os.path.join(self._path, f"{key}{FILE_EXTENSION}")
+        try:
+            with open(file_name, "rb") as file:
+                data = file.read()
+            os.utime(file_name)
+        except OSError:
+            return None
+        try:
+            (header_length,) = HEADER_LENGTH.unpack_from(data)
+            header_end = HEADER_LENGTH.size + header_length
+            header = json.loads(data[HEADER_LENGTH.size : header_end].decode())
+            engine_name = header["engine_name"]
+            if not isinstance(engine_name, str):
+                raise ValueError("The engine name is not a string.")
+            tables = _load_map_back_tables(header["map_back"])
+            compiled_problem = ProtobufReader().convert(
+                proto.Problem.FromString(data[header_end:]),  # type: ignore[attr-defined]
+                problem.environment,
+            )
+        except Exception:
+            # the file is corrupted, it is deleted and compiled again
+            self._remove(file_name)
+            return None
+        return up.engines.results.CompilerResult(
+            compiled_problem,
+            partial(map_back_action_instance, tables=tables, problem=problem),
+            engine_name,
+        )
+
+    def put(
+        self,
+        compiler: "up.engines.engine.Engine",
+        problem: "up.model.AbstractProblem",
+        compilation_kind: Optional["up.engines.CompilationKind"],
+        result: "up.engines.results.CompilerResult",
+    ):
+        """
+        Stores the result of the compilation of the given problem with the given compiler
+        and `CompilationKind`; the results that can't be stored are ignored.
+
+        :param compiler: The compiler of the problem.
+        :param problem: The compiled problem.
+        :param compilation_kind: The `CompilationKind` of the compilation; None for the
+            :class:`~unified_planning.engines.CompilersPipeline`.
+        :param result: The `CompilerResult` returned by the compiler.
+        """
+        from unified_planning.grpc.proto_writer import ProtobufWriter  # type: ignore[attr-defined]
+
+        if result.problem is None or result.map_back_action_instance is None:
+            return
+        try:
+            key = self._key(compiler, problem, compilation_kind)
+            assert isinstance(problem, up.model.Problem)
+            tables = _map_back_tables(result.map_back_action_instance, problem)
+            payload = ProtobufWriter().convert(result.problem).SerializeToString()
+        except (_NotCacheable, KeyError, ValueError, up.exceptions.UPException):
+            return
+        header = json.dumps(
+            {"engine_name": result.engine_name, "map_back": tables}
+        ).encode()
+        fd, temp_name = tempfile.mkstemp(dir=self._path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(HEADER_LENGTH.pack(len(header)))
+                file.write(header)
+                file.write(payload)
+            os.replace(temp_name, os.path.join(self._path, f"{key}{FILE_EXTENSION}"))
+        except OSError:
+            self._remove(temp_name)
+            return
+        self._evict()
+
+    def clear(self):
+        """Deletes all the results stored in this cache."""
+        for entry in os.scandir(self._path):
+            if entry.name.endswith(FILE_EXTENSION):
+                self._remove(entry.path)
+
+    def _key(
+        self,
+        compiler: "up.engines.engine.Engine",
+        problem: "up.model.AbstractProblem",
+        compilation_kind: Optional["up.engines.CompilationKind"],
+    ) -> str:
+        if not isinstance(problem, up.model.Problem):
+            raise _NotCacheable
+        content = [
+            _compiler_key(compiler),
+            "" if compilation_kind is None else compilation_kind.name,
+            str(problem),
+        ]
+        return hashlib.sha256("\n".join(content).encode()).hexdigest()
+
+    def _evict(self):
+        """Deletes the least recently used files until the cache fits in `max_size`."""
+        files = []
+        total_size = 0
+        for entry in os.scandir(self._path):
+            if not entry.name.endswith(FILE_EXTENSION):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, entry.path))
+            total_size += stat.st_size
+        files.sort()
+        for _, size, file_name in files:
+            if total_size <= self._max_size:
+                break
+            self._remove(file_name)
+            total_size -= size
+
+    @staticmethod
+    def _remove(file_name: str):
+        try:
+            os.remove(file_name)
+        except OSError:
+            pass
+
+
+def _compiler_key(compiler: "up.engines.engine.Engine") -> str:
+    """
+    Returns a string identifying the given compiler: its name, the version of the package
+    defining it and its options, or raises `_NotCacheable` if they can't be represented.
+    """
+    package = sys.modules.get(type(compiler).__module__.split(".")[0], None)
+    version = getattr(package, "__version__", "")
+    options = []
+    for attribute, value in sorted(vars(compiler).items()):
+        if isinstance(value, up.engines.engine.Engine):
+            options.append(f"{attribute}={_compiler_key(value)}")
+        elif isinstance(value, list) and all(
+            isinstance(v, up.engines.engine.Engine) for v in value
+        ):
+            compilers = ", ".join(_compiler_key(v) for v in value)
+            options.append(f"{attribute}=[{compilers}]")
+        elif value is None or isinstance(value, (bool, int, float, str, Enum)):
+            options.append(f"{attribute}={value!r}")
+        else:
+            raise _NotCacheable
+    return f"{type(compiler).__qualname__} {compiler.name} {version} {options}"
+
+
+def _encode_parameter(parameter: "up.model.FNode", problem: "up.model.Problem"):
+    if parameter.is_object_exp():
+        name = parameter.object().name
+        if not problem.has_object(name):
+            raise _NotCacheable
+        return ("o", name)
+    elif parameter.is_bool_constant():
+        return ("b", parameter.bool_constant_value())
+    elif parameter.is_int_constant():
+        return ("i", parameter.int_constant_value())
+    elif parameter.is_real_constant():
+        return ("r", str(parameter.real_constant_value()))
+    raise _NotCacheable
+
+
+def _decode_parameter(
+    parameter: Tuple[str, Any], problem: "up.model.Problem"
+) -> "up.model.FNode":
+    kind, value = parameter
+    em = problem.environment.expression_manager
+    if kind == "o":
+        return em.ObjectExp(problem.object(value))
+    elif kind == "b":
+        return em.Bool(value)
+    elif kind == "i":
+        return em.Int(value)
+    assert kind == "r"
+    return em.Real(Fraction(value))
+
+
+def _load_map_back_tables(tables: Any) -> List[MapBackTable]:
+    """
+    Returns the map-back tables read from the JSON header of a file of the cache, or
+    raises `ValueError` if they are not valid.
+    """
+    if not isinstance(tables, list):
+        raise ValueError("The map-back tables are not a list.")
+    res = []
+    for table in tables:
+        if not isinstance(table, dict):
+            raise ValueError("The map-back table is not a dict.")
+        loaded: MapBackTable = {}
+        for name, entry in table.items():
+            if entry is None:
+                loaded[name] = None
+                continue
+            old_name, parameters = entry
+            if not isinstance(old_name, str):
+                raise ValueError("The name of the original action is not a string.")
+            if parameters is not None:
+                parameters = [(kind, value) for kind, value in parameters]
+                for kind, value in parameters:
+                    expected_type = PARAMETER_TYPES.get(kind, None)
+                    if expected_type is None or type(value) is not expected_type:
+                        raise ValueError("The encoded parameter is not valid.")
+            loaded[name] = (old_name, parameters)
+        res.append(loaded)
+    return res
+
+
+def _map_back_tables(map_back, problem: "up.model.Problem") -> List[MapBackTable]:
+    """
+    Returns the tables equivalent to the given map-back function, applied in order, or
+    raises `_NotCacheable` if the function is not supported.
+    """
+    from unified_planning.engines.compilers.utils import (
+        lift_action_instance,
+        replace_action,
+    )
+    from unified_planning.engines.compilers import compilers_pipeline
+
+    if not isinstance(map_back, partial):
+        raise _NotCacheable
+    if map_back.func is compilers_pipeline.map_back_action_instance:
+        tables = []
+        for function in map_back.keywords["map_back_functions"]:
+            tables.extend(_map_back_tables(function, problem))
+        return tables
+    table: MapBackTable = {}
+    if map_back.func is replace_action:
+        for new_action, old_action in map_back.keywords["map"].items():
+            table[new_action.name] = (
+                None if old_action is None else (old_action.name, None)
+            )
+    elif map_back.func is lift_action_instance:
+        for new_action, (old_action, parameters) in map_back.keywords["map"].items():
+            encoded = [_encode_parameter(p, problem) for p in parameters]
+            table[new_action.name] = (old_action.name, encoded)
+    else:
+        raise _NotCacheable
+    return [table]
+
+
+def map_back_action_instance(
+    action_instance: ActionInstance,
+    tables: List[MapBackTable],
+    problem: "up.model.Problem",
+) -> Optional[ActionInstance]:
+    """
+    Maps the given `ActionInstance` of a compiled problem stored in a `CompilationCache`
+    back to an `ActionInstance` of the given original `problem`, using the tables of
+    the compilation.
+    """
+    name = action_instance.action.name
+    parameters = action_instance.actual_parameters
+    agent, motion_paths = action_instance.agent, action_instance.motion_paths
+    for table in tables:
+        try:
+            entry = table[name]
+        except KeyError:
+            raise UPUsageError(
+                "The Action of the given ActionInstance does not have a valid replacement."
+            )
+        if entry is None:
+            return None
+        name, lifted_parameters = entry
+        if lifted_parameters is not None:
+            parameters = tuple(_decode_parameter(p, problem) for p in lifted_parameters)
+            agent, motion_paths = None, None
+    return ActionInstance(problem.action(name), parameters, agent, motion_paths)
@@ -133,6 +133,15 @@ class BoundedTypesRemover(engines.engine.Engine, CompilerMixin):
         new_kind = problem_kind.clone()
         if new_kind.has_bounded_types():
             new_kind.unset_numbers("BOUNDED_TYPES")
+            # the bounds become numeric conditions on the fluents, also the ones
+            # that were not used in the problem
+            if not new_kind.has_int_fluents() and not new_kind.has_real_fluents():
+                new_kind.set_fluents_type("INT_FLUENTS")
+                new_kind.set_fluents_type("REAL_FLUENTS")
+            if not new_kind.has_general_numeric_planning():
+                new_kind.set_problem_type("SIMPLE_NUMERIC_PLANNING")
+            if new_kind.has_timed_effects():
+                new_kind.set_time("TIMED_GOALS")
         return new_kind
 
     def _compile(
@@ -17,7 +17,7 @@ import unified_planning as up
 import unified_planning.engines as engines
 from unified_planning.engines.mixins.compiler import CompilerMixin
 from unified_planning.engines.results import CompilerResult
-from unified_planning.exceptions import UPUsageError
+from unified_planning.exceptions import UPException, UPUsageError
 from unified_planning.plans import ActionInstance
 from typing import List, Callable, Optional
 from functools import partial
@@ -29,16 +29,38 @@ class CompilersPipeline(engines.engine.Engine, CompilerMixin):
     This engine implements a compilers pipeline.
     A list of compilers is given in the class constructor and the engine implements
     the compile operation mode executing the pipeline of the given compilers.
+
+    The `ProblemKind` of every intermediate problem is not computed but predicted by the
+    :func:`~unified_planning.engines.mixins.CompilerMixin.resulting_problem_kind` method
+    of the compiler generating it; it is computed only when the compiler can't predict
+    it or when the predicted kind is not supported by the next compiler.
+    When `check_problem_kinds` is True, the predicted kinds are checked against the
+    computed ones, to debug the compilers.
     """
 
-    def __init__(self, compilers: List[engines.engine.Engine]):
+    def __init__(
+        self,
+        compilers: List[engines.engine.Engine],
+        check_problem_kinds: bool = False,
+    ):
         CompilerMixin.__init__(self)
         self._compilers = compilers
+        self._check_problem_kinds = check_problem_kinds
 
     @property
     def name(self):
         return f"CompilersPipeline[{', '.join([e.name for e in self._compilers])}]"
 
+    @property
+    def check_problem_kinds(self) -> bool:
+        """Returns `True` if the predicted kinds of the intermediate problems are checked against the computed ones."""
+        return self._check_problem_kinds
+
+    @check_problem_kinds.setter
+    def check_problem_kinds(self, new_value: bool):
+        """Sets whether the predicted kinds of the intermediate problems are checked against the computed ones."""
+        self._check_problem_kinds = new_value
+
     @staticmethod
     def supported_kind() -> "up.model.ProblemKind":
         raise UPUsageError(
@@ -71,31 +93,75 @@ class CompilersPipeline(engines.engine.Engine, CompilerMixin):
         problem: "up.model.AbstractProblem",
         compilation_kind: Optional["up.engines.CompilationKind"] = None,
     ) -> "up.engines.results.CompilerResult":
-        assert isinstance(self, engines.engine.Engine)
         if compilation_kind is not None:
             raise UPUsageError(
                 "Compilers pipeline ignores the compilation_kind parameter"
             )
+        return self._compile_with_kind(problem, None, None)
+
+    def _compile_with_kind(
+        self,
+        problem: "up.model.AbstractProblem",
+        compilation_kind: Optional["up.engines.CompilationKind"],
+        problem_kind: Optional["up.model.ProblemKind"],
+    ) -> "up.engines.results.CompilerResult":
+        assert isinstance(self, engines.engine.Engine)
+        cache = problem.environment.compilation_cache
+        if cache is not None:
+            cached_result = cache.get(self, problem, None)
+            if cached_result is not None:
+                return cached_result
         new_problem: "up.model.AbstractProblem" = problem
+        new_kind = problem_kind
         map_back_functions: List[
             Callable[[ActionInstance], Optional[ActionInstance]]
         ] = []
         for engine in self._compilers:
             assert isinstance(engine, CompilerMixin)
-            if not engine.supports(new_problem.kind):
+            if new_kind is None or not engine.supports(new_kind):
+                new_kind = new_problem.kind
+            if not engine.supports(new_kind):
                 raise UPUsageError(f"{engine.name} cannot handle this kind of problem!")
-            res = engine.compile(new_problem)
+            res = engine._compile_with_kind(new_problem, None, new_kind)
             if res.problem is None:
                 return CompilerResult(None, None, self.name)
             assert res.map_back_action_instance is not None
             map_back_functions.append(res.map_back_action_instance)
             new_problem = res.problem
+            new_kind = self._resulting_kind(engine, new_kind, new_problem)
         map_back_functions.reverse()
-        return CompilerResult(
+        result = CompilerResult(
             new_problem,
             partial(map_back_action_instance, map_back_functions=map_back_functions),
             self.name,
         )
+        if cache is not None:
+            cache.put(self, problem, None, result)
+        return result
+
+    def _resulting_kind(
+        self,
+        engine: CompilerMixin,
+        problem_kind: "up.model.ProblemKind",
+        new_problem: "up.model.AbstractProblem",
+    ) -> Optional["up.model.ProblemKind"]:
+        """
+        Returns the kind of the problem generated by the given compiler from a problem
+        with the given kind, or None if the compiler can't predict it.
+        """
+        assert isinstance(engine, engines.engine.Engine)
+        try:
+            predicted_kind = engine.resulting_problem_kind(problem_kind, engine.default)
+        except (NotImplementedError, UPUsageError):
+            return None
+        if self._check_problem_kinds:
+            actual_kind = new_problem.kind
+            if not actual_kind <= predicted_kind:
+                missing = sorted(actual_kind.features - predicted_kind.features)
+                raise UPException(
+                    f"The problem kind predicted by {engine.name} misses the features {missing} of the compiled problem."
+                )
+        return predicted_kind
 
     def _compile(
         self,
@@ -34,13 +34,15 @@ from unified_planning.model import (
 )
 from unified_planning.model.problem_kind_versioning import LATEST_PROBLEM_KIND_VERSION
 from unified_planning.engines.compilers.utils import (
+    can_chain_actions,
     get_fresh_name,
     check_and_simplify_preconditions,
     check_and_simplify_conditions,
     replace_action,
 )
 from unified_planning.utils import powerset
-from typing import List, Dict, Tuple, Optional, Iterator
+from typing import List, Dict, Tuple, Optional, Iterator, Set
+from collections import OrderedDict
 from functools import partial
 
 
@@ -58,15 +60,27 @@ class ConditionalEffectsRemover(engines.engine.Engine, CompilerMixin):
     Also the conditional :meth:`timed_effects <unified_planning.model.Problem.timed_effects>` are removed maintaining the same
     semantics.
 
+    The number of branches of an action is exponential in the number of its conditional effects; setting the
+    `polynomial` flag, the conditional :class:`InstantaneousActions <unified_planning.model.InstantaneousAction>` are instead
+    replaced with a chain of actions that first evaluates the conditions of the effects in the state where the action is applied
+    and then applies the effects whose conditions hold, one at a time; a synchronization fluent prevents the other actions
+    from being applied in the middle of a chain and is required by the goals. An action with k conditional effects
+    is replaced by 4k + 1 actions; the first one is mapped back to the original action and the others are not mapped back.
+    The chain is used only in problems without time, state invariants, trajectory constraints or a plan length metric
+    (that would count the actions of the chains) and only for the actions whose effects values do not depend on the fluents
+    assigned by their other effects, whose parameters have user types and that have no forall effects; the
+    other actions are replaced with all their branches.
+
     When it is not possible to remove a conditional Effect without changing the semantic of the resulting Problem,
     an :exc:`~unified_planning.exceptions.UPProblemDefinitionError` is raised.
 
     This `Compiler` supports only the the `CONDITIONAL_EFFECTS_REMOVING` :class:`~unified_planning.engines.CompilationKind`.
     """
 
-    def __init__(self):
+    def __init__(self, polynomial: bool = False):
         engines.engine.Engine.__init__(self)
         CompilerMixin.__init__(self, CompilationKind.CONDITIONAL_EFFECTS_REMOVING)
+        self._polynomial = polynomial
 
     @property
     def name(self):
@@ -192,12 +206,40 @@ class ConditionalEffectsRemover(engines.engine.Engine, CompilerMixin):
                     new_problem._add_effect_instance(t, e.clone())
 
         new_problem.clear_actions()
+        chained_actions: Set[str] = set()
+        if self._polynomial and can_chain_actions(problem):
+            chained_actions = {
+                a.name for a in problem.conditional_actions if self._can_chain_action(a)
+            }
+        sync: Optional["up.model.FNode"] = None
+        if chained_actions:
+            sync_fluent = up.model.Fluent(
+                get_fresh_name(new_problem, f"{self.name}_sync"),
+                env.type_manager.BoolType(),
+                environment=env,
+            )
+            new_problem.add_fluent(sync_fluent, default_initial_value=True)
+            sync = env.expression_manager.FluentExp(sync_fluent)
+            new_problem.add_goal(sync)
         for ua in problem.unconditional_actions:
             new_uncond_action = ua.clone()
+            if sync is not None:
+                assert isinstance(new_uncond_action, InstantaneousAction)
+                new_uncond_action.add_precondition(sync)
             new_problem.add_action(new_uncond_action)
             new_to_old[new_uncond_action] = ua
         for action in problem.conditional_actions:
+            if action.name in chained_actions:
+                assert isinstance(action, InstantaneousAction) and sync is not None
+                for new_action, old_action in self._create_chain_actions(
+                    action, new_problem, sync
+                ):
+                    new_to_old[new_action] = old_action
+                continue
             for new_action in self._create_unconditional_actions(action, new_problem):
+                if sync is not None:
+                    assert isinstance(new_action, InstantaneousAction)
+                    new_action.add_precondition(sync)
                 new_to_old[new_action] = action
                 new_problem.add_action(new_action)
 
@@ -216,6 +258,109 @@ class ConditionalEffectsRemover(engines.engine.Engine, CompilerMixin):
             new_problem, partial(replace_action, map=new_to_old), self.name
         )
 
+    def _can_chain_action(self, action: Action) -> bool:
+        # The effects of a chain are applied one at a time, so the values of the
+        # effects must not depend on the fluents assigned by the other effects
+        if not isinstance(action, InstantaneousAction):
+            return False
+        if not all(p.type.is_user_type() for p in action.parameters):
+            return False
+        effects = action.effects
+        if any(len(e.forall) > 0 for e in effects):
+            return False
+        fve = action.environment.free_vars_extractor
+        for i, effect in enumerate(effects):
+            assigned = {e.fluent.fluent() for j, e in enumerate(effects) if j != i}
+            read = set(fve.get(effect.value))
+            for arg in effect.fluent.args:
+                read.update(fve.get(arg))
+            if any(f.fluent() in assigned for f in read):
+                return False
+        return True
+
+    def _create_chain_actions(
+        self,
+        action: InstantaneousAction,
+        new_problem: Problem,
+        sync: "up.model.FNode",
+    ) -> List[Tuple[Action, Optional[Action]]]:
+        # Adds to the new problem the chain of actions replacing the given action and
+        # returns the added actions, paired with the action they are mapped back to.
+        # The chain starts with an action with the preconditions of the given action,
+        # then it evaluates the condition of every conditional effect, storing in a
+        # fluent if it holds, and finally it applies the effects whose condition holds;
+        # the unconditional effects are applied after the evaluation of the conditions.
+        env = new_problem.environment
+        em = env.expression_manager
+        params = OrderedDict((p.name, p.type) for p in action.parameters)
+        args = [em.ParameterExp(p) for p in action.parameters]
+        cond_effects = action.conditional_effects
+
+        def new_fluent(suffix: str) -> "up.model.FNode":
+            fluent = up.model.Fluent(
+                get_fresh_name(new_problem, f"{action.name}_{suffix}"),
+                env.type_manager.BoolType(),
+                params,
+                env,
+            )
+            new_problem.add_fluent(fluent, default_initial_value=False)
+            return em.FluentExp(fluent, args)
+
+        evaluate = [new_fluent(f"evaluate_{i}") for i in range(len(cond_effects))]
+        apply = [new_fluent(f"apply_{i}") for i in range(len(cond_effects))]
+        holds = [new_fluent(f"holds_{i}") for i in range(len(cond_effects))]
+        new_actions: List[Tuple[Action, Optional[Action]]] = []
+
+        def new_action(name: str, original_action: Optional[Action] = None):
+            a = InstantaneousAction(get_fresh_name(new_problem, name), params, env)
+            new_problem.add_action(a)
+            new_actions.append((a, original_action))
+            return a
+
+        start = new_action(action.name, action)
+        for precondition in action.preconditions:
+            start.add_precondition(precondition)
+        start.add_precondition(sync)
+        start.add_effect(sync, False)
+        start.add_effect(evaluate[0], True)
+        for i, effect in enumerate(cond_effects):
+            last = i == len(cond_effects) - 1
+            next_stage = apply[0] if last else evaluate[i + 1]
+            for value in (True, False):
+                a = new_action(f"{action.name}_evaluate_{i}_{str(value).lower()}")
+                a.add_precondition(evaluate[i])
+                a.add_precondition(
+                    effect.condition if value else em.Not(effect.condition)
+                )
+                a.add_effect(evaluate[i], False)
+                a.add_effect(next_stage, True)
+                if value:
+                    a.add_effect(holds[i], True)
+                if last:
+                    for e in action.unconditional_effects:
+                        a._add_effect_instance(e.clone())
+        for i, effect in enumerate(cond_effects):
+            last = i == len(cond_effects) - 1
+            next_stage = sync if last else apply[i + 1]
+            for value in (True, False):
+                a = new_action(f"{action.name}_apply_{i}_{str(value).lower()}")
+                a.add_precondition(apply[i])
+                a.add_precondition(holds[i] if value else em.Not(holds[i]))
+                a.add_effect(apply[i], False)
+                a.add_effect(next_stage, True)
+                if value:
+                    a.add_effect(holds[i], False)
+                    a._add_effect_instance(
+                        up.model.Effect(
+                            effect.fluent,
+                            effect.value,
+                            em.TRUE(),
+                            effect.kind,
+                            effect.forall,
+                        )
+                    )
+        return new_actions
+
     def _create_unconditional_actions(
         self, action: Action, new_problem: AbstractProblem
     ) -> Iterator[Action]:
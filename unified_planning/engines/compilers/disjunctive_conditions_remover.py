@@ -19,11 +19,13 @@ import unified_planning as up
 import unified_planning.engines as engines
 from unified_planning.engines.mixins.compiler import CompilationKind, CompilerMixin
 from unified_planning.engines.compilers.utils import (
+    can_chain_actions,
     get_fresh_name,
     replace_action,
     updated_minimize_action_costs,
 )
 from unified_planning.engines.results import CompilerResult
+from unified_planning.exceptions import UPExpressionTooLargeError
 from unified_planning.model import (
     AbstractProblem,
     FNode,
@@ -42,6 +44,7 @@ from unified_planning.model import (
 from unified_planning.model.problem_kind_versioning import LATEST_PROBLEM_KIND_VERSION
 from unified_planning.model.walkers import Dnf
 from typing import Iterator, List, Optional, Tuple, Dict, cast
+from collections import OrderedDict
 from itertools import product
 from functools import partial
 
@@ -56,12 +59,26 @@ class DisjunctiveConditionsRemover(engines.engine.Engine, CompilerMixin):
     Then, the resulting `OR` is decomposed into multiple `subActions`; every `subAction` has the same :func:`Effects <unified_planning.model.InstantaneousAction.effects>`
     of the original `Action`, and as condition an element of the decomposed `Or`. So, for every element of the `Or`, an `Action` is created.
 
+    The size of the `DNF` is exponential in the number of nested disjunctions; setting the `polynomial` flag, every `Or` in the
+    goals and in the preconditions of the :class:`InstantaneousActions <unified_planning.model.InstantaneousAction>` is instead
+    replaced by a new fluent, made true by an achiever action for each argument of the `Or`, so the size of the resulting
+    `Problem` is linear in the size of the conditions. The `DNF` is still used for the conditions where it does not create
+    more actions than the achievers. The fluents of the goals are set to `False` by every action of the problem, like the fluents
+    that replace the `DNF` of the goals; an `Action` with a disjunctive precondition is replaced by a chain of actions: the
+    first one checks the non-disjunctive preconditions and it is mapped back to the original action, then the achievers of
+    the `Ors` are applied and the last action of the chain requires the fluents of the `Ors` and has the effects of the original
+    action; a synchronization fluent prevents the other actions from being applied in the middle of a chain and is required by
+    the goals. The chains are used only in problems without time, state invariants, trajectory constraints or a plan length
+    metric (that would count the actions of the chains) and only for the actions whose parameters have user types;
+    the conditions of the other actions and of the conditional effects are always replaced by their `DNF`.
+
     For this `Compiler`, only the `DISJUNCTIVE_CONDITIONS_REMOVING` :class:`~unified_planning.engines.CompilationKind` is supported.
     """
 
-    def __init__(self):
+    def __init__(self, polynomial: bool = False):
         engines.engine.Engine.__init__(self)
         CompilerMixin.__init__(self, CompilationKind.DISJUNCTIVE_CONDITIONS_REMOVING)
+        self._polynomial = polynomial
 
     @property
     def name(self):
@@ -140,7 +157,15 @@ class DisjunctiveConditionsRemover(engines.engine.Engine, CompilerMixin):
         problem_kind: ProblemKind, compilation_kind: Optional[CompilationKind] = None
     ) -> ProblemKind:
         new_kind = problem_kind.clone()
-        new_kind.unset_conditions_kind("DISJUNCTIVE_CONDITIONS")
+        # implications and equivalences (that are not disjunctive conditions) are
+        # rewritten with negations
+        new_kind.set_conditions_kind("NEGATIVE_CONDITIONS")
+        # the disjunctions inside quantifiers are not removed
+        if (
+            not new_kind.has_existential_conditions()
+            and not new_kind.has_universal_conditions()
+        ):
+            new_kind.unset_conditions_kind("DISJUNCTIVE_CONDITIONS")
         return new_kind
 
     def _compile(
@@ -172,9 +197,41 @@ class DisjunctiveConditionsRemover(engines.engine.Engine, CompilerMixin):
         new_problem.clear_timed_effects()
         new_problem.clear_quality_metrics()
 
-        dnf = Dnf(env)
+        dnf = env.dnf_converter
+        nnf = env.nnf_converter
+        chained_actions: Dict[str, FNode] = {}
+        if self._polynomial and can_chain_actions(problem):
+            for a in problem.actions:
+                assert isinstance(a, InstantaneousAction)
+                precondition = nnf.get_nnf_expression(
+                    env.expression_manager.And(a.preconditions)
+                )
+                if (
+                    all(p.type.is_user_type() for p in a.parameters)
+                    and len(a.effects) > 0
+                    and self._use_achievers(precondition, dnf, 2)
+                ):
+                    chained_actions[a.name] = precondition
+        sync: Optional[FNode] = None
+        if chained_actions:
+            sync_fluent = up.model.Fluent(
+                get_fresh_name(new_problem, f"{self.name}_sync"),
+                env.type_manager.BoolType(),
+                environment=env,
+            )
+            new_problem.add_fluent(sync_fluent, default_initial_value=True)
+            sync = env.expression_manager.FluentExp(sync_fluent)
         for a in problem.actions:
+            if a.name in chained_actions:
+                assert isinstance(a, InstantaneousAction) and sync is not None
+                self._create_chain_actions(
+                    a, chained_actions[a.name], new_problem, sync, new_to_old, dnf
+                )
+                continue
             for na in self._create_non_disjunctive_actions(a, new_problem, dnf):
+                if sync is not None:
+                    assert isinstance(na, InstantaneousAction)
+                    na.add_precondition(sync)
                 new_to_old[na] = a
                 new_problem.add_action(na)
 
@@ -190,6 +247,8 @@ class DisjunctiveConditionsRemover(engines.engine.Engine, CompilerMixin):
             problem.goals,
         )
         new_problem.add_goal(goal_to_add)
+        if sync is not None:
+            new_problem.add_goal(sync)
 
         for i, gl in problem.timed_goals.items():
             goal_to_add = self._goals_without_disjunctions_adding_new_elements(
@@ -292,9 +351,26 @@ class DisjunctiveConditionsRemover(engines.engine.Engine, CompilerMixin):
         timing: Optional["up.model.timing.TimeInterval"] = None,
     ) -> "up.model.FNode":
         env = new_problem.environment
+        new_name = self.name if timing is None else f"{self.name}_timed"
+        if self._polynomial:
+            nnf_goal = env.nnf_converter.get_nnf_expression(
+                env.expression_manager.And(goals)
+            )
+            if self._use_achievers(nnf_goal, dnf, 0):
+                goal_fluents: List[FNode] = []
+                new_goal = self._replace_disjunctions_with_achievers(
+                    nnf_goal,
+                    new_problem,
+                    f"{new_name}_goal",
+                    OrderedDict(),
+                    None,
+                    new_to_old,
+                    goal_fluents,
+                )
+                new_fluents.extend(f.fluent() for f in goal_fluents)
+                return new_goal
         new_goal = dnf.get_dnf_expression(env.expression_manager.And(goals))
         if new_goal.is_or():
-            new_name = self.name if timing is None else f"{self.name}_timed"
             fake_fluent = up.model.Fluent(
                 get_fresh_name(new_problem, f"{new_name}_fake_goal")
             )
@@ -313,6 +389,158 @@ class DisjunctiveConditionsRemover(engines.engine.Engine, CompilerMixin):
         else:
             return new_goal
 
+    def _use_achievers(self, expression: FNode, dnf: Dnf, chain_length: int) -> bool:
+        # Returns True if replacing the Ors of the given expression (in NNF) with
+        # achievers creates fewer actions than its DNF; chain_length is the number of
+        # actions added, besides the achievers, to use them.
+        achievers = 0
+        stack, visited = [expression], set()
+        while stack:
+            e = stack.pop()
+            if e in visited or not (e.is_and() or e.is_or()):
+                continue
+            visited.add(e)
+            if e.is_or():
+                achievers += len(e.args)
+            stack.extend(e.args)
+        if achievers == 0:
+            return False
+        try:
+            dnf.get_dnf_expression(expression, max_disjuncts=achievers + chain_length)
+        except UPExpressionTooLargeError:
+            return True
+        return False
+
+    def _replace_disjunctions_with_achievers(
+        self,
+        expression: FNode,
+        new_problem: "up.model.Problem",
+        name: str,
+        parameters: "OrderedDict[str, up.model.Type]",
+        guard: Optional[FNode],
+        new_to_old: Dict[Action, Optional[Action]],
+        new_fluents: List[FNode],
+    ) -> FNode:
+        # Returns the given expression (in NNF) where every Or is replaced by a new
+        # fluent, with the given parameters, and adds to the problem the actions making
+        # that fluent true, one for every argument of the Or, with the argument and the
+        # guard as precondition. The new fluents are appended to new_fluents.
+        env = new_problem.environment
+        em = env.expression_manager
+        args = [
+            em.ParameterExp(up.model.Parameter(n, t, env))
+            for n, t in parameters.items()
+        ]
+        replaced: Dict[FNode, FNode] = {}
+
+        def replace(e: FNode) -> FNode:
+            res = replaced.get(e, None)
+            if res is not None:
+                return res
+            if e.is_and():
+                res = em.And(replace(arg) for arg in e.args)
+            elif e.is_or():
+                fluent = up.model.Fluent(
+                    get_fresh_name(new_problem, f"{name}_or"),
+                    env.type_manager.BoolType(),
+                    parameters,
+                    env,
+                )
+                new_problem.add_fluent(fluent, default_initial_value=False)
+                res = em.FluentExp(fluent, args)
+                new_fluents.append(res)
+                for arg in e.args:
+                    precondition = replace(arg).simplify()
+                    if precondition.is_false():
+                        continue
+                    achiever = InstantaneousAction(
+                        get_fresh_name(new_problem, f"{name}_achieve"), parameters, env
+                    )
+                    if guard is not None:
+                        achiever.add_precondition(guard)
+                    for leaf in (
+                        precondition.args if precondition.is_and() else [precondition]
+                    ):
+                        achiever.add_precondition(leaf)
+                    achiever.add_effect(res, True)
+                    new_problem.add_action(achiever)
+                    new_to_old[achiever] = None
+            else:
+                res = e
+            replaced[e] = res
+            return res
+
+        return replace(expression)
+
+    def _create_chain_actions(
+        self,
+        action: InstantaneousAction,
+        precondition: FNode,
+        new_problem: "up.model.Problem",
+        sync: FNode,
+        new_to_old: Dict[Action, Optional[Action]],
+        dnf: Dnf,
+    ):
+        # Adds to the new problem the chain of actions replacing the given action, whose
+        # precondition in NNF is given. The first action of the chain checks the
+        # non-disjunctive preconditions, then the achievers make true the fluents
+        # replacing the Ors and the last action has the effects of the given action and
+        # sets to False the fluents of the chain.
+        env = new_problem.environment
+        em = env.expression_manager
+        params = OrderedDict((p.name, p.type) for p in action.parameters)
+        args = [em.ParameterExp(p) for p in action.parameters]
+        conjuncts = precondition.args if precondition.is_and() else [precondition]
+        disjunctions = [c for c in conjuncts if c.is_or()]
+
+        pending_fluent = up.model.Fluent(
+            get_fresh_name(new_problem, f"{action.name}_pending"),
+            env.type_manager.BoolType(),
+            params,
+            env,
+        )
+        new_problem.add_fluent(pending_fluent, default_initial_value=False)
+        pending = em.FluentExp(pending_fluent, args)
+
+        start = InstantaneousAction(
+            get_fresh_name(new_problem, action.name), params, env
+        )
+        start.add_precondition(sync)
+        for c in conjuncts:
+            if not c.is_or():
+                start.add_precondition(c)
+        start.add_effect(sync, False)
+        start.add_effect(pending, True)
+        new_problem.add_action(start)
+        new_to_old[start] = action
+
+        chain_fluents: List[FNode] = []
+        replaced = self._replace_disjunctions_with_achievers(
+            em.And(disjunctions),
+            new_problem,
+            action.name,
+            params,
+            pending,
+            new_to_old,
+            chain_fluents,
+        )
+        end_name = get_fresh_name(new_problem, f"{action.name}_end")
+        end = self._create_new_action_with_given_precond(
+            new_problem, em.And(pending, replaced), action, dnf
+        )
+        if end is None:
+            # the conditions of all the effects are false, the chain only ends
+            end = InstantaneousAction(end_name, params, env)
+            end.add_precondition(pending)
+            end.add_precondition(replaced)
+        end.name = end_name
+        end.add_effect(pending, False)
+        end.add_effect(sync, True)
+        for f in chain_fluents:
+            end.add_effect(f, False)
+        new_problem.add_action(end)
+        new_to_old[end] = None
+
     def _create_new_durative_action_with_given_conds_at_given_times(
         self,
         new_problem: "up.model.AbstractProblem",
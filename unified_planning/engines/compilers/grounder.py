@@ -26,8 +26,20 @@ from unified_planning.model import (
     FNode,
     MinimizeActionCosts,
     Parameter,
+    Fluent,
+    Effect,
+    InstantaneousAction,
+    DurativeAction,
+)
+from unified_planning.model.fluent import get_all_fluent_exp
+from unified_planning.model.timing import TimepointKind
+from unified_planning.model.types import (
+    domain_size,
+    domain_item,
+    _UserType,
+    _IntType,
+    _RealType,
 )
-from unified_planning.model.types import domain_size, domain_item
 from unified_planning.model.walkers import Simplifier
 from unified_planning.model.problem_kind_versioning import LATEST_PROBLEM_KIND_VERSION
 from unified_planning.engines.compilers.utils import (
@@ -35,9 +47,13 @@ from unified_planning.engines.compilers.utils import (
     create_action_with_given_subs,
     split_all_ands,
 )
-from typing import Dict, List, Optional, Set, Tuple, Iterator, cast
+from unified_planning.exceptions import UPUsageError
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Iterator, cast
 from itertools import product
 from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+import io
+import pickle
 
 
 class GrounderHelper:
@@ -58,6 +74,7 @@ class GrounderHelper:
         problem: Problem,
         grounding_actions_map: Optional[Dict[Action, List[Tuple[FNode, ...]]]] = None,
         prune_actions: bool = True,
+        reachability_analysis: bool = False,
     ):
         """
         Creates an instance of the GrounderHelper.
@@ -73,11 +90,29 @@ class GrounderHelper:
             * `b (o4)`
             If this map is `None`, the `unified_planning` grounding algorithm is applied.
         :param prune_actions: If true, the grounder prunes actions exploiting the simplification of static fluents.
+        :param reachability_analysis: If true and the `grounding_actions_map` is `None`, only the groundings
+            reachable in the delete relaxation of the problem are generated and the boolean fluents that
+            are never reachable are simplified to `False` in the grounded actions.
         """
         assert isinstance(problem, Problem)
         self._problem = problem
         self._grounding_actions_map = grounding_actions_map
         self._prune_actions = prune_actions
+        self._reachability_analysis = (
+            reachability_analysis and grounding_actions_map is None
+        )
+        # Computed at construction when the reachability analysis is enabled: the reachable
+        # groundings of every action and, for every boolean fluent whose reachability
+        # is tracked, the arguments of the reachable instances
+        self._reachable_parameters: Optional[
+            Dict[Action, List[Tuple[FNode, ...]]]
+        ] = None
+        self._reachable_atoms: Optional[Dict[Fluent, Set[Tuple[FNode, ...]]]] = None
+        # Index of the static boolean fluents, built once when first needed: for every
+        # static fluent, the arguments of its instances that are True in the initial
+        # state and, for every argument position, the set of objects appearing there
+        self._static_facts: Optional[Dict[Fluent, Set[Tuple[FNode, ...]]]] = None
+        self._static_facts_positions: Dict[Fluent, List[Set[FNode]]] = {}
         if grounding_actions_map is not None:
             for action, params_list in grounding_actions_map.items():
                 for params in params_list:
@@ -100,6 +135,10 @@ class GrounderHelper:
             self._simplifier = Simplifier(env, problem)
         else:
             self._simplifier = env.simplifier
+        if self._reachability_analysis:
+            # the reachable instances of the fluents also define the simplifier
+            # used to ground the actions
+            self._get_reachable_parameters()
 
     @property
     def simplifier(self) -> Simplifier:
@@ -134,7 +173,10 @@ class GrounderHelper:
         else:
             # if the action does not have parameters, it does not need to be grounded.
             if len(action.parameters) == 0:
-                if (
+                if self._reachability_analysis:
+                    reachable = self._get_reachable_parameters().get(action, [])
+                    new_action = action.clone() if len(reachable) > 0 else None
+                elif (
                     self._grounding_actions_map is None
                     or self._grounding_actions_map.get(action, None) is not None
                 ):
@@ -146,8 +188,10 @@ class GrounderHelper:
                     zip(action.parameters, list(parameters))
                 )
                 new_action = create_action_with_given_subs(
-                    self._problem, action, self._simplifier, subs
+                    self._problem, action, self.simplifier, subs
                 )
+            if new_action is not None and self._reachability_analysis:
+                self._remove_unreachable_effects(new_action)
             self._grounded_actions[key] = new_action
             return new_action
 
@@ -180,6 +224,8 @@ class GrounderHelper:
             `Problem` 's domain.
         :return: An `Iterator` over all the possible `Tuple of expressions` that are compatible with the given `Action`.
         """
+        if self._reachability_analysis:
+            return iter(self._get_reachable_parameters().get(action, []))
         # if the action does not have parameters, it does not need to be grounded.
         if len(action.parameters) == 0:
             if (
@@ -190,74 +236,227 @@ class GrounderHelper:
             else:
                 res = iter([])
         else:
-            # contains the type of every parameter of the action
-            type_list: List[Type] = [param.type for param in action.parameters]
             if self._grounding_actions_map is None:
-                # a list containing the list of object in the self._problem of the given type.
-                # So, if the self._problem has 2 Locations l1 and l2, and 2 Robots r1 and r2, and
-                # the action move_to takes as parameters a Robot and a Location,
-                # the variable state at this point will be the following:
-                # type_list = [Robot, Location]
-                # objects_list = [[r1, r2], [l1, l2]]
-                # the product of *objects_list will be:
-                # [(r1, l1), (r1, l2), (r2, l1), (r2,l2)]
-                ground_size = 1
-                domain_sizes = []
-                for t in type_list:
-                    ds = domain_size(self._problem, t)
-                    domain_sizes.append(ds)
-                    ground_size *= ds
-                items_list: List[List[FNode]] = []
-                for size, type in zip(domain_sizes, type_list):
-                    items_list.append(
-                        [domain_item(self._problem, type, j) for j in range(size)]
-                    )
-
-                problem_static_fluents = self._problem.get_static_fluents()
-                if self._prune_actions and isinstance(
-                    action, up.model.action.InstantaneousAction
-                ):
-                    no_and_list = split_all_ands(action.preconditions)
-                    bool_conditions = []
-                    for c in no_and_list:
-                        if (
-                            c.is_fluent_exp()
-                            and c.fluent().type.is_bool_type()
-                            and c.fluent() in problem_static_fluents
-                        ):
-                            bool_conditions.append(c)
-                    items_list = self._purge_items_list(
-                        items_list=items_list,
-                        params=action.parameters,
-                        conds=bool_conditions,
-                    )
-                elif self._prune_actions and isinstance(
-                    action, up.model.action.DurativeAction
-                ):
-                    condlist = []
-                    for _, cl in action.conditions.items():
-                        condlist.extend(cl)
-
-                    no_and_list = split_all_ands(condlist)
-                    bool_conditions = []
-                    for c in no_and_list:
-                        if (
-                            c.is_fluent_exp()
-                            and c.fluent().type.is_bool_type()
-                            and c.fluent() in problem_static_fluents
-                        ):
-                            bool_conditions.append(c)
-                    items_list = self._purge_items_list(
-                        items_list=items_list,
-                        params=action.parameters,
-                        conds=bool_conditions,
+                items_list = self._get_items_list(action)
+                patterns = []
+                if self._prune_actions:
+                    patterns = [
+                        (c.fluent(), tuple(c.args))
+                        for c in self._static_conditions(action)
+                        if _is_atom_pattern(c)
+                    ]
+                if len(patterns) > 0:
+                    # join the static conditions on all their parameters together,
+                    # instead of pruning every parameter domain on its own
+                    res = iter(
+                        _sorted_groundings(
+                            items_list,
+                            _join(
+                                action.parameters,
+                                items_list,
+                                patterns,
+                                self._get_static_facts(),
+                            ),
+                        )
                     )
-                res = product(*items_list)
+                else:
+                    res = product(*items_list)
             else:
                 # The grounding_actions_map is not None, therefore it must be used to ground
                 res = iter(self._grounding_actions_map.get(action, []))
         return res
 
+    def _get_reachable_parameters(self) -> Dict[Action, List[Tuple[FNode, ...]]]:
+        """
+        Computes, with a fixpoint over the delete relaxation of the problem, the groundings
+        of every action that are reachable from the initial state.
+
+        The relaxation tracks the boolean fluents instances that can become `True`; starting
+        from the ones `True` in the initial state, the positive boolean preconditions of every
+        action are joined on their parameters against the reachable instances, and the boolean
+        effects of every new grounding make new instances reachable, until no new instance
+        is found. All the other conditions are ignored, so the result is an over-approximation
+        of the groundings that can be applied in a plan.
+
+        :return: The map from every action of the problem to its reachable groundings, in the
+            same order in which they are generated without the reachability analysis.
+        """
+        if self._reachable_parameters is not None:
+            return self._reachable_parameters
+        problem = self._problem
+        # Boolean fluents whose instances are all considered reachable, because
+        # they are True by default or are assigned in ways the analysis does not track
+        free_fluents: Set[Fluent] = set()
+        for fluent, default in problem.fluents_defaults.items():
+            if fluent.type.is_bool_type() and default.is_true():
+                free_fluents.add(fluent)
+
+        actions_info = []
+        for action in problem.actions:
+            conditions, effects = _relaxed_conditions_and_effects(action)
+            adds: List[Tuple[Fluent, Tuple[FNode, ...]]] = []
+            for effect in effects:
+                fluent = effect.fluent.fluent()
+                if not fluent.type.is_bool_type():
+                    continue
+                if effect.value.is_bool_constant() and effect.value.is_false():
+                    continue
+                if effect.is_forall() or not _is_atom_pattern(effect.fluent):
+                    free_fluents.add(fluent)
+                else:
+                    adds.append((fluent, tuple(effect.fluent.args)))
+            patterns = [
+                (c.fluent(), tuple(c.args))
+                for c in split_all_ands(conditions)
+                if c.is_fluent_exp()
+                and c.fluent().type.is_bool_type()
+                and _is_atom_pattern(c)
+            ]
+            actions_info.append((action, patterns, adds))
+
+        reached: Dict[Fluent, Set[Tuple[FNode, ...]]] = {}
+        for effects_list in problem.timed_effects.values():
+            for effect in effects_list:
+                fluent = effect.fluent.fluent()
+                if not fluent.type.is_bool_type() or (
+                    effect.value.is_bool_constant() and effect.value.is_false()
+                ):
+                    continue
+                if effect.is_forall() or not all(
+                    a.is_constant() for a in effect.fluent.args
+                ):
+                    free_fluents.add(fluent)
+                else:
+                    reached.setdefault(fluent, set()).add(tuple(effect.fluent.args))
+        for fluent_exp, value in problem.explicit_initial_values.items():
+            if fluent_exp.type.is_bool_type() and value.is_true():
+                reached.setdefault(fluent_exp.fluent(), set()).add(
+                    tuple(fluent_exp.args)
+                )
+        for fluent in problem.fluents:
+            if fluent.type.is_bool_type() and fluent not in free_fluents:
+                reached.setdefault(fluent, set())
+        for fluent in free_fluents:
+            reached.pop(fluent, None)
+
+        groundings: Dict[Action, Dict[Tuple[FNode, ...], None]] = {}
+        domains: Dict[Action, List[List[FNode]]] = {}
+        for action, patterns, _ in actions_info:
+            groundings[action] = {}
+            domains[action] = self._get_items_list(action)
+        # The fluents that got new reachable instances in the last iteration; an action
+        # is joined again only if one of its preconditions refers to one of them
+        updated: Optional[Set[Fluent]] = None
+        while updated is None or len(updated) > 0:
+            new_updated: Set[Fluent] = set()
+            for action, patterns, adds in actions_info:
+                tracked_patterns = [(f, a) for f, a in patterns if f in reached]
+                if updated is not None and not any(
+                    f in updated for f, _ in tracked_patterns
+                ):
+                    continue
+                action_groundings = groundings[action]
+                for params in _join(
+                    action.parameters, domains[action], tracked_patterns, reached
+                ):
+                    if params in action_groundings:
+                        continue
+                    action_groundings[params] = None
+                    subs = dict(zip(action.parameters, params))
+                    for fluent, args in adds:
+                        if fluent not in reached:
+                            continue
+                        ground_args = tuple(
+                            subs[a.parameter()] if a.is_parameter_exp() else a
+                            for a in args
+                        )
+                        fluent_reached = reached[fluent]
+                        if ground_args not in fluent_reached:
+                            fluent_reached.add(ground_args)
+                            new_updated.add(fluent)
+            updated = new_updated
+
+        self._reachable_parameters = {
+            action: _sorted_groundings(domain, groundings[action])
+            for action, domain in domains.items()
+        }
+        self._reachable_atoms = reached
+        if self._prune_actions:
+            self._simplifier = _ReachabilitySimplifier(
+                problem.environment, problem, reached
+            )
+        return self._reachable_parameters
+
+    def _remove_unreachable_effects(self, action: Action):
+        """
+        Removes from the given grounded action the effects that assign `False` to a
+        boolean fluent instance that is never reachable, because they do not modify the state.
+        """
+        reached = self._reachable_atoms
+        assert reached is not None
+
+        def is_useless(effect: Effect) -> bool:
+            fluent_exp = effect.fluent
+            return (
+                fluent_exp.fluent() in reached
+                and effect.value.is_bool_constant()
+                and effect.value.is_false()
+                and all(a.is_constant() for a in fluent_exp.args)
+                and tuple(fluent_exp.args) not in reached[fluent_exp.fluent()]
+            )
+
+        if isinstance(action, InstantaneousAction):
+            effects = action.effects
+            if any(is_useless(e) for e in effects):
+                action.clear_effects()
+                for e in effects:
+                    if not is_useless(e):
+                        action._add_effect_instance(e)
+        elif isinstance(action, DurativeAction):
+            timed_effects = action.effects
+            if any(is_useless(e) for el in timed_effects.values() for e in el):
+                action.clear_effects()
+                for t, el in timed_effects.items():
+                    for e in el:
+                        if not is_useless(e):
+                            action._add_effect_instance(t, e)
+
+    def _get_items_list(self, action: Action) -> List[List[FNode]]:
+        """
+        Returns, for every parameter of the given action, the list of objects that can
+        be used to ground it, pruned exploiting the static boolean fluents if the
+        `prune_actions` flag is set.
+        """
+        # contains the type of every parameter of the action
+        type_list: List[Type] = [param.type for param in action.parameters]
+        # a list containing the list of object in the self._problem of the given type.
+        # So, if the self._problem has 2 Locations l1 and l2, and 2 Robots r1 and r2, and
+        # the action move_to takes as parameters a Robot and a Location,
+        # the variable state at this point will be the following:
+        # type_list = [Robot, Location]
+        # objects_list = [[r1, r2], [l1, l2]]
+        # the product of *objects_list will be:
+        # [(r1, l1), (r1, l2), (r2, l1), (r2,l2)]
+        ground_size = 1
+        domain_sizes = []
+        for t in type_list:
+            ds = domain_size(self._problem, t)
+            domain_sizes.append(ds)
+            ground_size *= ds
+        items_list: List[List[FNode]] = []
+        for size, type in zip(domain_sizes, type_list):
+            items_list.append(
+                [domain_item(self._problem, type, j) for j in range(size)]
+            )
+
+        if self._prune_actions:
+            items_list = self._purge_items_list(
+                items_list=items_list,
+                params=action.parameters,
+                conds=self._static_conditions(action),
+            )
+        return items_list
+
     def _purge_items_list(
         self, items_list: List[List[FNode]], params: List[Parameter], conds: List[FNode]
     ) -> List[List[FNode]]:
@@ -271,41 +470,243 @@ class GrounderHelper:
         :return: the items_list input pruned off of the objects that would generate always invalid actions.
         """
         return_list = []
+        em = self._problem.environment.expression_manager
         for param, object_list in zip(params, items_list):
-            temp_list = list(object_list)
-            for cond in conds:
-                static_fluent = cond
-                sig_pos = -1
-                for i, fp in enumerate(static_fluent.args):
-                    if fp == self._problem.environment.expression_manager.ParameterExp(
-                        param
-                    ):
-                        sig_pos = i
+            param_exp = em.ParameterExp(param)
+            for static_fluent in conds:
+                for sig_pos, fp in enumerate(static_fluent.args):
+                    if fp == param_exp:
+                        valid_obj = self._bool_static_fluent_valid_parameters(
+                            static_fluent, sig_pos
+                        )
+                        object_list = [o for o in object_list if o in valid_obj]
                         break
-                if sig_pos != -1:
-                    valid_obj = self._bool_static_fluent_valid_parameters(
-                        static_fluent, sig_pos
-                    )
-                    for obj in object_list:
-                        if obj not in valid_obj:
-                            temp_list.remove(obj)
-            return_list.append(temp_list)
+            return_list.append(object_list)
         return return_list
 
+    def _static_conditions(self, action: Action) -> List[FNode]:
+        """
+        Returns the conditions of the given action that are static boolean fluents,
+        so they must be `True` in the initial state for the action to be applicable.
+        """
+        if isinstance(action, InstantaneousAction):
+            conditions = action.preconditions
+        elif isinstance(action, DurativeAction):
+            conditions = []
+            for cl in action.conditions.values():
+                conditions.extend(cl)
+        else:
+            return []
+        static_fluents = self._problem.get_static_fluents()
+        return [
+            c
+            for c in split_all_ands(conditions)
+            if c.is_fluent_exp()
+            and c.fluent().type.is_bool_type()
+            and c.fluent() in static_fluents
+        ]
+
+    def _get_static_facts(self) -> Dict[Fluent, Set[Tuple[FNode, ...]]]:
+        """
+        Returns the index of the static boolean fluents of the problem, mapping every
+        static fluent to the arguments of its instances that are `True` in the initial state.
+
+        The index is computed once, with a single scan of the explicit initial values; only the
+        static fluents without a `False` default are enumerated on all their instances.
+        """
+        if self._static_facts is not None:
+            return self._static_facts
+        problem = self._problem
+        static_facts: Dict[Fluent, Set[Tuple[FNode, ...]]] = {}
+        explicit_fluents: List[Fluent] = []
+        for fluent in problem.get_static_fluents():
+            if not fluent.type.is_bool_type():
+                continue
+            static_facts[fluent] = set()
+            default_value = problem.fluents_defaults.get(fluent, None)
+            if default_value is not None and default_value.is_false():
+                explicit_fluents.append(fluent)
+            else:
+                for fluent_exp in get_all_fluent_exp(problem, fluent):
+                    value = problem.initial_value(fluent_exp)
+                    if value is not None and value.is_true():
+                        static_facts[fluent].add(tuple(fluent_exp.args))
+        if explicit_fluents:
+            for fluent_exp, value in problem.explicit_initial_values.items():
+                facts = static_facts.get(fluent_exp.fluent(), None)
+                if facts is not None and value.is_true():
+                    facts.add(tuple(fluent_exp.args))
+        self._static_facts = static_facts
+        self._static_facts_positions = {
+            fluent: [{args[i] for args in facts} for i in range(fluent.arity)]
+            for fluent, facts in static_facts.items()
+        }
+        return static_facts
+
     def _bool_static_fluent_valid_parameters(self, sf: FNode, sp: int) -> Set[FNode]:
         assert sf.fluent() in self._problem.get_static_fluents()
-        ret_val = set()
-        default_value = self._problem.fluents_defaults.get(sf.fluent(), None)
-        if default_value is not None and default_value.is_false():
-            # if default is false, check only explicit instead of all values
-            for key, value in self._problem.explicit_initial_values.items():
-                if key.fluent() == sf.fluent() and value.is_true():
-                    ret_val.add(key.args[sp])
-        else:
-            for key, value in self._problem.initial_values.items():
-                if key.fluent() == sf.fluent() and value.is_true():
-                    ret_val.add(key.args[sp])
-        return ret_val
+        self._get_static_facts()
+        return self._static_facts_positions[sf.fluent()][sp]
+
+
+class _ReachabilitySimplifier(Simplifier):
+    """
+    Simplifier that, other than substituting the static fluents with their value,
+    substitutes with `False` the boolean fluent instances that are never reachable.
+    """
+
+    def __init__(
+        self,
+        environment: "up.environment.Environment",
+        problem: Problem,
+        reachable_atoms: Dict[Fluent, Set[Tuple[FNode, ...]]],
+    ):
+        Simplifier.__init__(self, environment, problem)
+        self._reachable_atoms = reachable_atoms
+
+    def walk_fluent_exp(self, expression: FNode, args: List[FNode]) -> FNode:
+        new_exp = Simplifier.walk_fluent_exp(self, expression, args)
+        if new_exp.is_fluent_exp():
+            reachable = self._reachable_atoms.get(new_exp.fluent(), None)
+            if (
+                reachable is not None
+                and all(a.is_constant() for a in new_exp.args)
+                and tuple(new_exp.args) not in reachable
+            ):
+                return self.manager.FALSE()
+        return new_exp
+
+
+def _is_atom_pattern(fluent_exp: FNode) -> bool:
+    """Returns True if every argument of the given fluent expression is a parameter or a constant."""
+    return all(a.is_parameter_exp() or a.is_constant() for a in fluent_exp.args)
+
+
+def _relaxed_conditions_and_effects(
+    action: Action,
+) -> Tuple[List[FNode], List[Effect]]:
+    """
+    Returns the conditions that must hold before any effect of the given action is applied
+    and all the effects of the action, as used by the reachability analysis.
+
+    For a `DurativeAction` only the conditions required at the start of the action are
+    returned; for the other kinds of actions no condition is returned.
+    The fluents modified by the simulated effects are returned as effects with an
+    unknown (non-constant) value.
+    """
+    conditions: List[FNode] = []
+    effects: List[Effect] = []
+    em = action.environment.expression_manager
+    if isinstance(action, InstantaneousAction):
+        conditions.extend(action.preconditions)
+        effects.extend(action.effects)
+        simulated_effects = [action.simulated_effect]
+    elif isinstance(action, DurativeAction):
+        for interval, cl in action.conditions.items():
+            lower = interval.lower
+            if (
+                lower.timepoint.kind == TimepointKind.START
+                and lower.delay == 0
+                and not interval.is_left_open()
+            ):
+                conditions.extend(cl)
+        for el in action.effects.values():
+            effects.extend(el)
+        simulated_effects = list(action.simulated_effects.values())
+    else:
+        effects.extend(getattr(action, "effects", []))
+        simulated_effects = []
+    for se in simulated_effects:
+        if se is not None:
+            for f in se.fluents:
+                # The value of a simulated effect is unknown, so the fluent is
+                # assigned to itself, that is not a constant
+                effects.append(Effect(f, f, em.TRUE()))
+    return conditions, effects
+
+
+def _join(
+    parameters: List[Parameter],
+    domains: List[List[FNode]],
+    patterns: List[Tuple[Fluent, Tuple[FNode, ...]]],
+    reached: Dict[Fluent, Set[Tuple[FNode, ...]]],
+) -> Iterator[Tuple[FNode, ...]]:
+    """
+    Returns the groundings of the given parameters such that every pattern, grounded with
+    them, is in the reached instances of its fluent.
+
+    The patterns are joined one after the other: every pattern is indexed on the arguments
+    already bound by the previous patterns (and on its constant arguments) and extends the
+    partial assignments with the parameters it binds. The parameters not appearing in any
+    pattern are enumerated over their whole domain.
+    """
+    domain_sets = [set(d) for d in domains]
+    param_position = {p: i for i, p in enumerate(parameters)}
+    # The parameters positions, in the order in which they are bound
+    bound: List[int] = []
+    partial: List[Tuple[FNode, ...]] = [tuple()]
+    for fluent, args in patterns:
+        bound_index = {p: i for i, p in enumerate(bound)}
+        # For every argument, how it's used: ("const", value), ("bound", index in the
+        # partial assignment), ("new", parameter position) or ("same", argument position)
+        key_getters: List[Tuple[int, Optional[int], Optional[FNode]]] = []
+        new_params: List[Tuple[int, int]] = []
+        same_as: List[Tuple[int, int]] = []
+        first_occurrence: Dict[int, int] = {}
+        for arg_pos, arg in enumerate(args):
+            if arg.is_parameter_exp():
+                param_pos = param_position[arg.parameter()]
+                if param_pos in bound_index:
+                    key_getters.append((arg_pos, bound_index[param_pos], None))
+                elif param_pos in first_occurrence:
+                    same_as.append((arg_pos, first_occurrence[param_pos]))
+                else:
+                    first_occurrence[param_pos] = arg_pos
+                    new_params.append((arg_pos, param_pos))
+            else:
+                key_getters.append((arg_pos, None, arg))
+        index: Dict[Tuple[FNode, ...], List[Tuple[FNode, ...]]] = {}
+        for atom_args in reached[fluent]:
+            if any(atom_args[i] != atom_args[j] for i, j in same_as):
+                continue
+            if any(atom_args[a] not in domain_sets[p] for a, p in new_params):
+                continue
+            if any(c is not None and atom_args[a] != c for a, _, c in key_getters):
+                continue
+            key = tuple(atom_args[a] for a, b, _ in key_getters if b is not None)
+            index.setdefault(key, []).append(tuple(atom_args[a] for a, _ in new_params))
+        new_partial: List[Tuple[FNode, ...]] = []
+        for assignment in partial:
+            key = tuple(assignment[b] for _, b, _ in key_getters if b is not None)
+            for extension in index.get(key, []):
+                new_partial.append(assignment + extension)
+        partial = new_partial
+        bound.extend(p for _, p in new_params)
+        if not partial:
+            return
+    free = [i for i in range(len(parameters)) if i not in set(bound)]
+    order = bound + free
+    for assignment in partial:
+        for free_values in product(*(domains[i] for i in free)):
+            values = assignment + free_values
+            res: List[Optional[FNode]] = [None] * len(parameters)
+            for pos, value in zip(order, values):
+                res[pos] = value
+            yield cast(Tuple[FNode, ...], tuple(res))
+
+
+def _sorted_groundings(
+    domains: List[List[FNode]], groundings: Iterable[Tuple[FNode, ...]]
+) -> List[Tuple[FNode, ...]]:
+    """
+    Returns the given groundings sorted as they are generated by the product of the
+    given parameters domains, so the grounding order does not depend on how they are computed.
+    """
+    positions = [{o: i for i, o in enumerate(objs)} for objs in domains]
+    return sorted(
+        groundings,
+        key=lambda params: tuple(p[o] for p, o in zip(positions, params)),
+    )
 
 
 class Grounder(engines.engine.Engine, CompilerMixin):
@@ -321,7 +722,13 @@ class Grounder(engines.engine.Engine, CompilerMixin):
     it will be used for grounding instead of the implemented algorithm; the use of this parameter is mainly created to easily support
     the integration of external grounders inside the library. To see a practical example, checkout the :class:`~unified_planning.engines.compilers.TarskiGrounder` `_compile`
     implementation.
-    The Grounder class can also optionally take a flag prune_actions to enable/disable the pruning of actions exploiting the simplification of static fluents.
+    The Grounder class can also optionally take a flag prune_actions to enable/disable the pruning of actions exploiting the simplification of static fluents
+    and a flag reachability_analysis to generate only the groundings that are reachable in the delete relaxation of the `Problem`, instead of
+    all the combinations of the `Parameters` values; the boolean fluents that are never reachable are also simplified to `False` in the grounded `Actions`.
+
+    Setting max_workers to a value greater than 1, the groundings of every `Action` are split in shards that are grounded
+    and simplified by a pool of max_workers processes; the resulting `Problem` is the same created by the sequential grounding.
+    Problems with simulated effects are always grounded sequentially, because their functions can not be sent between processes.
 
     This `Compiler` supports only the the `GROUNDING` :class:`~unified_planning.engines.CompilationKind`.
     """
@@ -330,11 +737,17 @@ class Grounder(engines.engine.Engine, CompilerMixin):
         self,
         grounding_actions_map: Optional[Dict[Action, List[Tuple[FNode, ...]]]] = None,
         prune_actions: bool = True,
+        reachability_analysis: bool = False,
+        max_workers: int = 1,
     ):
         engines.engine.Engine.__init__(self)
         CompilerMixin.__init__(self, CompilationKind.GROUNDING)
         self._grounding_actions_map = grounding_actions_map
         self._prune_actions = prune_actions
+        self._reachability_analysis = reachability_analysis
+        if max_workers < 1:
+            raise UPUsageError("The max_workers of the Grounder must be at least 1")
+        self._max_workers = max_workers
 
     @property
     def name(self):
@@ -412,7 +825,14 @@ class Grounder(engines.engine.Engine, CompilerMixin):
     def resulting_problem_kind(
         problem_kind: ProblemKind, compilation_kind: Optional[CompilationKind] = None
     ) -> ProblemKind:
-        return problem_kind.clone()
+        new_kind = problem_kind.clone()
+        # the grounded numeric expressions and costs can become simpler
+        if new_kind.has_general_numeric_planning():
+            new_kind.set_problem_type("SIMPLE_NUMERIC_PLANNING")
+        if new_kind.has_static_fluents_in_actions_cost():
+            new_kind.set_actions_cost_kind("INT_NUMBERS_IN_ACTIONS_COST")
+            new_kind.set_actions_cost_kind("REAL_NUMBERS_IN_ACTIONS_COST")
+        return new_kind
 
     def _compile(
         self,
@@ -432,18 +852,27 @@ class Grounder(engines.engine.Engine, CompilerMixin):
             problem, Problem
         ), "The given problem is not a class supported by the Grounder"
         grounder_helper = GrounderHelper(
-            problem, self._grounding_actions_map, self._prune_actions
+            problem,
+            self._grounding_actions_map,
+            self._prune_actions,
+            self._reachability_analysis,
         )
         trace_back_map: Dict[Action, Tuple[Action, List[FNode]]] = {}
 
         new_problem = problem.clone()
         new_problem.name = f"{self.name}_{problem.name}"
         new_problem.clear_actions()
+        if self._max_workers > 1 and not problem.kind.has_simulated_effects():
+            grounded_actions = _parallel_grounded_actions(
+                grounder_helper, self._max_workers
+            )
+        else:
+            grounded_actions = grounder_helper.get_grounded_actions()
         for (
             old_action,
             parameters,
             new_action,
-        ) in grounder_helper.get_grounded_actions():
+        ) in grounded_actions:
             if new_action is not None:
                 new_problem.add_action(new_action)
                 trace_back_map[new_action] = (old_action, list(parameters))
@@ -492,3 +921,151 @@ def ground_minimize_action_costs_metric(
         if old_cost is not None:
             new_costs[new_action] = simplifier.simplify(old_cost.substitute(subs))
     return MinimizeActionCosts(new_costs)
+
+
+# The number of shards in which the groundings of an action are split for every worker,
+# so that the shards of different sizes are balanced between the workers
+SHARDS_PER_WORKER = 4
+
+# The GrounderHelper used by the grounding processes, set by _init_grounding_worker
+_worker_helper: Optional[GrounderHelper] = None
+_worker_parameters: Dict[int, List[Tuple[FNode, ...]]] = {}
+
+
+class _GroundedActionsPickler(pickle.Pickler):
+    """
+    Pickler used by the grounding processes to send the grounded actions back.
+
+    The `Environment`, the `Fluents`, the `Objects`, the `Types` and the expressions are
+    saved by reference, so they are resolved in the `Problem` of the main process instead
+    of being copied with the environment of the grounding process.
+    """
+
+    def persistent_id(self, obj):
+        if isinstance(obj, up.environment.Environment):
+            return ("environment",)
+        elif isinstance(obj, FNode):
+            return ("fnode", obj.node_type, obj.args, obj._content.payload)
+        elif isinstance(obj, Fluent):
+            return ("fluent", obj.name)
+        elif isinstance(obj, up.model.Object):
+            return ("object", obj.name)
+        elif isinstance(obj, Type):
+            if obj.is_bool_type():
+                return ("bool_type",)
+            elif obj.is_user_type():
+                assert isinstance(obj, _UserType)
+                return ("user_type", obj.name)
+            elif obj.is_int_type():
+                assert isinstance(obj, _IntType)
+                return ("int_type", obj.lower_bound, obj.upper_bound)
+            elif obj.is_real_type():
+                assert isinstance(obj, _RealType)
+                return ("real_type", obj.lower_bound, obj.upper_bound)
+        return None
+
+
+class _GroundedActionsUnpickler(pickle.Unpickler):
+    """Unpickler resolving the references saved by the `_GroundedActionsPickler` in the given problem."""
+
+    def __init__(self, file, problem: Problem):
+        pickle.Unpickler.__init__(self, file)
+        self._problem = problem
+
+    def persistent_load(self, pid):
+        env = self._problem.environment
+        kind = pid[0]
+        if kind == "environment":
+            return env
+        elif kind == "fnode":
+            _, node_type, args, payload = pid
+            return env.expression_manager.create_node(node_type, tuple(args), payload)
+        elif kind == "fluent":
+            return self._problem.fluent(pid[1])
+        elif kind == "object":
+            return self._problem.object(pid[1])
+        elif kind == "bool_type":
+            return env.type_manager.BoolType()
+        elif kind == "user_type":
+            return self._problem.user_type(pid[1])
+        elif kind == "int_type":
+            return env.type_manager.IntType(pid[1], pid[2])
+        elif kind == "real_type":
+            return env.type_manager.RealType(pid[1], pid[2])
+        raise pickle.UnpicklingError(f"Unknown persistent id {pid}")
+
+
+def _init_grounding_worker(helper: GrounderHelper):
+    global _worker_helper
+    _worker_helper = helper
+    _worker_parameters.clear()
+
+
+def _ground_shard(action_index: int, start: int, stop: int) -> bytes:
+    """
+    Grounds the action at the given index of the problem of the worker with the parameters
+    from `start` to `stop` in its possible parameters.
+
+    :return: The pickled list of the indexes of the parameters creating a valid action,
+        together with the grounded action.
+    """
+    helper = _worker_helper
+    assert helper is not None
+    action = helper._problem.actions[action_index]
+    parameters_list = _worker_parameters.get(action_index, None)
+    if parameters_list is None:
+        parameters_list = list(helper.get_possible_parameters(action))
+        _worker_parameters[action_index] = parameters_list
+    res = []
+    for i in range(start, stop):
+        new_action = helper.ground_action(action, parameters_list[i])
+        if new_action is not None:
+            res.append((i, new_action))
+    stream = io.BytesIO()
+    _GroundedActionsPickler(stream, pickle.HIGHEST_PROTOCOL).dump(res)
+    return stream.getvalue()
+
+
+def _parallel_grounded_actions(
+    helper: GrounderHelper, max_workers: int
+) -> Iterator[Tuple[Action, Tuple[FNode, ...], Optional[Action]]]:
+    """
+    Returns the same grounded actions of the `get_grounded_actions` method of the given
+    helper, in the same order, grounding them with a pool of `max_workers` processes.
+    """
+    problem = helper._problem
+    parameters_lists = [
+        list(helper.get_possible_parameters(action)) for action in problem.actions
+    ]
+    total = sum(len(pl) for pl in parameters_lists)
+    shard_size = max(1, -(-total // (max_workers * SHARDS_PER_WORKER)))
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_grounding_worker,
+        initargs=(helper,),
+    ) as executor:
+        futures = []
+        for action_index, parameters_list in enumerate(parameters_lists):
+            for start in range(0, len(parameters_list), shard_size):
+                stop = min(start + shard_size, len(parameters_list))
+                futures.append(
+                    (
+                        action_index,
+                        start,
+                        stop,
+                        executor.submit(_ground_shard, action_index, start, stop),
+                    )
+                )
+        seen: Set[Tuple[Action, Tuple[FNode, ...]]] = set()
+        for action_index, start, stop, future in futures:
+            action = problem.actions[action_index]
+            parameters_list = parameters_lists[action_index]
+            grounded = dict(
+                _GroundedActionsUnpickler(io.BytesIO(future.result()), problem).load()
+            )
+            for i in range(start, stop):
+                parameters = parameters_list[i]
+                if (action, parameters) in seen:
+                    continue
+                seen.add((action, parameters))
+                yield (action, parameters, grounded.get(i, None))
@@ -72,7 +72,15 @@ class MADisjunctiveConditionsRemover(DisjunctiveConditionsRemover):
         problem_kind: ProblemKind, compilation_kind: Optional[CompilationKind] = None
     ) -> ProblemKind:
         new_kind = problem_kind.clone()
-        new_kind.unset_conditions_kind("DISJUNCTIVE_CONDITIONS")
+        # implications and equivalences (that are not disjunctive conditions) are
+        # rewritten with negations
+        new_kind.set_conditions_kind("NEGATIVE_CONDITIONS")
+        # the disjunctions inside quantifiers are not removed
+        if (
+            not new_kind.has_existential_conditions()
+            and not new_kind.has_universal_conditions()
+        ):
+            new_kind.unset_conditions_kind("DISJUNCTIVE_CONDITIONS")
         return new_kind
 
     def _compile(
@@ -101,7 +109,7 @@ class MADisjunctiveConditionsRemover(DisjunctiveConditionsRemover):
         new_problem.name = f"{self.name}_{problem.name}"
         new_problem.clear_goals()
 
-        dnf = Dnf(env)
+        dnf = env.dnf_converter
         meaningful_actions: List["up.model.Action"] = []
         for ag in problem.agents:
             new_problem.agent(ag.name).clear_actions()
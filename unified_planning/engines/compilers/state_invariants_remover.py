@@ -120,7 +120,9 @@ class StateInvariantsRemover(engines.engine.Engine, CompilerMixin):
     ) -> ProblemKind:
         new_kind = problem_kind.clone()
         if new_kind.has_state_invariants():
-            new_kind.unset_constraints("STATE_INVARIANTS")
+            new_kind.unset_constraints_kind("STATE_INVARIANTS")
+            if new_kind.has_timed_effects():
+                new_kind.set_time("TIMED_GOALS")
         return new_kind
 
     def _compile(
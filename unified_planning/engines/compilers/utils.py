@@ -162,7 +162,8 @@ def create_action_with_given_subs(
     c_subs = cast(Dict[Parameter, FNode], subs)
     if isinstance(old_action, InstantaneousAction):
         new_action = InstantaneousAction(
-            get_fresh_name(problem, old_action.name, naming_list)
+            get_fresh_name(problem, old_action.name, naming_list),
+            _env=problem.environment,
         )
         for p in old_action.preconditions:
             new_action.add_precondition(p.substitute(subs))
@@ -200,7 +201,8 @@ def create_action_with_given_subs(
         return new_action
     elif isinstance(old_action, DurativeAction):
         new_durative_action = DurativeAction(
-            get_fresh_name(problem, old_action.name, naming_list)
+            get_fresh_name(problem, old_action.name, naming_list),
+            _env=problem.environment,
         )
         old_duration = old_action.duration
         new_duration = DurationInterval(
@@ -388,7 +390,7 @@ def add_invariant_condition_apply_function_to_problem_expressions(
                         timing, _apply_function_to_effect(effect, function)
                     )
                 interval = TimePointInterval(timing)
-                if interval not in new_action.conditions:
+                if interval not in new_action.conditions and not condition.is_true():
                     new_action.add_condition(interval, condition)
         else:
             raise NotImplementedError
@@ -408,7 +410,7 @@ def add_invariant_condition_apply_function_to_problem_expressions(
                 timing, _apply_function_to_effect(effect, function)
             )
         interval = TimePointInterval(timing)
-        if interval not in new_problem.timed_goals:
+        if interval not in new_problem.timed_goals and not condition.is_true():
             new_problem.add_timed_goal(interval, condition)
 
     new_goal = em.And(*map(function, original_problem.goals), condition).simplify()
@@ -520,6 +522,28 @@ def updated_minimize_action_costs(
     return MinimizeActionCosts(new_costs, environment=environment)
 
 
+def can_chain_actions(problem: Problem) -> bool:
+    """
+    Returns `True` if an action of the given `Problem` can be replaced by a chain of
+    instantaneous actions applied one after the other: the problem must have only
+    instantaneous actions and the intermediate states of the chains or the number of
+    actions of the plan must not matter.
+
+    :param problem: The `Problem` whose actions are replaced.
+    :return: `True` if the actions of the problem can be replaced by chains of actions.
+    """
+    return (
+        all(isinstance(a, InstantaneousAction) for a in problem.actions)
+        and len(problem.timed_effects) == 0
+        and len(problem.timed_goals) == 0
+        and len(problem.trajectory_constraints) == 0
+        and len(problem.state_invariants) == 0
+        and not any(
+            qm.is_minimize_sequential_plan_length() for qm in problem.quality_metrics
+        )
+    )
+
+
 def split_all_ands(exp_list: List[FNode]) -> List[FNode]:
     """
     Helper function. Takes in input a List of FNodes and returns a list of FNodes that do not contain any AND operator as the first operator.
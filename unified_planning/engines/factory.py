@@ -71,6 +71,10 @@ DEFAULT_ENGINES = {
         "unified_planning.engines.sequential_simulator",
         "UPSequentialSimulator",
     ),
+    "up_best_first_search": (
+        "unified_planning.engines.best_first_search",
+        "BestFirstSearchPlanner",
+    ),
     "up_bounded_types_remover": (
         "unified_planning.engines.compilers.bounded_types_remover",
         "BoundedTypesRemover",
@@ -916,7 +920,7 @@ class Factory:
         problem: "up.model.AbstractProblem",
         *,
         name: Optional[str] = None,
-        params: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
     ) -> "up.engines.engine.Engine":
         """
         Returns a sequential simulator. There are two ways to call this method:
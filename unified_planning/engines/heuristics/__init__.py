@@ -0,0 +1,20 @@
+# Copyright 2021-2023 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from unified_planning.engines.heuristics.relaxed_task import RelaxedTask
+from unified_planning.engines.heuristics.heuristic import Heuristic
+from unified_planning.engines.heuristics.delete_relaxation import HAdd, HMax, HFF
+from unified_planning.engines.heuristics.landmarks import LandmarkCount
@@ -0,0 +1,172 @@
+# Copyright 2021-2023 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+import heapq
+from fractions import Fraction
+from typing import List, Optional, Set, Tuple, Union
+from unified_planning.engines.heuristics.heuristic import Heuristic
+from unified_planning.model import State
+
+
+INFINITY = float("inf")
+
+
+class _CostPropagationHeuristic(Heuristic):
+    """
+    Base class of the heuristics computing the cost of the atoms in the delete relaxation
+    with a generalized Dijkstra propagation; the cost of an operator is the combination
+    (sum or max) of the costs of its preconditions plus its cost.
+    """
+
+    _use_sum = True
+
+    def _propagate(
+        self, state: State
+    ) -> Optional[Tuple[List[Union[float, Fraction]], List[int]]]:
+        """
+        Computes the cost of every atom from the given state.
+
+        :param state: The state from which the atoms costs are computed.
+        :return: The list of the atoms costs and the list of the operator achieving every
+            atom with the minimum cost (`-1` for the atoms `True` in the state); `None` if
+            the goals are not reachable.
+        """
+        task = self._task
+        goals = task._goals
+        if goals is None:
+            return None
+        num_atoms = len(task._atoms)
+        costs: List[Union[float, Fraction]] = [INFINITY] * num_atoms
+        supporters = [-1] * num_atoms
+        unsatisfied = [len(pre) for pre in task._operators_pre]
+        accumulated: List[Union[float, Fraction]] = [0] * len(unsatisfied)
+        operators_add = task._operators_add
+        operators_cost = task._operators_cost
+        precondition_of = task._precondition_of
+        use_sum = self._use_sum
+
+        queue: List[Tuple[Union[float, Fraction], int]] = []
+        for atom_id in task.true_atoms(state):
+            costs[atom_id] = 0
+            queue.append((0, atom_id))
+        for op_id, missing in enumerate(unsatisfied):
+            if missing == 0:
+                value: Union[float, Fraction] = operators_cost[op_id]
+                for atom_id in operators_add[op_id]:
+                    if value < costs[atom_id]:
+                        costs[atom_id] = value
+                        supporters[atom_id] = op_id
+                        queue.append((value, atom_id))
+        heapq.heapify(queue)
+
+        goals_set = set(goals)
+        remaining_goals = len(goals_set)
+        while queue and remaining_goals > 0:
+            cost, atom_id = heapq.heappop(queue)
+            if cost > costs[atom_id]:
+                continue
+            if atom_id in goals_set:
+                goals_set.discard(atom_id)
+                remaining_goals -= 1
+            for op_id in precondition_of[atom_id]:
+                if use_sum:
+                    accumulated[op_id] += cost
+                elif cost > accumulated[op_id]:
+                    accumulated[op_id] = cost
+                unsatisfied[op_id] -= 1
+                if unsatisfied[op_id] == 0:
+                    value = accumulated[op_id] + operators_cost[op_id]
+                    for added in operators_add[op_id]:
+                        if value < costs[added]:
+                            costs[added] = value
+                            supporters[added] = op_id
+                            heapq.heappush(queue, (value, added))
+        if remaining_goals > 0:
+            return None
+        return costs, supporters
+
+
+class HAdd(_CostPropagationHeuristic):
+    """
+    The additive heuristic `h_add`: the sum of the costs of the goals in the delete relaxation,
+    where the cost of an operator is the sum of the costs of its preconditions plus its cost.
+    """
+
+    _use_sum = True
+
+    def evaluate(self, state: State) -> Optional[float]:
+        res = self._propagate(state)
+        if res is None:
+            return None
+        costs, _ = res
+        assert self._task._goals is not None
+        return float(sum(costs[g] for g in set(self._task._goals)))
+
+
+class HMax(_CostPropagationHeuristic):
+    """
+    The max heuristic `h_max`: the maximum of the costs of the goals in the delete relaxation,
+    where the cost of an operator is the maximum of the costs of its preconditions plus its cost.
+
+    This heuristic is admissible.
+    """
+
+    _use_sum = False
+
+    def evaluate(self, state: State) -> Optional[float]:
+        res = self._propagate(state)
+        if res is None:
+            return None
+        costs, _ = res
+        assert self._task._goals is not None
+        return float(max((costs[g] for g in self._task._goals), default=0))
+
+
+class HFF(_CostPropagationHeuristic):
+    """
+    The `h_FF` heuristic: the cost of a relaxed plan extracted backwards from the goals,
+    choosing for every atom the operator achieving it with the minimum `h_add` cost.
+
+    The cost of every grounded action is counted once, even if more of its operators
+    (for example the ones of its conditional effects) are part of the relaxed plan.
+    """
+
+    _use_sum = True
+
+    def evaluate(self, state: State) -> Optional[float]:
+        res = self._propagate(state)
+        if res is None:
+            return None
+        _, supporters = res
+        task = self._task
+        assert task._goals is not None
+        operators_action = task._operators_action
+        operators_pre = task._operators_pre
+        relaxed_plan: Set[int] = set()
+        marked: Set[int] = set()
+        stack = list(task._goals)
+        while stack:
+            atom_id = stack.pop()
+            if atom_id in marked:
+                continue
+            marked.add(atom_id)
+            op_id = supporters[atom_id]
+            if op_id < 0:
+                continue
+            relaxed_plan.add(operators_action[op_id])
+            stack.extend(operators_pre[op_id])
+        actions_costs = task._actions_costs
+        return float(sum(actions_costs[a] for a in relaxed_plan))
@@ -0,0 +1,62 @@
+# Copyright 2021-2023 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from abc import ABC, abstractmethod
+from typing import Optional, Union
+from unified_planning.engines.heuristics.relaxed_task import RelaxedTask
+from unified_planning.model import Problem, State
+
+
+class Heuristic(ABC):
+    """
+    Base class of the heuristics defined over the :class:`~unified_planning.engines.heuristics.RelaxedTask`
+    of a :class:`~unified_planning.model.Problem`.
+
+    A `Heuristic` is a callable taking a :class:`~unified_planning.model.State` and returning its
+    heuristic value, or `None` if the state is a dead-end, so it can be given as the `heuristic`
+    of the :func:`~unified_planning.engines.mixins.OneshotPlannerMixin.solve` method.
+    """
+
+    def __init__(self, problem: Union[Problem, RelaxedTask]):
+        """
+        Creates the heuristic.
+
+        :param problem: The `Problem` for which the heuristic is computed or its `RelaxedTask`;
+            giving the `RelaxedTask` allows different heuristics to share it.
+        """
+        if isinstance(problem, RelaxedTask):
+            self._task = problem
+        else:
+            self._task = RelaxedTask(problem)
+
+    @property
+    def relaxed_task(self) -> RelaxedTask:
+        """Returns the `RelaxedTask` used by this heuristic."""
+        return self._task
+
+    def __call__(self, state: State) -> Optional[float]:
+        return self.evaluate(state)
+
+    @abstractmethod
+    def evaluate(self, state: State) -> Optional[float]:
+        """
+        Computes the heuristic value of the given state.
+
+        :param state: The state to evaluate.
+        :return: The heuristic value of the given state or `None` if the goals
+            are not reachable from it.
+        """
+        raise NotImplementedError
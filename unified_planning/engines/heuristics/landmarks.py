@@ -0,0 +1,95 @@
+# Copyright 2021-2023 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from typing import List, Optional
+from unified_planning.engines.heuristics.heuristic import Heuristic
+from unified_planning.model import State
+
+
+class LandmarkCount(Heuristic):
+    """
+    The landmark-count heuristic: the number of fact landmarks, computed from the evaluated
+    state, that are not `True` in the state.
+
+    The landmarks are computed with the label propagation of Zhu and Givan over the delete
+    relaxation: every atom is labelled with the set of atoms that are needed to reach it, and
+    the landmarks of the state are the union of the labels of the goals. The labels are
+    represented as integer bitsets over the atoms of the
+    :class:`~unified_planning.engines.heuristics.RelaxedTask`, so the propagation only uses
+    bitwise operations.
+
+    Since the landmarks are computed from every evaluated state, the heuristic does not
+    depend on the path used to reach the state.
+    """
+
+    def landmarks(self, state: State) -> Optional[int]:
+        """
+        Computes the fact landmarks of the given state.
+
+        :param state: The state from which the landmarks are computed.
+        :return: The bitset of the atoms that are landmarks of the given state or `None`
+            if the goals are not reachable from it.
+        """
+        task = self._task
+        goals = task._goals
+        if goals is None:
+            return None
+        labels: List[Optional[int]] = [None] * len(task._atoms)
+        for atom_id in task.true_atoms(state):
+            labels[atom_id] = 1 << atom_id
+        operators_pre = task._operators_pre
+        operators_add = task._operators_add
+        changed = True
+        while changed:
+            changed = False
+            for op_id, pre in enumerate(operators_pre):
+                op_label = 0
+                reachable = True
+                for atom_id in pre:
+                    label = labels[atom_id]
+                    if label is None:
+                        reachable = False
+                        break
+                    op_label |= label
+                if not reachable:
+                    continue
+                for atom_id in operators_add[op_id]:
+                    new_label = op_label | (1 << atom_id)
+                    label = labels[atom_id]
+                    if label is None:
+                        labels[atom_id] = new_label
+                        changed = True
+                    else:
+                        new_label &= label
+                        if new_label != label:
+                            labels[atom_id] = new_label
+                            changed = True
+        res = 0
+        for atom_id in goals:
+            label = labels[atom_id]
+            if label is None:
+                return None
+            res |= label
+        return res
+
+    def evaluate(self, state: State) -> Optional[float]:
+        landmarks = self.landmarks(state)
+        if landmarks is None:
+            return None
+        state_bits = 0
+        for atom_id in self._task.true_atoms(state):
+            state_bits |= 1 << atom_id
+        return float(bin(landmarks & ~state_bits).count("1"))
@@ -0,0 +1,277 @@
+# Copyright 2021-2023 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+
+from fractions import Fraction
+from typing import Dict, List, Optional, Set, Tuple, Union
+import unified_planning as up
+from unified_planning.engines.compilers.grounder import GrounderHelper
+from unified_planning.engines.compilers.utils import split_all_ands
+from unified_planning.model import (
+    Action,
+    FNode,
+    InstantaneousAction,
+    MinimizeActionCosts,
+    Problem,
+    State,
+    UPCompiledState,
+)
+from unified_planning.model.state import StateLayout
+from unified_planning.model.walkers import ExpressionQuantifiersRemover
+
+
+class RelaxedTask:
+    """
+    Delete relaxation of a grounded :class:`~unified_planning.model.Problem`, computed once and
+    shared by the heuristics of this package.
+
+    Every grounded boolean fluent is indexed as an `atom` and every grounded action is translated
+    into one or more relaxed operators, one for the unconditional effects and one for every
+    conditional effect; every operator is represented by the lists of atom indexes of its
+    preconditions and of its add effects, so the heuristics can propagate the reachability
+    information on flat lists without walking any expression.
+
+    The relaxation is an over-approximation of the original problem:
+
+    * negative, numeric and disjunctive conditions are ignored;
+    * delete effects are ignored;
+    * boolean assignments of non-constant values and simulated effects are considered as
+      effects that might add the assigned atoms.
+
+    The cost of an operator is the cost of the action given by the
+    :class:`~unified_planning.model.metrics.MinimizeActionCosts` quality metric, if the problem
+    has one and the cost of the grounded action is constant, otherwise ``1`` if the problem has
+    no such metric and ``0`` if the cost depends on the state.
+    """
+
+    def __init__(self, problem: Problem):
+        """
+        Creates the relaxed task of the given problem, grounding all its actions.
+
+        :param problem: The `Problem` to relax; it must be an action-based problem.
+        """
+        assert isinstance(problem, Problem)
+        self._problem = problem
+        self._atoms: List[FNode] = []
+        self._atoms_ids: Dict[FNode, int] = {}
+        atoms_by_fluent: Dict["up.model.Fluent", List[int]] = {}
+        for fluent_exp in problem.initial_values:
+            if fluent_exp.type.is_bool_type():
+                atom_id = len(self._atoms)
+                self._atoms_ids[fluent_exp] = atom_id
+                self._atoms.append(fluent_exp)
+                atoms_by_fluent.setdefault(fluent_exp.fluent(), []).append(atom_id)
+
+        cost_metric: Optional[MinimizeActionCosts] = None
+        for qm in problem.quality_metrics:
+            if isinstance(qm, MinimizeActionCosts):
+                cost_metric = qm
+        qrm = ExpressionQuantifiersRemover(problem.environment)
+        grounder = GrounderHelper(problem)
+        simplifier = grounder.simplifier
+
+        # The grounded actions, as (original action, parameters)
+        self._actions: List[Tuple[Action, Tuple[FNode, ...]]] = []
+        self._actions_costs: List[Union[int, Fraction]] = []
+        # For every relaxed operator: the index of the grounded action, the
+        # precondition atoms and the add atoms
+        self._operators_action: List[int] = []
+        self._operators_pre: List[List[int]] = []
+        self._operators_add: List[List[int]] = []
+        for action, params, grounded_action in grounder.get_grounded_actions():
+            if grounded_action is None:
+                continue
+            if not isinstance(grounded_action, InstantaneousAction):
+                continue
+            action_id = len(self._actions)
+            self._actions.append((action, params))
+            cost: Union[int, Fraction] = 1
+            if cost_metric is not None:
+                cost_exp = cost_metric.get_action_cost(action)
+                cost = 0
+                if cost_exp is not None:
+                    cost_exp = simplifier.simplify(
+                        cost_exp.substitute(dict(zip(action.parameters, params)))
+                    )
+                    if cost_exp.is_constant():
+                        cost = cost_exp.constant_value()
+            self._actions_costs.append(cost)
+
+            pre = self._atoms_in_conjunction(
+                [
+                    simplifier.simplify(qrm.remove_quantifiers(p, problem))
+                    for p in grounded_action.preconditions
+                ]
+            )
+            if pre is None:
+                continue
+            unconditional_adds: Set[int] = set()
+            conditional_adds: Dict[Tuple[int, ...], Set[int]] = {}
+            for effect in grounded_action.effects:
+                for e in effect.expand_effect(problem):
+                    if not e.fluent.type.is_bool_type():
+                        continue
+                    value = simplifier.simplify(e.value)
+                    if value.is_bool_constant() and value.is_false():
+                        continue
+                    adds = self._atoms_in_fluent(e.fluent, atoms_by_fluent, simplifier)
+                    if e.is_conditional():
+                        condition = simplifier.simplify(
+                            qrm.remove_quantifiers(e.condition, problem)
+                        )
+                        cond = self._atoms_in_conjunction([condition])
+                        if cond is None:
+                            continue
+                        key = tuple(sorted(set(cond) - set(pre)))
+                        conditional_adds.setdefault(key, set()).update(adds)
+                    else:
+                        unconditional_adds.update(adds)
+            simulated_effect = grounded_action.simulated_effect
+            if simulated_effect is not None:
+                for f in simulated_effect.fluents:
+                    if f.type.is_bool_type():
+                        unconditional_adds.update(
+                            self._atoms_in_fluent(f, atoms_by_fluent, simplifier)
+                        )
+            if unconditional_adds:
+                self._add_operator(action_id, pre, unconditional_adds)
+            for cond_key, cond_adds in conditional_adds.items():
+                self._add_operator(action_id, pre + list(cond_key), cond_adds)
+
+        goals = self._atoms_in_conjunction(
+            [
+                simplifier.simplify(qrm.remove_quantifiers(g, problem))
+                for g in problem.goals
+            ]
+        )
+        # None means that the goals are a contradiction
+        self._goals: Optional[List[int]] = goals
+
+        # For every atom, the operators having it as a precondition
+        self._precondition_of: List[List[int]] = [[] for _ in self._atoms]
+        for op_id, op_pre in enumerate(self._operators_pre):
+            for atom_id in op_pre:
+                self._precondition_of[atom_id].append(op_id)
+        self._operators_cost: List[Union[int, Fraction]] = [
+            self._actions_costs[a] for a in self._operators_action
+        ]
+
+        # Cache of the last layout seen, mapping its boolean slots to the atoms
+        self._layout: Optional[StateLayout] = None
+        self._slot_to_atom: List[int] = []
+
+    def _add_operator(self, action_id: int, pre: List[int], adds: Set[int]):
+        self._operators_action.append(action_id)
+        self._operators_pre.append(pre)
+        self._operators_add.append(sorted(adds))
+
+    def _atoms_in_conjunction(self, expressions: List[FNode]) -> Optional[List[int]]:
+        """
+        Returns the atoms that must be `True` for the conjunction of the given expressions
+        to hold, ignoring the conjuncts that are not atoms; returns `None` if one of the
+        conjuncts is the constant `False`.
+        """
+        res: List[int] = []
+        seen: Set[int] = set()
+        for c in split_all_ands(expressions):
+            if c.is_bool_constant():
+                if c.is_false():
+                    return None
+            elif c.is_fluent_exp():
+                atom_id = self._atoms_ids.get(c, None)
+                if atom_id is not None and atom_id not in seen:
+                    seen.add(atom_id)
+                    res.append(atom_id)
+        return res
+
+    def _atoms_in_fluent(
+        self,
+        fluent_exp: FNode,
+        atoms_by_fluent: Dict["up.model.Fluent", List[int]],
+        simplifier: "up.model.walkers.Simplifier",
+    ) -> List[int]:
+        """
+        Returns the atoms that might be assigned by an effect on the given fluent
+        expression; all the atoms of the fluent if the arguments are not constant.
+        """
+        atom_id = self._atoms_ids.get(fluent_exp, None)
+        if atom_id is not None:
+            return [atom_id]
+        fluent_exp = simplifier.simplify(fluent_exp)
+        atom_id = self._atoms_ids.get(fluent_exp, None)
+        if atom_id is not None:
+            return [atom_id]
+        if all(a.is_constant() for a in fluent_exp.args):
+            return []
+        return atoms_by_fluent.get(fluent_exp.fluent(), [])
+
+    @property
+    def problem(self) -> Problem:
+        """Returns the `Problem` relaxed by this task."""
+        return self._problem
+
+    @property
+    def atoms(self) -> List[FNode]:
+        """Returns the grounded boolean fluents indexed by this task."""
+        return self._atoms
+
+    @property
+    def actions(self) -> List[Tuple[Action, Tuple[FNode, ...]]]:
+        """Returns the grounded actions, as `(action, parameters)`, of this task."""
+        return self._actions
+
+    @property
+    def goals(self) -> Optional[List[int]]:
+        """
+        Returns the atoms required by the goals of the problem; `None` if the goals
+        are a contradiction.
+        """
+        return self._goals
+
+    def true_atoms(self, state: State) -> List[int]:
+        """
+        Returns the indexes of the atoms that are `True` in the given state.
+
+        When the given state is a :class:`~unified_planning.model.UPCompiledState`, the atoms
+        are read directly from its bitset, otherwise every atom is queried with `get_value`.
+
+        :param state: The state to read.
+        :return: The sorted list of the atoms `True` in the given state.
+        """
+        if isinstance(state, UPCompiledState):
+            layout = state.layout
+            if layout is not self._layout:
+                self._slot_to_atom = [-1] * len(
+                    [f for f in layout.fluents if f.type.is_bool_type()]
+                )
+                for atom_id, atom in enumerate(self._atoms):
+                    kind, idx = layout.slot(atom)
+                    assert kind == StateLayout.BOOL
+                    self._slot_to_atom[idx] = atom_id
+                self._layout = layout
+            slot_to_atom = self._slot_to_atom
+            res = []
+            bits = state.bool_bits
+            while bits:
+                low = bits & -bits
+                atom_id = slot_to_atom[low.bit_length() - 1]
+                if atom_id >= 0:
+                    res.append(atom_id)
+                bits ^= low
+            res.sort()
+            return res
+        return [
+            i for i, atom in enumerate(self._atoms) if state.get_value(atom).is_true()
+        ]
@@ -49,6 +49,7 @@ class AnytimePlannerMixin(ABC):
         problem: "up.model.AbstractProblem",
         timeout: Optional[float] = None,
         output_stream: Optional[IO[str]] = None,
+        validate_plans: bool = False,
     ) -> Iterator["up.engines.results.PlanGenerationResult"]:
         """
         This method takes a `AbstractProblem` and returns an iterator of `PlanGenerationResult`,
@@ -58,6 +59,10 @@ class AnytimePlannerMixin(ABC):
         :param timeout: is the time in seconds that the planner has at max to solve the problem, defaults to `None`.
         :param output_stream: is a stream of strings where the planner writes his
             output (and also errors) while it is solving the problem; defaults to `None`.
+        :param validate_plans: if `True`, every plan is validated as soon as it is
+            found and the outcome is added to the `log_messages` of its result; the
+            sequential plans are validated incrementally, simulating only the actions
+            after the prefix shared with the previous plans. Defaults to `False`.
         :return: an iterator of `PlanGenerationResult` created by the planner.
 
         The only required parameter is `problem` but the planner should warn the user if `timeout` or
@@ -73,8 +78,18 @@ class AnytimePlannerMixin(ABC):
         if not problem_kind.has_quality_metrics() and self.optimality_metric_required:
             msg = f"The problem has no quality metrics but the engine is required to satisfies some optimality guarantee!"
             raise up.exceptions.UPUsageError(msg)
-        for res in self._get_solutions(problem, timeout, output_stream):
-            yield res
+        validator: Optional["up.engines.engine.Engine"] = None
+        try:
+            for res in self._get_solutions(problem, timeout, output_stream):
+                if validate_plans and res.plan is not None:
+                    if validator is None:
+                        validator = _get_validator(problem, res.plan.kind)
+                    assert isinstance(validator, up.engines.mixins.PlanValidatorMixin)
+                    _add_validation_log(res, validator.validate(problem, res.plan))
+                yield res
+        finally:
+            if validator is not None:
+                validator.destroy()
 
     @abstractmethod
     def _get_solutions(
@@ -88,3 +103,37 @@ class AnytimePlannerMixin(ABC):
         by the engines that implement this operation mode.
         """
         raise NotImplementedError
+
+
+def _get_validator(
+    problem: "up.model.AbstractProblem", plan_kind: "up.plans.PlanKind"
+) -> "up.engines.engine.Engine":
+    if plan_kind == up.plans.PlanKind.SEQUENTIAL_PLAN and isinstance(
+        problem, up.model.Problem
+    ):
+        return up.engines.plan_validator.SequentialPlanValidator(
+            environment=problem.environment, incremental=True
+        )
+    return problem.environment.factory.PlanValidator(
+        problem_kind=problem.kind, plan_kind=plan_kind
+    )
+
+
+def _add_validation_log(
+    result: "up.engines.results.PlanGenerationResult",
+    validation_result: "up.engines.results.ValidationResult",
+):
+    LogLevel = up.engines.results.LogLevel
+    if validation_result.status == up.engines.results.ValidationResultStatus.VALID:
+        log = up.engines.results.LogMessage(
+            LogLevel.INFO, f"The plan is valid for {validation_result.engine_name}."
+        )
+    else:
+        msg = f"The plan is not valid for {validation_result.engine_name}"
+        if validation_result.log_messages:
+            msg += ": " + " ".join(m.message for m in validation_result.log_messages)
+        log = up.engines.results.LogMessage(LogLevel.ERROR, msg)
+    if result.log_messages is None:
+        result.log_messages = [log]
+    else:
+        result.log_messages.append(log)
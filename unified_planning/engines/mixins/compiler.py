@@ -63,6 +63,10 @@ class CompilerMixin(ABC):
         For more information about the `CompilerResult` returned, read the class documentation
         above.
 
+        If the :func:`compilation_cache <unified_planning.environment.Environment.compilation_cache>`
+        of the problem `Environment` is set, the result is taken from the cache when it is
+        stored there and stored there otherwise.
+
         :param problem: The instance of the `AbstractProblem` on which the compilation is applied.
         :param compilation_kind: The `CompilationKind` that must be applied on the given problem.
         :return: The resulting `CompilerResult`.
@@ -73,24 +77,53 @@ class CompilerMixin(ABC):
             if the :func:`problem_kind <unified_planning.model.Problem.kind>` is not supported by the
             :func:`~unified_planning.engines.Engine.supports` method.
         """
+        return self._compile_with_kind(problem, compilation_kind, None)
+
+    def _compile_with_kind(
+        self,
+        problem: "up.model.AbstractProblem",
+        compilation_kind: Optional[CompilationKind],
+        problem_kind: Optional[ProblemKind],
+    ) -> "up.engines.results.CompilerResult":
+        """
+        Implements the :func:`~unified_planning.engines.mixins.CompilerMixin.compile` method.
+
+        The given `problem_kind`, if not None, must contain all the features of the given
+        problem; when it is supported by this compiler it is used in place of the
+        :func:`problem kind <unified_planning.model.Problem.kind>`, that is computed
+        otherwise.
+        """
         assert isinstance(self, up.engines.engine.Engine)
         if compilation_kind is None:
             compilation_kind = self._default
         if compilation_kind is None:
             raise up.exceptions.UPUsageError(f"Compilation kind needs to be specified!")
-        if not self.skip_checks and not self.supports(problem.kind):
-            msg = f"We cannot establish whether {self.name} can handle this problem!"
-            if self.error_on_failed_checks:
-                raise up.exceptions.UPUsageError(msg)
-            else:
-                warn(msg)
+        if not self.skip_checks:
+            if problem_kind is None or not self.supports(problem_kind):
+                problem_kind = problem.kind
+            if not self.supports(problem_kind):
+                msg = (
+                    f"We cannot establish whether {self.name} can handle this problem!"
+                )
+                if self.error_on_failed_checks:
+                    raise up.exceptions.UPUsageError(msg)
+                else:
+                    warn(msg)
         if not self.supports_compilation(compilation_kind):
             msg = f"{self.name} cannot handle this kind of compilation!"
             if self.error_on_failed_checks:
                 raise up.exceptions.UPUsageError(msg)
             else:
                 warn(msg)
-        return self._compile(problem, compilation_kind)
+        cache = problem.environment.compilation_cache
+        if cache is not None:
+            cached_result = cache.get(self, problem, compilation_kind)
+            if cached_result is not None:
+                return cached_result
+        result = self._compile(problem, compilation_kind)
+        if cache is not None:
+            cache.put(self, problem, compilation_kind, result)
+        return result
 
     @property
     def default(self) -> Optional[CompilationKind]:
@@ -14,6 +14,8 @@
 #
 
 from abc import ABC, abstractmethod
+from multiprocessing import Pool
+from typing import Any, List, Optional, Sequence, Tuple
 from warnings import warn
 import unified_planning as up
 
@@ -46,6 +48,51 @@ class PlanValidatorMixin(ABC):
         :return: the `ValidationResult` returned by the `PlanValidator`; a data structure containing the
             :class:`ValidationResultStatus <unified_planning.engines.ValidationResultStatus>` and some additional information about it.
         """
+        self._check_problem(problem)
+        self._check_plan(plan)
+        return self._validate(problem, plan)
+
+    def validate_many(
+        self,
+        problem: "up.model.AbstractProblem",
+        plans: Sequence["up.plans.Plan"],
+        processes: Optional[int] = None,
+    ) -> List["up.engines.results.ValidationResult"]:
+        """
+        This method takes an `AbstractProblem` and a sequence of `Plans` and returns the
+        `ValidationResult` of every `Plan`, in the same order.
+
+        The `PlanValidators` can share the work done on the `problem` between the `plans`,
+        so this method is usually faster than calling :func:`validate` for every `plan`.
+
+        :param problem: The `AbstractProblem` on which the given `plans` are validated.
+        :param plans: The `Plans` that are validated on the given `problem`.
+        :param processes: The number of processes the `plans` are split among; by default
+            the `plans` are validated in the current process. The `ValidationResults`
+            computed by other processes do not contain the `trace`, because its states
+            would belong to a copy of the `problem` environment.
+        :return: the list of the `ValidationResults` returned by the `PlanValidator`, one
+            for every given `plan`.
+        """
+        self._check_problem(problem)
+        for plan in plans:
+            self._check_plan(plan)
+        if processes is None or processes <= 1 or len(plans) <= 1:
+            return self._validate_many(problem, plans)
+        # contiguous chunks, so the plans sharing a prefix are likely in the same chunk
+        chunk_size = -(-len(plans) // processes)
+        chunks = [plans[i : i + chunk_size] for i in range(0, len(plans), chunk_size)]
+        with Pool(len(chunks)) as pool:
+            summaries = pool.starmap(
+                _validate_chunk, [(self, problem, chunk) for chunk in chunks]
+            )
+        results = []
+        for chunk, chunk_summaries in zip(chunks, summaries):
+            for plan, summary in zip(chunk, chunk_summaries):
+                results.append(_result_from_summary(problem, plan, summary))
+        return results
+
+    def _check_problem(self, problem: "up.model.AbstractProblem"):
         assert isinstance(self, up.engines.engine.Engine)
         if not self.skip_checks and not self.supports(problem.kind):
             msg = f"We cannot establish whether {self.name} can validate this problem!"
@@ -53,13 +100,15 @@ class PlanValidatorMixin(ABC):
                 raise up.exceptions.UPUsageError(msg)
             else:
                 warn(msg)
+
+    def _check_plan(self, plan: "up.plans.Plan"):
+        assert isinstance(self, up.engines.engine.Engine)
         if not self.skip_checks and not self.supports_plan(plan.kind):
             msg = f"{self.name} cannot validate this kind of plan!"
             if self.error_on_failed_checks:
                 raise up.exceptions.UPUsageError(msg)
             else:
                 warn(msg)
-        return self._validate(problem, plan)
 
     @abstractmethod
     def _validate(
@@ -67,3 +116,87 @@ class PlanValidatorMixin(ABC):
     ) -> "up.engines.results.ValidationResult":
         """Method called by the PlanValidator.validate method."""
         raise NotImplementedError
+
+    def _validate_many(
+        self, problem: "up.model.AbstractProblem", plans: Sequence["up.plans.Plan"]
+    ) -> List["up.engines.results.ValidationResult"]:
+        """
+        Method called by the PlanValidator.validate_many method; by default every plan
+        is validated independently, the PlanValidators can override it to share the
+        work between the plans.
+        """
+        return [self._validate(problem, plan) for plan in plans]
+
+
+def _plan_action_instances(plan: "up.plans.Plan") -> List["up.plans.ActionInstance"]:
+    if isinstance(plan, up.plans.SequentialPlan):
+        return plan.actions
+    elif isinstance(plan, up.plans.TimeTriggeredPlan):
+        return [ai for _, ai, _ in plan.timed_actions]
+    return []
+
+
+def _validate_chunk(
+    validator: PlanValidatorMixin,
+    problem: "up.model.AbstractProblem",
+    plans: Sequence["up.plans.Plan"],
+) -> List[Tuple[Any, ...]]:
+    # The results are summarized with the indexes of their metrics and inapplicable
+    # actions, so the main process can map them to its own problem and plans
+    summaries = []
+    for plan, result in zip(plans, validator._validate_many(problem, plans)):
+        metric_evaluations = None
+        if result.metric_evaluations is not None:
+            metric_evaluations = [
+                (problem.quality_metrics.index(m), v)  # type: ignore[attr-defined]
+                for m, v in result.metric_evaluations.items()
+            ]
+        action_index = None
+        if result.inapplicable_action is not None:
+            for i, ai in enumerate(_plan_action_instances(plan)):
+                if ai is result.inapplicable_action:
+                    action_index = i
+                    break
+        summaries.append(
+            (
+                result.status,
+                result.engine_name,
+                result.log_messages,
+                metric_evaluations,
+                result.reason,
+                action_index,
+                result.metrics,
+            )
+        )
+    return summaries
+
+
+def _result_from_summary(
+    problem: "up.model.AbstractProblem",
+    plan: "up.plans.Plan",
+    summary: Tuple[Any, ...],
+) -> "up.engines.results.ValidationResult":
+    (
+        status,
+        engine_name,
+        logs,
+        metric_evaluations,
+        reason,
+        action_index,
+        metrics,
+    ) = summary
+    if metric_evaluations is not None:
+        quality_metrics = problem.quality_metrics  # type: ignore[attr-defined]
+        metric_evaluations = {quality_metrics[i]: v for i, v in metric_evaluations}
+    inapplicable_action = None
+    if action_index is not None:
+        inapplicable_action = _plan_action_instances(plan)[action_index]
+    return up.engines.results.ValidationResult(
+        status,
+        engine_name,
+        logs,
+        metric_evaluations,
+        reason,
+        inapplicable_action,
+        metrics,
+    )
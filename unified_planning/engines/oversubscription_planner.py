@@ -146,9 +146,17 @@ class OversubscriptionPlanner(MetaEngine, mixins.OneshotPlannerMixin):
             q.append((weight, sg))
         q.sort(reverse=True, key=lambda t: t[0])
         incomplete = False
+        # the same clone is used for all the goals subsets, only its goals are replaced
+        new_problem = problem.clone()
+        new_problem.clear_quality_metrics()
         for t in q:
-            new_problem = problem.clone()
-            new_problem.clear_quality_metrics()
+            new_problem.clear_goals()
+            new_problem.clear_timed_goals()
+            for g in problem.goals:
+                new_problem.add_goal(g)
+            for i, gl in problem.timed_goals.items():
+                for g in gl:
+                    new_problem.add_timed_goal(i, g)
             for g, _ in goals:
                 if isinstance(g, tuple):
                     goal = g[1] if g[1] in t[1] else em.Not(g[1])
@@ -14,12 +14,13 @@
 #
 
 
+import pickle
 import warnings
 import unified_planning as up
 import unified_planning.engines as engines
 from unified_planning.plans import Plan
 from unified_planning.model import ProblemKind
-from unified_planning.exceptions import UPUsageError
+from unified_planning.exceptions import UPException, UPUsageError
 from unified_planning.engines.results import (
     LogLevel,
     PlanGenerationResultStatus,
@@ -27,8 +28,20 @@ from unified_planning.engines.results import (
     ValidationResult,
     PlanGenerationResult,
 )
-from typing import IO, Dict, List, Optional, Tuple, Callable, cast
-from multiprocessing import Process, Queue
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+    Callable,
+    Union,
+    cast,
+)
+from multiprocessing import Pipe, Process, Queue, get_start_method
+from multiprocessing.connection import Connection, wait
 
 
 class Parallel(
@@ -41,6 +54,14 @@ class Parallel(
 
     The `Engines` run the same command in parallel and the first definitive :class:`Result <unified_planning.engines.Result>` returned
     by the `Engine` is returned to the user.
+
+    The results are streamed to the ``result_callback``, if set, as soon as they are returned
+    by an `Engine`; if the ``accept_result`` predicate is set, the first result it accepts is
+    returned as if it was definitive and the `Engines` still running are terminated.
+
+    By default every call starts a new process for every `Engine`; after :func:`start_workers`
+    the calls are run by long-lived worker processes that keep their `Engine` instance, until
+    :func:`shutdown` is called or the `Parallel` is destroyed.
     """
 
     def __init__(
@@ -55,6 +76,9 @@ class Parallel(
         self.error_on_failed_checks = False
         self.engines = engines
         self._factory = factory
+        self.result_callback: Optional[Callable[[Result], None]] = None
+        self.accept_result: Optional[Callable[[Result], bool]] = None
+        self._workers: Optional[List["_Worker"]] = None
 
     @property
     def name(self) -> str:
@@ -74,8 +98,101 @@ class Parallel(
         # The supported plan depends on its actual engines
         return True
 
+    def start_workers(self):
+        """
+        Starts a long-lived worker process for every `Engine`; the following calls are
+        run by these workers, that create their `Engine` instance only once.
+
+        The problems are sent to the workers in the protobuf format, if the `protobuf`
+        package is installed and the problem can be represented in it, or pickled otherwise.
+        The workers still running when a definitive or accepted result is found are
+        restarted.
+        """
+        if self._workers is None:
+            self._workers = [
+                _Worker(self._factory, engine_name, options)
+                for engine_name, options in self.engines
+            ]
+
+    def shutdown(self):
+        """Stops the worker processes started by :func:`start_workers`."""
+        if self._workers is not None:
+            for worker in self._workers:
+                worker.stop()
+            self._workers = None
+
+    def destroy(self):
+        self.shutdown()
+
     def _run_parallel(self, fname, *args) -> List[Result]:
+        if self._workers is None:
+            results_stream = self._run_processes(fname, *args)
+        else:
+            results_stream = self._run_workers(fname, *args)
+        results: List[Result] = []
+        try:
+            for res in results_stream:
+                if self.result_callback is not None:
+                    self.result_callback(res)
+                # If the planner is sure about the result (optimality of the result or impossibility of the problem or the problem does not need optimality)
+                # or the result is good enough for the user, return it
+                if res.is_definitive_result(*args) or (
+                    self.accept_result is not None and self.accept_result(res)
+                ):
+                    return [res]
+                results.append(res)
+        finally:
+            # stops the engines still running
+            results_stream.close()
+        return results
+
+    def _run_workers(self, fname, *args) -> Generator[Result, None, None]:
+        assert self._workers is not None
+        encoding, payload = _encode_arguments(fname, args)
+        pending: Dict[Connection, _Worker] = {}
+        for worker in self._workers:
+            worker.connection.send(
+                (
+                    fname,
+                    self.skip_checks,
+                    self.error_on_failed_checks,
+                    encoding,
+                    payload,
+                )
+            )
+            pending[worker.connection] = worker
+        try:
+            while pending:
+                for connection in wait(list(pending.keys())):
+                    worker = pending.pop(cast(Connection, connection))
+                    try:
+                        result_encoding, result_payload = worker.connection.recv()
+                    except EOFError:
+                        worker.restart()
+                        raise UPException(
+                            f"The worker of the engine {worker.engine_name} terminated unexpectedly"
+                        )
+                    res = _decode_result(
+                        fname, result_encoding, result_payload, args[0]
+                    )
+                    if isinstance(res, BaseException):
+                        raise res
+                    assert isinstance(res, Result)
+                    yield res
+        finally:
+            for worker in pending.values():
+                worker.restart()
+
+    def _run_processes(self, fname, *args) -> Generator[Result, None, None]:
         signaling_queue: Queue = Queue()
+        # With the fork start method the processes inherit the factory and the arguments;
+        # otherwise they are pickled once and the same bytes are sent to all the processes
+        payload: Union[bytes, Tuple["up.engines.factory.Factory", tuple]] = (
+            self._factory,
+            args,
+        )
+        if get_start_method() != "fork":
+            payload = pickle.dumps(payload)
         processes = []
         for idx, (engine_name, opts) in enumerate(self.engines):
             options = opts
@@ -84,41 +201,27 @@ class Parallel(
                 target=_run,
                 args=(
                     idx,
-                    self._factory,
+                    payload,
                     engine_name,
                     options,
                     self.skip_checks,
                     self.error_on_failed_checks,
                     signaling_queue,
                     fname,
-                    *args,
                 ),
             )
             processes.append(_p)
             _p.start()
-        processes_alive = len(processes)
-        results: List[Result] = []
-        definitive_result_found: bool = False
-        while True:
-            if processes_alive == 0:  # Every planner gave a result
-                break
-            (idx, res) = signaling_queue.get(block=True)
-            processes_alive -= 1
-            if isinstance(res, BaseException):
-                raise res
-            else:
+        try:
+            for _ in processes:
+                (idx, _, res) = signaling_queue.get(block=True)
+                if isinstance(res, BaseException):
+                    raise res
                 assert isinstance(res, Result)
-                # If the planner is sure about the result (optimality of the result or impossibility of the problem or the problem does not need optimality) exit the loop
-                if res.is_definitive_result(*args):
-                    definitive_result_found = True
-                    break
-                else:
-                    results.append(res)
-        for p in processes:
-            p.terminate()
-        if definitive_result_found:  # A planner found a definitive result
-            return [res]
-        return results
+                yield res
+        finally:
+            for p in processes:
+                p.terminate()
 
     def _solve(
         self,
@@ -135,7 +238,7 @@ class Parallel(
                 "Parallel engines do not support the output stream system.", UserWarning
             )
 
-        final_reports = self._run_parallel("solve", problem, timeout, None)
+        final_reports = self._run_parallel("solve", problem, None, timeout)
 
         result_order: List[PlanGenerationResultStatus] = [
             PlanGenerationResultStatus.SOLVED_OPTIMALLY,  # List containing the results in the order we prefer them
@@ -197,15 +300,15 @@ class Parallel(
 
 def _run(
     idx: int,
-    factory: "up.engines.factory.Factory",
+    payload: Union[bytes, Tuple["up.engines.factory.Factory", tuple]],
     engine_name: str,
     options: Dict[str, str],
     skip_checks: bool,
     error_on_failed_checks: bool,
     signaling_queue: Queue,
     fname: str,
-    *args,
 ):
+    factory, args = pickle.loads(payload) if isinstance(payload, bytes) else payload
     EngineClass = factory.engine(engine_name)
     with EngineClass(**options) as s:
         s.skip_checks = skip_checks
@@ -213,6 +316,159 @@ def _run(
         try:
             local_res = getattr(s, fname)(*args)
         except Exception as ex:
-            signaling_queue.put((idx, ex))
+            signaling_queue.put((idx, None, ex))
             return
-        signaling_queue.put((idx, local_res))
+        # The environment is sent before the result, see _dumps_result
+        signaling_queue.put((idx, args[0].environment, local_res))
+
+
+class _Worker:
+    """A long-lived process running the calls of a `Parallel` engine with the same `Engine` instance."""
+
+    def __init__(
+        self,
+        factory: "up.engines.factory.Factory",
+        engine_name: str,
+        options: Dict[str, str],
+    ):
+        self.factory = factory
+        self.engine_name = engine_name
+        self.options = options
+        self._start()
+
+    def _start(self):
+        self.connection, child_connection = Pipe()
+        # The worker is a daemon, so it does not outlive its parent
+        self.process = Process(
+            target=_serve,
+            args=(child_connection, self.factory, self.engine_name, self.options),
+            daemon=True,
+        )
+        self.process.start()
+        child_connection.close()
+
+    def restart(self):
+        """Terminates the worker, discarding the call it is running, and starts a new one."""
+        self.process.terminate()
+        self.process.join()
+        self.connection.close()
+        self._start()
+
+    def stop(self):
+        try:
+            self.connection.send(None)
+        except OSError:
+            self.process.terminate()
+        self.process.join()
+        self.connection.close()
+
+
+def _serve(
+    connection: Connection,
+    factory: "up.engines.factory.Factory",
+    engine_name: str,
+    options: Dict[str, str],
+):
+    EngineClass = factory.engine(engine_name)
+    with EngineClass(**options) as engine:
+        while True:
+            try:
+                task = connection.recv()
+            except EOFError:
+                break
+            if task is None:
+                break
+            fname, skip_checks, error_on_failed_checks, encoding, payload = task
+            engine.skip_checks = skip_checks
+            engine.error_on_failed_checks = error_on_failed_checks
+            try:
+                args = _decode_arguments(encoding, payload, factory.environment)
+                message = _encode_result(
+                    encoding, getattr(engine, fname)(*args), args[0].environment
+                )
+            except Exception as ex:
+                try:
+                    message = ("exception", pickle.dumps(ex))
+                except Exception:
+                    message = ("exception", pickle.dumps(UPException(repr(ex))))
+            connection.send(message)
+
+
+def _encode_arguments(fname: str, args: tuple) -> Tuple[str, Any]:
+    """
+    Encodes the arguments of a call for the workers: the problem, and the plan to
+    validate, are converted to protobuf messages if possible, otherwise the arguments
+    are pickled.
+    """
+    problem = args[0]
+    kind = problem.kind
+    if not (
+        kind.has_increase_continuous_effects()
+        or kind.has_decrease_continuous_effects()
+        or kind.has_simulated_effects()
+    ):
+        try:
+            from unified_planning.grpc.proto_writer import ProtobufWriter  # type: ignore[attr-defined]
+
+            writer = ProtobufWriter()
+            problem_msg = writer.convert(problem).SerializeToString()
+            if fname == "validate":
+                plan_msg = writer.convert(args[1]).SerializeToString()
+                return "protobuf", (problem_msg, plan_msg, ())
+            return "protobuf", (problem_msg, None, args[1:])
+        except (ImportError, KeyError, ValueError, UPException):
+            # protobuf is not installed or it can't represent the problem or the plan
+            pass
+    return "pickle", pickle.dumps(args)
+
+
+def _decode_arguments(
+    encoding: str, payload: Any, environment: "up.environment.Environment"
+) -> tuple:
+    if encoding == "pickle":
+        return pickle.loads(payload)
+    import unified_planning.grpc.generated.unified_planning_pb2 as proto
+    from unified_planning.grpc.proto_reader import ProtobufReader  # type: ignore[attr-defined]
+
+    reader = ProtobufReader()
+    problem_msg, plan_msg, other_args = payload
+    problem = reader.convert(proto.Problem.FromString(problem_msg), environment)  # type: ignore[attr-defined]
+    if plan_msg is not None:
+        return (problem, reader.convert(proto.Plan.FromString(plan_msg), problem))  # type: ignore[attr-defined]
+    return (problem, *other_args)
+
+
+def _encode_result(
+    encoding: str, result: Result, environment: "up.environment.Environment"
+) -> Tuple[str, Any]:
+    if encoding == "protobuf":
+        try:
+            from unified_planning.grpc.proto_writer import ProtobufWriter  # type: ignore[attr-defined]
+
+            return "protobuf", ProtobufWriter().convert(result).SerializeToString()
+        except (KeyError, ValueError, UPException):
+            pass
+    return "pickle", _dumps_result(environment, result)
+
+
+def _dumps_result(environment: "up.environment.Environment", result: Result) -> bytes:
+    # The environment is pickled before the result, so it is unpickled before the
+    # objects of the result; otherwise, the dicts in the environment having these
+    # objects as keys could be unpickled before the objects and fail to hash them.
+    return pickle.dumps((environment, result))
+
+
+def _decode_result(
+    fname: str, encoding: str, payload: Any, problem: "up.model.AbstractProblem"
+) -> Union[Result, BaseException]:
+    if encoding == "exception":
+        return pickle.loads(payload)
+    elif encoding == "pickle":
+        return pickle.loads(payload)[1]
+    import unified_planning.grpc.generated.unified_planning_pb2 as proto
+    from unified_planning.grpc.proto_reader import ProtobufReader  # type: ignore[attr-defined]
+
+    reader = ProtobufReader()
+    if fname == "validate":
+        return reader.convert(proto.ValidationResult.FromString(payload))  # type: ignore[attr-defined]
+    return reader.convert(proto.PlanGenerationResult.FromString(payload), problem)  # type: ignore[attr-defined]
@@ -14,11 +14,23 @@
 #
 
 
+from bisect import bisect_left, bisect_right
 from collections import OrderedDict
 from dataclasses import dataclass
 from fractions import Fraction
 import heapq
-from typing import Any, Dict, Generator, List, Optional, Set, Tuple, Union, cast
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 import warnings
 import unified_planning as up
 import unified_planning.environment
@@ -69,6 +81,12 @@ class SequentialPlanValidator(engines.engine.Engine, mixins.PlanValidatorMixin):
     If the given :class:`~unified_planning.model.Problem` has any quality metric,
     the metric is simply ignored because it predicates over the Optimality of
     the Plan, but not the Validity!
+
+    With the `incremental` option, the states reached by the simulated action
+    prefixes are kept between the calls on the same `Problem`, so a plan sharing a
+    prefix with an already validated plan (like the successive solutions of an
+    anytime planner) is simulated only from where it diverges. The stored states are
+    dropped when a different or modified `Problem` is validated.
     """
 
     def __init__(self, **options):
@@ -79,6 +97,19 @@ class SequentialPlanValidator(engines.engine.Engine, mixins.PlanValidatorMixin):
                 options.get("environment", None)
             )
         )
+        incremental = options.get("incremental", False)
+        if isinstance(incremental, str):
+            incremental = incremental.lower() in ["true", "1"]
+        self._incremental: bool = incremental
+        self._simulation: Optional[
+            Tuple[
+                Problem,
+                int,
+                UPSequentialSimulator,
+                Optional[PlanQualityMetric],
+                "_SimulatedPrefix",
+            ]
+        ] = None
 
     @property
     def name(self):
@@ -112,8 +143,44 @@ class SequentialPlanValidator(engines.engine.Engine, mixins.PlanValidatorMixin):
         :return: The generated up.engines.results.ValidationResult; a data structure containing the information
             about the plan validity and eventually some additional log messages for the user.
         """
-        assert isinstance(plan, SequentialPlan)
+        return self._validate_many(problem, [plan])[0]
+
+    def _validate_many(
+        self,
+        problem: "AbstractProblem",
+        plans: Sequence["unified_planning.plans.Plan"],
+    ) -> List["up.engines.results.ValidationResult"]:
+        """
+        Validates the given plans with the same simulator, so the actions are grounded
+        once, and the states reached by the prefixes shared by the plans are computed once.
+
+        :param problem: The problem for which the plans to validate were generated.
+        :param plans: The plans that must be validated.
+        :return: The list of the generated up.engines.results.ValidationResult.
+        """
         assert isinstance(problem, Problem)
+        simulator, metric, root = self._get_simulation(problem)
+        results = []
+        for plan in plans:
+            assert isinstance(plan, SequentialPlan)
+            results.append(self._validate_plan(simulator, metric, root, plan))
+        return results
+
+    def _get_simulation(
+        self, problem: Problem
+    ) -> Tuple[UPSequentialSimulator, Optional[PlanQualityMetric], "_SimulatedPrefix"]:
+        """
+        Returns the simulator of the given problem, its quality metric and the root of
+        the trie of the simulated action prefixes; in incremental mode they are reused
+        until the problem changes.
+        """
+        version = problem._modification_counter.value
+        if (
+            self._simulation is not None
+            and self._simulation[0] is problem
+            and self._simulation[1] == version
+        ):
+            return self._simulation[2:]
         metric = None
         if len(problem.quality_metrics) > 0:
             if len(problem.quality_metrics) == 1:
@@ -130,18 +197,36 @@ class SequentialPlanValidator(engines.engine.Engine, mixins.PlanValidatorMixin):
         kind.unset_parameters("UNBOUNDED_INT_ACTION_PARAMETERS")
         kind.unset_parameters("REAL_ACTION_PARAMETERS")
         if not self.skip_checks and not simulator.supports(kind):
-            msg: Optional[
-                str
-            ] = f"We cannot establish whether {self.name} can validate this problem!"
+            msg = f"We cannot establish whether {self.name} can validate this problem!"
             if self.error_on_failed_checks:
                 raise up.exceptions.UPUsageError(msg)
             else:
-                warnings.warn(cast(str, msg))
+                warnings.warn(msg)
+        metric_value = None
         if metric is not None:
             metric_value = evaluate_quality_metric_in_initial_state(simulator, metric)
+        root = _SimulatedPrefix(simulator.get_initial_state(), metric_value)
+        if self._incremental:
+            self._simulation = (problem, version, simulator, metric, root)
+        return simulator, metric, root
+
+    def _validate_plan(
+        self,
+        simulator: UPSequentialSimulator,
+        metric: Optional[PlanQualityMetric],
+        root: "_SimulatedPrefix",
+        plan: SequentialPlan,
+    ) -> "up.engines.results.ValidationResult":
         msg = None
-        trace: List[State] = [simulator.get_initial_state()]
+        node = root
+        trace: List[State] = [root.state]
         for i, ai in zip(range(1, len(plan.actions) + 1), plan.actions):
+            key = (ai.action.name, ai.actual_parameters)
+            child = node.children.get(key, None)
+            if child is not None:
+                node = child
+                trace.append(node.state)
+                continue
             try:
                 unsat_conds, reason = simulator.get_unsatisfied_conditions(
                     trace[-1], ai
@@ -169,6 +254,7 @@ class SequentialPlanValidator(engines.engine.Engine, mixins.PlanValidatorMixin):
                     trace=trace,
                 )
             assert next_state is not None
+            metric_value = node.metric_value
             if metric is not None:
                 metric_value = evaluate_quality_metric(
                     simulator,
@@ -179,13 +265,16 @@ class SequentialPlanValidator(engines.engine.Engine, mixins.PlanValidatorMixin):
                     ai.actual_parameters,
                     next_state,
                 )
+            child = _SimulatedPrefix(next_state, metric_value)
+            node.children[key] = child
+            node = child
             trace.append(next_state)
 
         unsatisfied_goals = simulator.get_unsatisfied_goals(trace[-1])
         if not unsatisfied_goals:
             metric_evaluations = None
             if metric is not None:
-                metric_evaluations = {metric: metric_value}
+                metric_evaluations = {metric: node.metric_value}
             logs = []
             return ValidationResult(
                 ValidationResultStatus.VALID,
@@ -207,6 +296,21 @@ class SequentialPlanValidator(engines.engine.Engine, mixins.PlanValidatorMixin):
             )
 
 
+class _SimulatedPrefix:
+    """
+    A node of the trie of the action instances simulated by the `SequentialPlanValidator`;
+    it stores the state reached by the sequence of action instances from the root and the
+    value of the quality metric in that state.
+    """
+
+    __slots__ = ["state", "metric_value", "children"]
+
+    def __init__(self, state: State, metric_value: Any):
+        self.state = state
+        self.metric_value = metric_value
+        self.children: Dict[Tuple[str, Tuple[FNode, ...]], "_SimulatedPrefix"] = {}
+
+
 class TimeTriggeredPlanValidator(engines.engine.Engine, mixins.PlanValidatorMixin):
     """
     Performs :class:`~unified_planning.plans.Plan` validation.
@@ -338,27 +442,36 @@ class TimeTriggeredPlanValidator(engines.engine.Engine, mixins.PlanValidatorMixi
     def _states_in_interval(
         self,
         trace: Dict[Fraction, State],
+        sorted_times: List[Fraction],
         start: Fraction,
         end: Optional[Fraction],
         open_interval: bool,
     ) -> Generator[Tuple[Fraction, State], None, None]:
-        before_time = Fraction(-1)
-        equal_time = Fraction(-1)
-        inside_indexes = []
-        for x in trace:
-            if x < start and x > before_time:
-                before_time = x
-            if x <= start and x > equal_time:
-                equal_time = x
-            inside_indexes_condition = start < x if end is None else start < x < end
-            if inside_indexes_condition:
-                inside_indexes.append(x)
+        """
+        Yields the states of the trace that must satisfy a condition in the given interval:
+        the state before the start (if the interval is not open), the state at the start
+        and the states strictly inside the interval.
+
+        :param trace: The states of the plan, indexed by the time they start.
+        :param sorted_times: The sorted times of the trace, used to find the interval
+            with a binary search.
+        :param start: The start of the interval.
+        :param end: The end of the interval; `None` means the end of the plan.
+        :param open_interval: `True` if the interval is left open.
+        :return: The generator of the times and the states in the interval.
+        """
+        # the trace always contains the time -1, before any start
+        before_index = bisect_left(sorted_times, start) - 1
+        equal_index = bisect_right(sorted_times, start) - 1
+        before_time = sorted_times[before_index]
+        equal_time = sorted_times[equal_index]
+        end_index = len(sorted_times) if end is None else bisect_left(sorted_times, end)
 
         if not open_interval:
             yield before_time, trace[before_time]
         if equal_time != before_time and equal_time != end:
             yield equal_time, trace[equal_time]
-        for x in inside_indexes:
+        for x in sorted_times[equal_index + 1 : end_index]:
             yield x, trace[x]
 
     def _check_condition(
@@ -624,12 +737,23 @@ class TimeTriggeredPlanValidator(engines.engine.Engine, mixins.PlanValidatorMixi
                 trace[time] = new_state
                 last_state = new_state
 
-        # Check (durative) conditions
+        # Check (durative) conditions; the conditions already satisfied in a state are
+        # not evaluated again when they are required by other intervals
+        sorted_times = sorted(trace)
+        satisfied_conditions: Set[Tuple[Fraction, FNode]] = set()
         for (start, end, is_open), _, c, opt_ai in durative_conditions:
             for t, state in self._states_in_interval(
-                trace=trace, start=start, end=end, open_interval=is_open
+                trace=trace,
+                sorted_times=sorted_times,
+                start=start,
+                end=end,
+                open_interval=is_open,
             ):
-                if not self._check_condition(state=state, se=se, condition=c):
+                if (t, c) in satisfied_conditions:
+                    continue
+                if self._check_condition(state=state, se=se, condition=c):
+                    satisfied_conditions.add((t, c))
+                else:
                     if opt_ai is not None:
                         assert end is not None
                         return ValidationResult(
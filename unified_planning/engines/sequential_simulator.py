@@ -39,6 +39,7 @@ from unified_planning.model import (
     FNode,
     ExpressionManager,
     UPState,
+    UPCompiledState,
     Problem,
     MinimizeActionCosts,
     MinimizeExpressionOnFinalState,
@@ -48,10 +49,18 @@ from unified_planning.model import (
     Variable,
 )
 from unified_planning.model.types import _RealType
-from unified_planning.model.walkers import StateEvaluator, ExpressionQuantifiersRemover
+from unified_planning.model.state import StateLayout
+from unified_planning.engines.compilers.utils import split_all_ands
+from unified_planning.model.walkers import (
+    StateEvaluator,
+    ExpressionQuantifiersRemover,
+    ExpressionCompiler,
+)
+from unified_planning.model.walkers.expression_compiler import CompiledExpression
 from typing import (
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -84,16 +93,293 @@ class InapplicabilityReasons(Enum):
     VIOLATES_STATE_INVARIANTS = auto()
 
 
+class _CompiledAction:
+    """
+    Flat program equivalent to a grounded `InstantaneousAction`, used by the
+    `UPSequentialSimulator` when the ``compiled_state`` flag is set.
+
+    Preconditions and effects are compiled with an
+    :class:`~unified_planning.model.walkers.ExpressionCompiler`, so they are evaluated
+    directly on the slots of a :class:`~unified_planning.model.UPCompiledState`.
+    """
+
+    ASSIGN, INCREASE, DECREASE = 0, 1, 2
+
+    def __init__(
+        self,
+        preconditions: Sequence[CompiledExpression],
+        effects: Sequence[
+            Tuple[
+                FNode,
+                Tuple[int, int],
+                int,
+                Optional[CompiledExpression],
+                CompiledExpression,
+            ]
+        ],
+    ):
+        self._preconditions = tuple(preconditions)
+        self._effects = tuple(effects)
+
+    @staticmethod
+    def compile(
+        action: "up.model.InstantaneousAction",
+        compiler: ExpressionCompiler,
+        objects_set: "up.model.mixins.ObjectsSetMixin",
+    ) -> Optional["_CompiledAction"]:
+        """
+        Compiles the given grounded action.
+
+        :param action: The grounded action to compile.
+        :param compiler: The `ExpressionCompiler` of the simulator's states layout.
+        :param objects_set: The problem used to expand the forall effects.
+        :return: The compiled action or `None` if the action can't be compiled; for
+            example if it has a simulated effect.
+        """
+        if action.simulated_effect is not None:
+            return None
+        preconditions = []
+        for c in action.preconditions:
+            compiled = compiler.compile(c)
+            if compiled is None:
+                return None
+            preconditions.append(compiled)
+        effects = []
+        for e in action.effects:
+            for effect in e.expand_effect(objects_set):
+                fluent = effect.fluent
+                compiled_value = compiler.compile(effect.value)
+                if (
+                    compiled_value is None
+                    or not all(a.is_constant() for a in fluent.args)
+                    or fluent not in compiler._layout._slots
+                ):
+                    return None
+                compiled_condition = None
+                if effect.is_conditional():
+                    compiled_condition = compiler.compile(effect.condition)
+                    if compiled_condition is None:
+                        return None
+                if effect.is_increase():
+                    kind = _CompiledAction.INCREASE
+                elif effect.is_decrease():
+                    kind = _CompiledAction.DECREASE
+                else:
+                    assert effect.is_assignment()
+                    kind = _CompiledAction.ASSIGN
+                effects.append(
+                    (
+                        fluent,
+                        compiler._layout.slot(fluent),
+                        kind,
+                        compiled_condition,
+                        compiled_value,
+                    )
+                )
+        return _CompiledAction(preconditions, effects)
+
+    def holds(self, state: UPCompiledState) -> bool:
+        """Returns `True` if all the preconditions hold in the given `state`."""
+        for p in self._preconditions:
+            if not p(state):
+                return False
+        return True
+
+    def successor(self, state: UPCompiledState) -> UPCompiledState:
+        """
+        Returns the state obtained applying the effects of the action in the given `state`,
+        with the same semantic of the :func:`~unified_planning.engines.UPSequentialSimulator.apply_unsafe`.
+
+        :raises UPConflictingEffectsException: If to the same fluent are assigned 2 different
+            values.
+        """
+        updated_values: Dict[Tuple[int, int], Union[bool, int, Fraction]] = {}
+        assigned_slots: Set[Tuple[int, int]] = set()
+        for fluent, slot, kind, condition, value in self._effects:
+            if condition is not None and not condition(state):
+                continue
+            new_value = value(state)
+            old_value = updated_values.get(slot, None)
+            if kind == _CompiledAction.ASSIGN:
+                if old_value is not None and new_value != old_value:
+                    if slot[0] != StateLayout.BOOL:
+                        raise UPConflictingEffectsException(
+                            f"The fluent {fluent} is modified by 2 different assignments in the same action."
+                        )
+                    # solve with add-after-delete logic
+                    elif not old_value:
+                        updated_values[slot] = new_value
+                elif old_value is not None and slot not in assigned_slots:
+                    raise UPConflictingEffectsException(
+                        f"The fluent {fluent} is modified by 1 assignments and an increase/decrease in the same action."
+                    )
+                else:
+                    assigned_slots.add(slot)
+                    updated_values[slot] = new_value
+            else:
+                if slot in assigned_slots:
+                    raise UPConflictingEffectsException(
+                        f"The fluent {fluent} is modified by an assignment and an increase/decrease in the same action."
+                    )
+                if old_value is None:
+                    old_value = state._numerics[slot[1]]
+                if kind == _CompiledAction.INCREASE:
+                    updated_values[slot] = old_value + new_value
+                else:
+                    updated_values[slot] = old_value - new_value
+        return state.make_child_from_slots(updated_values)
+
+
+class _SuccessorGenerator:
+    """
+    Index over the grounded actions of a problem, used by the `UPSequentialSimulator` to
+    generate the applicable actions of a state without testing every grounded action.
+
+    Every grounded action is watched by one of its positive boolean preconditions, when it
+    has one: only the actions watched by a fluent that is `True` in the state (and the
+    actions that are not watched) are tested.
+
+    When the states are :class:`~unified_planning.model.UPCompiledState`, every grounded
+    action is also indexed by the slots it reads, so the applicable actions of a child state
+    can be updated from the applicable actions of its father by testing only the actions that
+    read a slot changed by the `make_child`.
+    """
+
+    def __init__(
+        self,
+        grounded_actions: Sequence[Tuple[Action, Tuple[FNode, ...], Optional[Action]]],
+        constraining_fluents: Set[FNode],
+        layout: Optional[StateLayout] = None,
+    ):
+        """
+        Creates the index.
+
+        :param grounded_actions: The grounded actions of the problem, as returned by the
+            :func:`~unified_planning.engines.compilers.GrounderHelper.get_grounded_actions`.
+        :param constraining_fluents: The fluents appearing in the state invariants that
+            constrain more than one fluent; when one of them changes every action is tested again.
+        :param layout: The layout of the states, if the states are `UPCompiledState`.
+        """
+        self._layout = layout
+        self._actions: List[Tuple[Action, Tuple[FNode, ...]]] = []
+        self._ids: Dict[Tuple[str, Tuple[FNode, ...]], int] = {}
+        self._unwatched: List[int] = []
+        watchers: Dict[FNode, List[int]] = {}
+        # Actions that must be tested again after any change, because the slots
+        # they read are not known.
+        self._volatile: List[int] = []
+        self._readers: Dict[Tuple[int, int], List[int]] = {}
+        self._constraining_slots: Set[Tuple[int, int]] = set()
+        for original_action, params, grounded_action in grounded_actions:
+            if grounded_action is None:
+                continue
+            assert isinstance(grounded_action, up.model.InstantaneousAction)
+            action_id = len(self._actions)
+            self._actions.append((original_action, params))
+            self._ids[(original_action.name, params)] = action_id
+            env = grounded_action.environment
+            watch_candidates = [
+                c
+                for c in split_all_ands(grounded_action.preconditions)
+                if c.is_fluent_exp()
+                and c.fluent().type.is_bool_type()
+                and all(a.is_constant() for a in c.args)
+                and (layout is None or c in layout._slots)
+            ]
+            if watch_candidates:
+                watched = min(watch_candidates, key=lambda c: len(watchers.get(c, [])))
+                watchers.setdefault(watched, []).append(action_id)
+            else:
+                self._unwatched.append(action_id)
+            if layout is None:
+                continue
+            read_fluents: Set[FNode] = set()
+            for c in grounded_action.preconditions:
+                read_fluents.update(env.free_vars_extractor.get(c))
+            for e in grounded_action.effects:
+                for exp in (e.fluent, e.value, e.condition):
+                    read_fluents.update(env.free_vars_extractor.get(exp))
+            if grounded_action.simulated_effect is not None or any(
+                fe not in layout._slots for fe in read_fluents
+            ):
+                self._volatile.append(action_id)
+            else:
+                for fe in read_fluents:
+                    self._readers.setdefault(layout.slot(fe), []).append(action_id)
+        self._watchers: List[Tuple[FNode, List[int]]] = list(watchers.items())
+        if layout is not None:
+            self._masks: List[Tuple[int, List[int]]] = [
+                (1 << layout.slot(fe)[1], ids) for fe, ids in self._watchers
+            ]
+            self._constraining_slots = {
+                layout.slot(fe) for fe in constraining_fluents if fe in layout._slots
+            }
+
+    @property
+    def actions(self) -> List[Tuple[Action, Tuple[FNode, ...]]]:
+        """Returns the indexed grounded actions, as couples of action and parameters."""
+        return self._actions
+
+    def action_id(self, action: Action, params: Tuple[FNode, ...]) -> Optional[int]:
+        """Returns the index of the given action grounded with the given parameters."""
+        return self._ids.get((action.name, params), None)
+
+    def candidates(self, state: "up.model.State") -> List[int]:
+        """
+        Returns the sorted indexes of the actions that might be applicable in the given state.
+
+        :param state: The state in which the applicable actions are searched.
+        :return: The indexes of the actions that must be tested for applicability.
+        """
+        res = list(self._unwatched)
+        if self._layout is not None and isinstance(state, UPCompiledState):
+            bits = state._bits
+            for mask, ids in self._masks:
+                if bits & mask:
+                    res.extend(ids)
+        else:
+            for fluent, ids in self._watchers:
+                if state.get_value(fluent).bool_constant_value():
+                    res.extend(ids)
+        res.sort()
+        return res
+
+    def affected(self, changed_slots: Sequence[Tuple[int, int]]) -> Optional[Set[int]]:
+        """
+        Returns the indexes of the actions whose applicability might change when the
+        given slots change; `None` if every action might be affected.
+
+        :param changed_slots: The slots changed between a state and its father.
+        :return: The indexes of the actions that must be tested again or `None`.
+        """
+        res = set(self._volatile)
+        for slot in changed_slots:
+            if slot in self._constraining_slots:
+                return None
+            res.update(self._readers.get(slot, ()))
+        return res
+
+
 class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
     """
     Sequential SequentialSimulatorMixin implementation.
 
     This SequentialSimulator, when considering if a state is goal or not, ignores the
     quality metrics.
+
+    When the ``compiled_state`` flag is set, the states created by this simulator are
+    :class:`~unified_planning.model.UPCompiledState`, that index every grounded fluent once
+    in a shared slot table instead of keeping a chain of dictionaries; in this mode every
+    grounded action, the goals and the state invariants are also compiled once into closures
+    that read and write the state slots directly, avoiding to walk the expressions at every call.
     """
 
     def __init__(
-        self, problem: "up.model.Problem", error_on_failed_checks: bool = True, **kwargs
+        self,
+        problem: "up.model.Problem",
+        error_on_failed_checks: bool = True,
+        compiled_state: bool = False,
+        **kwargs,
     ):
         Engine.__init__(self)
         SequentialSimulatorMixin.__init__(self, problem, error_on_failed_checks)
@@ -108,10 +394,19 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
         self._grounder = GrounderHelper(problem)
         self._actions = set(self._problem.actions)
         self._se = StateEvaluator(self._problem)
-        self._initial_state: Optional[UPState] = None
+        self._compiled_state = compiled_state
+        self._initial_state: Optional[Union[UPState, UPCompiledState]] = None
+        # Map from the action and its parameters to the compiled action; None if the
+        # action can't be compiled, in which case the StateEvaluator is used.
+        self._compiled_actions: Dict[
+            Tuple[str, Tuple[FNode, ...]], Optional[_CompiledAction]
+        ] = {}
+        self._compiled_goals: Optional[List[CompiledExpression]] = None
+        self._compiled_state_invariants: Optional[List[CompiledExpression]] = None
         self._grounded_actions: Optional[
             List[Tuple[Action, Tuple[FNode, ...], Optional[Action]]]
         ] = None
+        self._successor_generator: Optional[_SuccessorGenerator] = None
 
         # Add state invariants without quantifiers to get all the grounded
         # fluent instances that might modify the state invariants
@@ -128,6 +423,12 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
                 si.environment.free_vars_extractor.get(si)
             )
 
+        # Fluents appearing in the state invariants of the problem; differently from the
+        # bounded types, these invariants might constrain more fluents together
+        self._fluent_exps_in_problem_state_invariants: Set[FNode] = set(
+            self._fluent_exps_in_state_invariants
+        )
+
         # Add bounded types as state invariants
         em = self._problem.environment.expression_manager
         for f in self._problem.fluents:
@@ -171,16 +472,95 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
         ), "Supported_kind not respected"
         return grounded_act
 
+    def _compile_all(
+        self, expressions: Sequence[FNode]
+    ) -> Optional[List[CompiledExpression]]:
+        """
+        Compiles all the given expressions; returns `None` if at least one of them
+        can't be compiled.
+        """
+        res = []
+        for exp in expressions:
+            compiled = self._compiler.compile(exp)
+            if compiled is None:
+                return None
+            res.append(compiled)
+        return res
+
+    def _uses_compiled_layout(self, state: "up.model.State") -> bool:
+        """Returns `True` if the given state can be used by the compiled expressions."""
+        if not self._compiled_state or not isinstance(state, UPCompiledState):
+            return False
+        initial_state = self._get_initial_state()
+        assert isinstance(initial_state, UPCompiledState)
+        return state.layout is initial_state.layout
+
+    def _get_compiled_action(
+        self,
+        state: "up.model.State",
+        action: "up.model.Action",
+        params: Tuple["up.model.FNode", ...],
+    ) -> Optional[_CompiledAction]:
+        """
+        Returns the compiled version of the given action grounded with the given params.
+
+        :param state: The state in which the compiled action will be evaluated.
+        :param action: The action to ground.
+        :param params: The parameters used to ground the action.
+        :return: The compiled action; None if the simulator is not using compiled states,
+            if the given state is not compatible with the compiled actions or if the grounded
+            action can't be compiled.
+        :raises UPInvalidActionError: If the grounded action is invalid.
+        """
+        if not self._uses_compiled_layout(state):
+            return None
+        key = (action.name, params)
+        if key in self._compiled_actions:
+            return self._compiled_actions[key]
+        grounded_action = self._ground_action(action, params)
+        if grounded_action is None:
+            raise UPInvalidActionError(
+                "The given action grounded with the given parameters does not create a valid action."
+            )
+        compiled_action = _CompiledAction.compile(
+            grounded_action,
+            self._compiler,
+            cast(up.model.mixins.ObjectsSetMixin, self._problem),
+        )
+        self._compiled_actions[key] = compiled_action
+        return compiled_action
+
+    def _violates_state_invariants(self, state: "up.model.State") -> bool:
+        """Returns `True` if the given state violates at least one state invariant."""
+        if self._compiled_state_invariants is not None and self._uses_compiled_layout(
+            state
+        ):
+            compiled_state = cast(UPCompiledState, state)
+            return not all(si(compiled_state) for si in self._compiled_state_invariants)
+        return not all(
+            self._se.evaluate(si, state).bool_constant_value()
+            for si in self._state_invariants
+        )
+
     def _get_initial_state(self) -> "up.model.State":
         """
         Returns the problem's initial state.
 
         NOTE: Every method that requires a state assumes that it's the same class
-        of the state given here, therefore an up.model.UPState.
+        of the state given here, therefore an up.model.UPState or, if the
+        ``compiled_state`` flag is set, an up.model.UPCompiledState.
         """
         assert isinstance(self._problem, Problem), "supported_kind not respected"
         if self._initial_state is None:
-            self._initial_state = UPState(self._problem.initial_values)
+            if self._compiled_state:
+                self._initial_state = UPCompiledState(self._problem.initial_values)
+                self._compiler = ExpressionCompiler(self._initial_state.layout)
+                self._compiled_goals = self._compile_all(self._problem.goals)
+                self._compiled_state_invariants = self._compile_all(
+                    self._state_invariants
+                )
+            else:
+                self._initial_state = UPState(self._problem.initial_values)
             for si in self._state_invariants:
                 if not self._se.evaluate(si, self._initial_state).bool_constant_value():
                     raise UPProblemDefinitionError(
@@ -206,6 +586,19 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
             an `ActionInstance` is given instead.
         :return: Whether or not the action is applicable in the given `state`.
         """
+        try:
+            compiled_action = self._get_compiled_action(state, action, parameters)
+        except UPInvalidActionError:
+            return False
+        if compiled_action is not None:
+            assert isinstance(state, UPCompiledState)
+            if not compiled_action.holds(state):
+                return False
+            try:
+                new_state = compiled_action.successor(state)
+            except UPConflictingEffectsException:
+                return False
+            return not self._violates_state_invariants(new_state)
         try:
             _, reason = self.get_unsatisfied_conditions(
                 state, action, parameters, early_termination=True, full_check=True
@@ -234,6 +627,18 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
         :return: `None` if the `action` is not applicable in the given `state`, the new State generated
             if the action is applicable.
         """
+        compiled_action = self._get_compiled_action(state, action, parameters)
+        if compiled_action is not None:
+            assert isinstance(state, UPCompiledState)
+            if not compiled_action.holds(state):
+                return None
+            try:
+                new_state = compiled_action.successor(state)
+            except UPConflictingEffectsException:
+                return None
+            if self._violates_state_invariants(new_state):
+                return None
+            return new_state
         _, reason = self.get_unsatisfied_conditions(
             state, action, parameters, early_termination=True, full_check=False
         )
@@ -268,10 +673,20 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
         action, params = self._get_action_and_parameters(
             action_or_action_instance, parameters
         )
-        if not isinstance(state, up.model.UPState):
+        if not isinstance(state, (UPState, UPCompiledState)):
             raise UPUsageError(
                 f"The UPSequentialSimulator uses the UPState but {type(state).__name__} is given."
             )
+        compiled_action = self._get_compiled_action(state, action, params)
+        if compiled_action is not None:
+            assert isinstance(state, UPCompiledState)
+            compiled_state = compiled_action.successor(state)
+            if self._violates_state_invariants(compiled_state):
+                raise UPInvalidActionError(
+                    "The given action is not applicable because it violates state invariants.",
+                    "Bounded numeric types are checked as state invariants.",
+                )
+            return compiled_state
         grounded_action = self._ground_action(action, params)
         if grounded_action is None:
             raise UPInvalidActionError("Apply_unsafe got an inapplicable action.")
@@ -410,12 +825,88 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
         :param state: the `state` where the formulas are evaluated.
         :return: an `Iterator` of applicable actions + parameters.
         """
-        if self._grounded_actions is None:
-            self._grounded_actions = list(self._grounder.get_grounded_actions())
-        for original_action, params, _ in self._grounded_actions:
+        successor_generator = self._get_successor_generator()
+        for action_id in successor_generator.candidates(state):
+            original_action, params = successor_generator.actions[action_id]
             if self._is_applicable(state, original_action, params):
                 yield (original_action, params)
 
+    def _get_successor_generator(self) -> _SuccessorGenerator:
+        """Returns the index over the grounded actions, creating it if needed."""
+        if self._successor_generator is None:
+            if self._grounded_actions is None:
+                self._grounded_actions = list(self._grounder.get_grounded_actions())
+            layout = None
+            if self._compiled_state:
+                initial_state = self._get_initial_state()
+                assert isinstance(initial_state, UPCompiledState)
+                layout = initial_state.layout
+            self._successor_generator = _SuccessorGenerator(
+                self._grounded_actions,
+                self._fluent_exps_in_problem_state_invariants,
+                layout,
+            )
+        return self._successor_generator
+
+    def get_applicable_actions_from_parent(
+        self,
+        state: "up.model.State",
+        parent_applicable_actions: Iterable[
+            Tuple["up.model.Action", Tuple["up.model.FNode", ...]]
+        ],
+    ) -> Iterator[Tuple["up.model.Action", Tuple["up.model.FNode", ...]]]:
+        """
+        Returns a view over all the `action + parameters` that are applicable in the given `State`,
+        updating the applicable actions of the state that generated the given `state`.
+
+        When the given state is a :class:`~unified_planning.model.UPCompiledState` created by
+        this simulator, only the actions reading a fluent changed by the last `make_child`
+        are tested again; otherwise this method is equivalent to
+        :func:`~unified_planning.engines.UPSequentialSimulator.get_applicable_actions`.
+
+        IMPORTANT NOTE: Assumes that `parent_applicable_actions` are all and only the actions
+        applicable in the state from which the given `state` was created.
+
+        :param state: the `state` where the formulas are evaluated.
+        :param parent_applicable_actions: The actions applicable in the father of the given `state`.
+        :return: an `Iterator` of applicable actions + parameters.
+        """
+        changed_slots = None
+        if self._uses_compiled_layout(state):
+            changed_slots = cast(UPCompiledState, state).changed_slots
+        if changed_slots is None:
+            return self.get_applicable_actions(state)
+        successor_generator = self._get_successor_generator()
+        affected = successor_generator.affected(changed_slots)
+        if affected is None:
+            return self.get_applicable_actions(state)
+        return self._update_applicable_actions(
+            state, successor_generator, parent_applicable_actions, affected
+        )
+
+    def _update_applicable_actions(
+        self,
+        state: "up.model.State",
+        successor_generator: _SuccessorGenerator,
+        parent_applicable_actions: Iterable[
+            Tuple["up.model.Action", Tuple["up.model.FNode", ...]]
+        ],
+        affected: Set[int],
+    ) -> Iterator[Tuple["up.model.Action", Tuple["up.model.FNode", ...]]]:
+        action_ids = []
+        for action, params in parent_applicable_actions:
+            action_id = successor_generator.action_id(action, params)
+            assert action_id is not None, "Applicable action not grounded"
+            if action_id not in affected:
+                action_ids.append(action_id)
+        for action_id in affected:
+            action, params = successor_generator.actions[action_id]
+            if self._is_applicable(state, action, params):
+                action_ids.append(action_id)
+        action_ids.sort()
+        for action_id in action_ids:
+            yield successor_generator.actions[action_id]
+
     def get_unsatisfied_conditions(
         self,
         state: "up.model.State",
@@ -555,7 +1046,7 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
                                         "Conflicting effects should be caught above"
                                     )
 
-            if not isinstance(state, up.model.UPState):
+            if not isinstance(state, (UPState, UPCompiledState)):
                 raise UPUsageError(
                     f"The UPSequentialSimulator uses the UPState but {type(state).__name__} is given."
                 )
@@ -581,7 +1072,16 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
         :return: The list of all the `goals` that evaluated to `False` or the list containing the first `goal` evaluated to `False` if the flag `early_termination` is set.
         """
         unsatisfied_goals = []
-        for g in cast(up.model.Problem, self._problem).goals:
+        goals = cast(up.model.Problem, self._problem).goals
+        if self._compiled_goals is not None and self._uses_compiled_layout(state):
+            compiled_state = cast(UPCompiledState, state)
+            for g, compiled_goal in zip(goals, self._compiled_goals):
+                if not compiled_goal(compiled_state):
+                    unsatisfied_goals.append(g)
+                    if early_termination:
+                        break
+            return unsatisfied_goals
+        for g in goals:
             g_eval = self._se.evaluate(g, state).bool_constant_value()
             if not g_eval:
                 unsatisfied_goals.append(g)
@@ -593,6 +1093,9 @@ class UPSequentialSimulator(Engine, SequentialSimulatorMixin):
         """
         is_goal implementation
         """
+        if self._compiled_goals is not None and self._uses_compiled_layout(state):
+            compiled_state = cast(UPCompiledState, state)
+            return all(g(compiled_state) for g in self._compiled_goals)
         return len(self.get_unsatisfied_goals(state, early_termination=True)) == 0
 
     @property
@@ -33,9 +33,19 @@ class Environment:
     singleton objects that are used throughout the system,
     such as the :func:`ExpressionManager <unified_planning.Environment.expression_manager>`, :func:`TypeChecker <unified_planning.Environment.type_checker>`, :func:`Factory <unified_planning.Environment.factory>`, :func:`TypeManager <unified_planning.Environment.type_manager>`.
 
+    By default all the expressions ever created and the results memoized by the
+    singleton walkers are kept for the whole life of the `Environment`; an `Environment`
+    created with `bounded_memory=True` keeps the expressions only as long as they are
+    referenced elsewhere and clears the memoization of its walkers when it exceeds
+    `MEMOIZATION_LIMIT` results, so a long-lived `Environment` used for many
+    problems does not grow without bound. The memoization of the
+    :func:`nnf_converter <unified_planning.Environment.nnf_converter>` and of the
+    :func:`dnf_converter <unified_planning.Environment.dnf_converter>` is always bounded.
     """
 
-    def __init__(self):
+    MEMOIZATION_LIMIT = 2**16
+
+    def __init__(self, bounded_memory: bool = False):
         import unified_planning.model
         import unified_planning.engines
         import unified_planning.model.walkers
@@ -44,14 +54,36 @@ class Environment:
         self._type_manager = unified_planning.model.type_manager.TypeManager()
         self._factory = unified_planning.engines.Factory(self)
         self._tc = unified_planning.model.walkers.TypeChecker(self)
-        self._expression_manager = unified_planning.model.ExpressionManager(self)
+        self._expression_manager = unified_planning.model.ExpressionManager(
+            self, weak_interning=bounded_memory
+        )
         self._free_vars_oracle = unified_planning.model.FreeVarsOracle()
         self._simplifier = unified_planning.model.walkers.Simplifier(self)
         self._substituter = unified_planning.model.walkers.Substituter(self)
         self._free_vars_extractor = unified_planning.model.walkers.FreeVarsExtractor()
         self._names_extractor = unified_planning.model.walkers.NamesExtractor()
+        self._nnf_converter = unified_planning.model.walkers.Nnf(self)
+        self._dnf_converter = unified_planning.model.walkers.Dnf(self)
+        # the NNF and DNF of the expressions can be much larger than the expressions,
+        # so their memoization is always bounded
+        self._nnf_converter.memoization_limit = self.MEMOIZATION_LIMIT
+        self._dnf_converter.memoization_limit = self.MEMOIZATION_LIMIT
         self._credits_stream: Optional[IO[str]] = sys.stdout
         self._error_used_name: bool = True
+        self._bounded_memory = bounded_memory
+        self._compilation_cache: Optional[
+            "unified_planning.engines.CompilationCache"
+        ] = None
+        if bounded_memory:
+            for walker in (
+                self._tc,
+                self._free_vars_oracle,
+                self._simplifier,
+                self._substituter,
+                self._free_vars_extractor,
+                self._names_extractor,
+            ):
+                walker.memoization_limit = self.MEMOIZATION_LIMIT
 
     # The getstate and setstate method are needed in the Parallel engine. The
     #  Parallel engine creates a deep copy of the Environment instance in
@@ -69,6 +101,11 @@ class Environment:
         # Add _credits_stream back since it doesn't exist in the pickle
         self._credits_stream = None
 
+    @property
+    def bounded_memory(self) -> bool:
+        """Returns `True` if the expressions and the memoized results of this `Environment` are released when they are not used anymore."""
+        return self._bounded_memory
+
     @property
     def error_used_name(self) -> bool:
         return self._error_used_name
@@ -132,6 +169,35 @@ class Environment:
         """Returns the environment's `NamesExtractor`."""
         return self._names_extractor
 
+    @property
+    def nnf_converter(self) -> "unified_planning.model.walkers.Nnf":
+        """Returns the environment's `Nnf`, that memoizes the NNF of the sub-expressions."""
+        return self._nnf_converter
+
+    @property
+    def dnf_converter(self) -> "unified_planning.model.walkers.Dnf":
+        """Returns the environment's `Dnf`, that memoizes the DNF of the sub-expressions."""
+        return self._dnf_converter
+
+    @property
+    def compilation_cache(
+        self,
+    ) -> "Optional[unified_planning.engines.CompilationCache]":
+        """Returns the :class:`~unified_planning.engines.CompilationCache` used by the compilers on the problems of this `Environment`; None by default."""
+        return self._compilation_cache
+
+    @compilation_cache.setter
+    def compilation_cache(
+        self, new_cache: "Optional[unified_planning.engines.CompilationCache]"
+    ):
+        """
+        Sets the :class:`~unified_planning.engines.CompilationCache` used by the compilers
+        on the problems of this `Environment`; the results of the compilations are looked
+        up in the cache before compiling the problems and stored in it afterwards.
+        None disables the cache.
+        """
+        self._compilation_cache = new_cache
+
     @property
     def credits_stream(self) -> "Optional[IO[str]]":
         """Returns the stream where the :class:`Engines <unified_planning.engines.Engine>` :func:`credits <unified_planning.engines.Engine.get_credits>` are printed."""
@@ -17,9 +17,12 @@
 import unified_planning as up
 from abc import ABC, abstractmethod
 from typing import Optional
+from unified_planning.model.mixins.modifications_tracker import (
+    ModificationsTrackerMixin,
+)
 
 
-class AbstractProblem(ABC):
+class AbstractProblem(ModificationsTrackerMixin, ABC):
     """
     This is an abstract class that represents a generic `planning problem`.
 
@@ -32,6 +35,7 @@ class AbstractProblem(ABC):
         name: Optional[str] = None,
         environment: Optional["up.environment.Environment"] = None,
     ):
+        ModificationsTrackerMixin.__init__(self)
         self._env = up.environment.get_environment(environment)
         self._name = name
 
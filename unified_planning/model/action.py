@@ -272,6 +272,7 @@ class DurativeAction(Action, TimedCondsEffs):
             raise UPProblemDefinitionError(
                 f"{duration} is an empty interval duration of action: {self.name}."
             )
+        self._notify_modification()
         self._duration = duration
 
     def set_fixed_duration(self, value: "up.model.expression.NumericExpression"):
@@ -367,6 +368,7 @@ class DurativeAction(Action, TimedCondsEffs):
         return TimedCondsEffs.is_conditional(self)
 
     def clear_continuous_effects(self):
+        self._notify_modification()
         self._continuous_effects = {}
 
     def has_continuous_effects(self):
@@ -463,6 +465,7 @@ class DurativeAction(Action, TimedCondsEffs):
         assert (
             not continuous_effect.is_forall()
         ), "Continuous effects with forall variables are not supported yet"
+        self._notify_modification()
         self._continuous_effects.setdefault(interval, []).append(continuous_effect)
 
 
@@ -521,6 +524,7 @@ class SensingAction(InstantaneousAction):
 
         :param observed_fluent: The observed fluent that must be added.
         """
+        self._notify_modification()
         self._observed_fluents.append(observed_fluent)
 
     @property
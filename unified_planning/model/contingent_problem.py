@@ -78,6 +78,8 @@ class ContingentProblem(Problem):
         new_p = ContingentProblem(self._name, self._env)
         new_p._fluents = self._fluents[:]
         new_p._actions = [a.clone() for a in self._actions]
+        for action in new_p._actions:
+            new_p._track_element(action)
         new_p._user_types = self._user_types[:]
         new_p._user_types_hierarchy = self._user_types_hierarchy.copy()
         new_p._objects = self._objects[:]
@@ -117,6 +119,7 @@ class ContingentProblem(Problem):
         for f_exp in constraints:
             self._hidden_fluents.add(f_exp)
         self._oneof_initial_constraints.append(constraints)
+        self._notify_modification()
 
     def add_or_initial_constraint(
         self, fluents: Iterable[Union["up.model.fnode.FNode", "up.model.fluent.Fluent"]]
@@ -131,6 +134,7 @@ class ContingentProblem(Problem):
         for f_exp in constraints:
             self._hidden_fluents.add(f_exp)
         self._or_initial_constraints.append(constraints)
+        self._notify_modification()
 
     def add_unknown_initial_constraint(
         self, fluent: Union["up.model.fnode.FNode", "up.model.fluent.Fluent"]
@@ -146,6 +150,7 @@ class ContingentProblem(Problem):
         self._hidden_fluents.add(em.Not(fluent_exp))
         c = [em.Not(fluent_exp), fluent_exp]
         self._or_initial_constraints.append(c)
+        self._notify_modification()
 
     @property
     def kind(self) -> "up.model.problem_kind.ProblemKind":
@@ -27,8 +27,18 @@ from unified_planning.exceptions import (
     UPExpressionDefinitionError,
     UPValueError,
 )
+import weakref
 from fractions import Fraction
-from typing import Optional, Iterable, List, Union, Dict, Tuple, Iterator, Sequence
+from typing import (
+    Optional,
+    Iterable,
+    List,
+    Union,
+    Tuple,
+    Iterator,
+    Sequence,
+    MutableMapping,
+)
 
 BoolExpression = Union[
     "up.model.fnode.FNode",
@@ -78,11 +88,21 @@ def uniform_numeric_constant(value: NumericConstant) -> Union[Fraction, int]:
 class ExpressionManager(object):
     """ExpressionManager is responsible for the creation of all expressions."""
 
-    def __init__(self, environment: "up.environment.Environment"):
+    def __init__(
+        self, environment: "up.environment.Environment", weak_interning: bool = False
+    ):
+        """
+        Creates the `ExpressionManager` of the given `Environment`.
+
+        :param environment: The `Environment` of the created expressions.
+        :param weak_interning: If `True`, the created expressions are kept only as long as
+            they are referenced elsewhere; while an expression is alive, creating it again
+            still returns the same `FNode`.
+        """
         self.environment = environment
-        self.expressions: Dict[
+        self.expressions: MutableMapping[
             "up.model.fnode.FNodeContent", "up.model.fnode.FNode"
-        ] = {}
+        ] = (weakref.WeakValueDictionary() if weak_interning else {})
         self._next_free_id = 1
 
         self.true_expression = self.create_node(
@@ -93,6 +113,19 @@ class ExpressionManager(object):
         )
         return
 
+    # A WeakValueDictionary can't be pickled, so it is pickled as a dict
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if isinstance(self.expressions, weakref.WeakValueDictionary):
+            state["expressions"] = dict(self.expressions)
+            state["_weak_interning"] = True
+        return state
+
+    def __setstate__(self, state):
+        if state.pop("_weak_interning", False):
+            state["expressions"] = weakref.WeakValueDictionary(state["expressions"])
+        self.__dict__.update(state)
+
     def _polymorph_args_to_iterator(
         self, *args: Union[Expression, Iterable[Expression]]
     ) -> Iterator[Expression]:
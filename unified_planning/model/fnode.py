@@ -24,6 +24,41 @@ from fractions import Fraction
 
 FNodeContent = collections.namedtuple("FNodeContent", ["node_type", "args", "payload"])
 
+# The OperatorKinds are bound to module constants because looking up an Enum member
+# as an attribute of its class is several times slower than a global lookup, and the
+# `is_*` predicates are called in the hottest loops of the library.
+_BOOL_CONSTANT = OperatorKind.BOOL_CONSTANT
+_INT_CONSTANT = OperatorKind.INT_CONSTANT
+_REAL_CONSTANT = OperatorKind.REAL_CONSTANT
+_AND = OperatorKind.AND
+_OR = OperatorKind.OR
+_NOT = OperatorKind.NOT
+_IMPLIES = OperatorKind.IMPLIES
+_IFF = OperatorKind.IFF
+_EXISTS = OperatorKind.EXISTS
+_ALWAYS = OperatorKind.ALWAYS
+_SOMETIME = OperatorKind.SOMETIME
+_AT_MOST_ONCE = OperatorKind.AT_MOST_ONCE
+_SOMETIME_BEFORE = OperatorKind.SOMETIME_BEFORE
+_SOMETIME_AFTER = OperatorKind.SOMETIME_AFTER
+_FORALL = OperatorKind.FORALL
+_FLUENT_EXP = OperatorKind.FLUENT_EXP
+_PARAM_EXP = OperatorKind.PARAM_EXP
+_VARIABLE_EXP = OperatorKind.VARIABLE_EXP
+_OBJECT_EXP = OperatorKind.OBJECT_EXP
+_TIMING_EXP = OperatorKind.TIMING_EXP
+_PLUS = OperatorKind.PLUS
+_MINUS = OperatorKind.MINUS
+_TIMES = OperatorKind.TIMES
+_DIV = OperatorKind.DIV
+_EQUALS = OperatorKind.EQUALS
+_LE = OperatorKind.LE
+_LT = OperatorKind.LT
+_DOT = OperatorKind.DOT
+_CONSTANT_KINDS = frozenset(
+    (_BOOL_CONSTANT, _INT_CONSTANT, _REAL_CONSTANT, _OBJECT_EXP)
+)
+
 
 class FNode(object):
 
@@ -37,7 +72,7 @@ class FNode(object):
     be instantiated or modified by the user.
     """
 
-    __slots__ = ["_content", "_node_id", "_env"]
+    __slots__ = ["_content", "_node_id", "_env", "__weakref__"]
 
     def __init__(self, content: FNodeContent, node_id: int, environment: Environment):
         self._content = content
@@ -53,6 +88,14 @@ class FNode(object):
     def __hash__(self) -> int:
         return self._node_id
 
+    # The state is pickled as a tuple instead of the default dict of the slots, so the
+    # names of the slots are not repeated for every node
+    def __getstate__(self):
+        return (self._content, self._node_id, self._env)
+
+    def __setstate__(self, state):
+        self._content, self._node_id, self._env = state
+
     def get_nary_expression_string(self, op: str, args: List["FNode"]) -> str:
         p = []
         if len(args) > 0:
@@ -168,12 +211,7 @@ class FNode(object):
 
     def is_constant(self) -> bool:
         """Returns `True` if the expression is a constant, `False` otherwise."""
-        return (
-            self.node_type == OperatorKind.BOOL_CONSTANT
-            or self.node_type == OperatorKind.INT_CONSTANT
-            or self.node_type == OperatorKind.REAL_CONSTANT
-            or self.node_type == OperatorKind.OBJECT_EXP
-        )
+        return self._content.node_type in _CONSTANT_KINDS
 
     def constant_value(self) -> Union[bool, int, Fraction]:
         """Returns the constant value stored in this expression."""
@@ -259,15 +297,15 @@ class FNode(object):
 
     def is_bool_constant(self) -> bool:
         """Test whether the expression is a `boolean` constant."""
-        return self.node_type == OperatorKind.BOOL_CONSTANT
+        return self._content.node_type is _BOOL_CONSTANT
 
     def is_int_constant(self) -> bool:
         """Test whether the expression is an `integer` constant."""
-        return self.node_type == OperatorKind.INT_CONSTANT
+        return self._content.node_type is _INT_CONSTANT
 
     def is_real_constant(self) -> bool:
         """Test whether the expression is a `real` constant."""
-        return self.node_type == OperatorKind.REAL_CONSTANT
+        return self._content.node_type is _REAL_CONSTANT
 
     def is_true(self) -> bool:
         """Test whether the expression is the `True` Boolean constant."""
@@ -279,103 +317,103 @@ class FNode(object):
 
     def is_and(self) -> bool:
         """Test whether the node is the `And` operator."""
-        return self.node_type == OperatorKind.AND
+        return self._content.node_type is _AND
 
     def is_or(self) -> bool:
         """Test whether the node is the `Or` operator."""
-        return self.node_type == OperatorKind.OR
+        return self._content.node_type is _OR
 
     def is_not(self) -> bool:
         """Test whether the node is the `Not` operator."""
-        return self.node_type == OperatorKind.NOT
+        return self._content.node_type is _NOT
 
     def is_implies(self) -> bool:
         """Test whether the node is the `Implies` operator."""
-        return self.node_type == OperatorKind.IMPLIES
+        return self._content.node_type is _IMPLIES
 
     def is_iff(self) -> bool:
         """Test whether the node is the `Iff` operator."""
-        return self.node_type == OperatorKind.IFF
+        return self._content.node_type is _IFF
 
     def is_exists(self) -> bool:
         """Test whether the node is the `Exists` operator."""
-        return self.node_type == OperatorKind.EXISTS
+        return self._content.node_type is _EXISTS
 
     def is_always(self) -> bool:
         """Test whether the node is the Always constraint."""
-        return self.node_type == OperatorKind.ALWAYS
+        return self._content.node_type is _ALWAYS
 
     def is_sometime(self) -> bool:
         """Test whether the node is the Sometime constraint."""
-        return self.node_type == OperatorKind.SOMETIME
+        return self._content.node_type is _SOMETIME
 
     def is_at_most_once(self) -> bool:
         """Test whether the node is the At-Most-Once constraint."""
-        return self.node_type == OperatorKind.AT_MOST_ONCE
+        return self._content.node_type is _AT_MOST_ONCE
 
     def is_sometime_before(self) -> bool:
         """Test whether the node is the Sometime-Before constraint."""
-        return self.node_type == OperatorKind.SOMETIME_BEFORE
+        return self._content.node_type is _SOMETIME_BEFORE
 
     def is_sometime_after(self) -> bool:
         """Test whether the node is the Sometime-After constraint."""
-        return self.node_type == OperatorKind.SOMETIME_AFTER
+        return self._content.node_type is _SOMETIME_AFTER
 
     def is_forall(self) -> bool:
         """Test whether the node is the `Forall` operator."""
-        return self.node_type == OperatorKind.FORALL
+        return self._content.node_type is _FORALL
 
     def is_fluent_exp(self) -> bool:
         """Test whether the node is a :class:`~unified_planning.model.Fluent` Expression."""
-        return self.node_type == OperatorKind.FLUENT_EXP
+        return self._content.node_type is _FLUENT_EXP
 
     def is_parameter_exp(self) -> bool:
         """Test whether the node is an :func:`action parameter <unified_planning.model.Action.parameters>`."""
-        return self.node_type == OperatorKind.PARAM_EXP
+        return self._content.node_type is _PARAM_EXP
 
     def is_variable_exp(self) -> bool:
         """Test whether the node is a :class:`~unified_planning.model.Variable` Expression."""
-        return self.node_type == OperatorKind.VARIABLE_EXP
+        return self._content.node_type is _VARIABLE_EXP
 
     def is_object_exp(self) -> bool:
         """Test whether the node is an :class:`~unified_planning.model.Object` Expression."""
-        return self.node_type == OperatorKind.OBJECT_EXP
+        return self._content.node_type is _OBJECT_EXP
 
     def is_timing_exp(self) -> bool:
         """Test whether the node is a :class:`~unified_planning.model.Timing` Expression."""
-        return self.node_type == OperatorKind.TIMING_EXP
+        return self._content.node_type is _TIMING_EXP
 
     def is_plus(self) -> bool:
         """Test whether the node is the `Plus` operator."""
-        return self.node_type == OperatorKind.PLUS
+        return self._content.node_type is _PLUS
 
     def is_minus(self) -> bool:
         """Test whether the node is the `Minus` operator."""
-        return self.node_type == OperatorKind.MINUS
+        return self._content.node_type is _MINUS
 
     def is_times(self) -> bool:
         """Test whether the node is the `Times` operator."""
-        return self.node_type == OperatorKind.TIMES
+        return self._content.node_type is _TIMES
 
     def is_div(self) -> bool:
         """Test whether the node is the `Div` operator."""
-        return self.node_type == OperatorKind.DIV
+        return self._content.node_type is _DIV
 
     def is_equals(self) -> bool:
         """Test whether the node is the `Equals` operator."""
-        return self.node_type == OperatorKind.EQUALS
+        return self._content.node_type is _EQUALS
 
     def is_le(self) -> bool:
         """Test whether the node is the `LE` operator."""
-        return self.node_type == OperatorKind.LE
+        return self._content.node_type is _LE
 
     def is_lt(self) -> bool:
         """Test whether the node is the `LT` operator."""
-        return self.node_type == OperatorKind.LT
+        return self._content.node_type is _LT
 
     def is_dot(self) -> bool:
         """Test whether the node is the `DOT` operator."""
-        return self.node_type == OperatorKind.DOT
+        return self._content.node_type is _DOT
 
     #
     # Infix operators
@@ -77,6 +77,8 @@ class HierarchicalProblem(up.model.problem.Problem):
         new_p = HierarchicalProblem(self._name, self._env)
         new_p._fluents = self._fluents[:]
         new_p._actions = [a.clone() for a in self._actions]
+        for action in new_p._actions:
+            new_p._track_element(action)
         new_p._user_types = self._user_types[:]
         new_p._user_types_hierarchy = self._user_types_hierarchy.copy()
         new_p._objects = self._objects[:]
@@ -206,6 +208,7 @@ class HierarchicalProblem(up.model.problem.Problem):
             else:
                 warn(msg)
         self._abstract_tasks[task.name] = task
+        self._notify_modification()
         for param in task.parameters:
             if param.type.is_user_type():
                 self._add_user_type(param.type)
@@ -234,6 +237,7 @@ class HierarchicalProblem(up.model.problem.Problem):
             method.achieved_task.task.name in self._abstract_tasks
         ), f"Method is associated to an unregistered task '{method.achieved_task.task.name}'"
         self._methods[method.name] = method
+        self._notify_modification()
         for param in method.parameters:
             if param.type.is_user_type():
                 self._add_user_type(param.type)
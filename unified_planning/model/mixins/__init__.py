@@ -13,6 +13,10 @@
 # limitations under the License.
 #
 
+from unified_planning.model.mixins.modifications_tracker import (
+    ModificationCounter,
+    ModificationsTrackerMixin,
+)
 from unified_planning.model.mixins.actions_set import ActionsSetMixin
 from unified_planning.model.mixins.natural_transitions_set import (
     NaturalTransitionsSetMixin,
@@ -26,6 +30,8 @@ from unified_planning.model.mixins.initial_state import InitialStateMixin
 from unified_planning.model.mixins.metrics import MetricsMixin
 
 __all__ = [
+    "ModificationCounter",
+    "ModificationsTrackerMixin",
     "ActionsSetMixin",
     "NaturalTransitionsSetMixin",
     "TimeModelMixin",
@@ -17,9 +17,12 @@ from warnings import warn
 import unified_planning as up
 from unified_planning.exceptions import UPProblemDefinitionError, UPValueError
 from typing import Iterator, List, Iterable
+from unified_planning.model.mixins.modifications_tracker import (
+    ModificationsTrackerMixin,
+)
 
 
-class ActionsSetMixin:
+class ActionsSetMixin(ModificationsTrackerMixin):
     """
     This class is a mixin that contains a `set` of `actions` with some related methods.
 
@@ -47,6 +50,7 @@ class ActionsSetMixin:
     def clear_actions(self):
         """Removes all the `Problem` `Actions`."""
         self._actions = []
+        self._notify_modification()
 
     @property
     def instantaneous_actions(self) -> Iterator["up.model.action.InstantaneousAction"]:
@@ -145,6 +149,8 @@ class ActionsSetMixin:
             else:
                 warn(msg)
         self._actions.append(action)
+        self._track_element(action)
+        self._notify_modification()
         for param in action.parameters:
             if param.type.is_user_type():
                 self._add_user_type_method(param.type)
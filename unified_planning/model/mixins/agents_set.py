@@ -18,9 +18,12 @@ import unified_planning as up
 from unified_planning.model.types import _UserType
 from unified_planning.exceptions import UPProblemDefinitionError, UPValueError
 from typing import List, Dict, Optional, cast
+from unified_planning.model.mixins.modifications_tracker import (
+    ModificationsTrackerMixin,
+)
 
 
-class AgentsSetMixin:
+class AgentsSetMixin(ModificationsTrackerMixin):
     """
     This class is a mixin that contains a set of agents with some related methods.
 
@@ -51,6 +54,10 @@ class AgentsSetMixin:
                 else:
                     warn(msg)
             self._agents.append(agent)
+            self._track_element(agent)
+            for action in agent.actions:
+                self._track_element(action)
+            self._notify_modification()
 
     @property
     def agents(self) -> List["up.model.multi_agent.Agent"]:
@@ -18,9 +18,12 @@ import unified_planning as up
 from unified_planning.model.expression import ConstantExpression
 from unified_planning.exceptions import UPProblemDefinitionError, UPValueError
 from typing import Optional, List, Dict, Union, Iterable, Set
+from unified_planning.model.mixins.modifications_tracker import (
+    ModificationsTrackerMixin,
+)
 
 
-class FluentsSetMixin:
+class FluentsSetMixin(ModificationsTrackerMixin):
     """
     This class is a mixin that contains a `set` of `fluents` with some related methods.
 
@@ -145,6 +148,7 @@ class FluentsSetMixin:
             else:
                 warn(msg)
         self._fluents.append(fluent)
+        self._notify_modification()
         if not default_initial_value is None:
             (v_exp,) = self.environment.expression_manager.auto_promote(
                 default_initial_value
@@ -166,6 +170,7 @@ class FluentsSetMixin:
         """
         self._fluents = []
         self._fluents_defaults = {}
+        self._notify_modification()
 
     @property
     def fluents_defaults(
@@ -23,9 +23,12 @@ from unified_planning.exceptions import (
 from unified_planning.model.fluent import get_all_fluent_exp
 from unified_planning.model.mixins import ObjectsSetMixin, FluentsSetMixin
 from unified_planning.model.types import domain_size
+from unified_planning.model.mixins.modifications_tracker import (
+    ModificationsTrackerMixin,
+)
 
 
-class InitialStateMixin:
+class InitialStateMixin(ModificationsTrackerMixin):
     """A Problem mixin that allows setting and infering the value of fluents in the initial state."""
 
     def __init__(
@@ -38,6 +41,8 @@ class InitialStateMixin:
         self._fluent_set = fluent_set
         self._env = environment
         self._initial_value: Dict["up.model.fnode.FNode", "up.model.fnode.FNode"] = {}
+        # True if the _initial_value dict is shared with a clone and must be copied before being modified
+        self._shared_initial_value = False
 
     def set_initial_value(
         self,
@@ -61,6 +66,8 @@ class InitialStateMixin:
         assert fluent_exp.is_fluent_exp(), "fluent field must be a fluent"
         if not fluent_exp.type.is_compatible(value_exp.type):
             raise UPTypeError("Initial value assignment has not compatible types!")
+        self._notify_modification()
+        self._copy_shared_initial_value()
         self._initial_value[fluent_exp] = value_exp
 
     def initial_value(
@@ -90,9 +97,15 @@ class InitialStateMixin:
         """
         Gets the initial value of all the grounded fluents present in the `Problem`.
 
-        IMPORTANT NOTE: this property does a lot of computation, so it should be called as
-        seldom as possible.
+        The initial values are computed once and then reused until the `Problem` is
+        modified, so the returned `dict` must not be modified.
         """
+        return self._get_memoized("initial_values", self._compute_initial_values)
+
+    def _compute_initial_values(
+        self,
+    ) -> Dict["up.model.fnode.FNode", "up.model.fnode.FNode"]:
+        self._copy_shared_initial_value()
         res = self._initial_value
         for f in self._fluent_set.fluents:
             for f_exp in get_all_fluent_exp(self._object_set, f):
@@ -132,8 +145,16 @@ class InitialStateMixin:
     def __hash__(self):
         return sum(map(hash, self.initial_values.items()))
 
+    def _copy_shared_initial_value(self):
+        if self._shared_initial_value:
+            self._initial_value = self._initial_value.copy()
+            self._shared_initial_value = False
+
     def _clone_to(self, other: "InitialStateMixin"):
-        other._initial_value = self._initial_value.copy()
+        # the initial values are copied by the first problem modifying them
+        other._initial_value = self._initial_value
+        other._shared_initial_value = True
+        self._shared_initial_value = True
 
     def _fluents_with_undefined_values(self) -> List["up.model.fluent.Fluent"]:
         """Returns a list of fluents that have at least one undefined value in the initial state"""
@@ -18,9 +18,12 @@ from typing import Dict, List, Optional
 import unified_planning as up
 from unified_planning.model.metrics import PlanQualityMetric
 from unified_planning.model.mixins import ActionsSetMixin
+from unified_planning.model.mixins.modifications_tracker import (
+    ModificationsTrackerMixin,
+)
 
 
-class MetricsMixin:
+class MetricsMixin(ModificationsTrackerMixin):
     """Problem mixin that adds the capabilities to manage quality metrics."""
 
     def __init__(self, environment: "up.environment.Environment"):
@@ -39,6 +42,7 @@ class MetricsMixin:
                 "The added metric does not have the same environment of the MetricsMixin"
             )
         self._metrics.append(metric)
+        self._notify_modification()
 
     @property
     def quality_metrics(self) -> List["up.model.metrics.PlanQualityMetric"]:
@@ -48,6 +52,7 @@ class MetricsMixin:
     def clear_quality_metrics(self):
         """Removes all the `quality metrics` in the `Problem`."""
         self._metrics = []
+        self._notify_modification()
 
     def __eq__(self, other):
         if not isinstance(other, MetricsMixin):
@@ -0,0 +1,143 @@
+# Copyright 2021-2023 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+import weakref
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class ModificationCounter:
+    """
+    Counter of the modifications of a problem.
+
+    The counter is shared with the elements of the problem (like its `Actions`), so their
+    modifications are counted as modifications of the problem.
+    """
+
+    __slots__ = ["value"]
+
+    def __init__(self):
+        self.value = 0
+
+    def __getstate__(self):
+        return self.value
+
+    def __setstate__(self, state):
+        self.value = state
+
+
+class _CopyOnWriteObservers:
+    """Weak references to the elements sharing an element; they are not copied nor pickled."""
+
+    __slots__ = ["refs"]
+
+    def __init__(self):
+        self.refs: Dict[int, weakref.ref] = {}
+
+    def __reduce__(self):
+        return (_CopyOnWriteObservers, ())
+
+
+class ModificationsTrackerMixin:
+    """
+    This class is a mixin for the elements that count their modifications, so that
+    the results computed from their content can be memoized until the next modification.
+
+    Every element notifies its modifications to its own `ModificationCounter` and to the
+    ones of the elements containing it (for example the `Problems` containing an `Action`).
+
+    NOTE: when this mixin is used in combination with other mixins extending it, only
+    the class combining them must call its constructor.
+    """
+
+    def __init__(self):
+        self._modification_counter = ModificationCounter()
+        self._modification_counters: List[ModificationCounter] = [
+            self._modification_counter
+        ]
+        self._memoized_views: Dict[str, Tuple[int, Any]] = {}
+        self._copy_on_write_observers = _CopyOnWriteObservers()
+
+    def _notify_modification(self):
+        """
+        Increases all the `ModificationCounters` of this element; it must be called by
+        every method modifying this element, before modifying it.
+
+        The elements sharing this element copy it before the modification, see
+        :func:`_add_copy_on_write_observer`.
+        """
+        refs = self._copy_on_write_observers.refs
+        if refs:
+            observers = [ref() for ref in refs.values()]
+            refs.clear()
+            for observer in observers:
+                if observer is not None:
+                    observer._copy_shared_elements()
+        for counter in self._modification_counters:
+            counter.value += 1
+
+    def _add_modification_counter(self, counter: ModificationCounter):
+        """Adds the given counter to the ones increased by the modifications of this element."""
+        if all(c is not counter for c in self._modification_counters):
+            self._modification_counters.append(counter)
+
+    def _track_element(self, element: "ModificationsTrackerMixin"):
+        """Makes the modifications of the given element count as modifications of this element."""
+        for counter in self._modification_counters:
+            element._add_modification_counter(counter)
+
+    def _get_memoized(self, key: str, compute: Callable[[], Any]) -> Any:
+        """
+        Returns the result of `compute`, reusing the one stored with the given `key` if
+        this element was not modified since it was computed.
+
+        :param key: The name of the memoized result.
+        :param compute: The function computing the result from the content of this element.
+        :return: The result of `compute`; it is shared between the calls, so it must not
+            be modified.
+        """
+        version = self._modification_counter.value
+        memoized = self._memoized_views.get(key, None)
+        if memoized is not None and memoized[0] == version:
+            return memoized[1]
+        value = compute()
+        self._memoized_views[key] = (version, value)
+        return value
+
+    def _copy_memoized_to(self, other: "ModificationsTrackerMixin", *keys: str):
+        """Copies the up-to-date results memoized with the given `keys` to the given element, that must have the same content of this element."""
+        version = self._modification_counter.value
+        for key in keys:
+            memoized = self._memoized_views.get(key, None)
+            if memoized is not None and memoized[0] == version:
+                other._memoized_views[key] = (
+                    other._modification_counter.value,
+                    memoized[1],
+                )
+
+    def _add_copy_on_write_observer(self, observer: "ModificationsTrackerMixin"):
+        """
+        Makes the given element call its `_copy_shared_elements` method before the next
+        modification of this element; the given element is weakly referenced.
+        """
+        refs = self._copy_on_write_observers.refs
+        key = id(observer)
+        refs[key] = weakref.ref(observer, lambda _: refs.pop(key, None))
+
+    def _copy_shared_elements(self):
+        """
+        Replaces the elements this element shares with other ones with copies, so they
+        can be modified independently; by default no element is shared.
+        """
+        pass
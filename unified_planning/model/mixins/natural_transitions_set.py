@@ -17,9 +17,12 @@ from warnings import warn
 import unified_planning as up
 from unified_planning.exceptions import UPProblemDefinitionError, UPValueError
 from typing import Iterator, List, Iterable, Union
+from unified_planning.model.mixins.modifications_tracker import (
+    ModificationsTrackerMixin,
+)
 
 
-class NaturalTransitionsSetMixin:
+class NaturalTransitionsSetMixin(ModificationsTrackerMixin):
     """
     This class is a mixin that contains a `set` of `natural_transitions` with some related methods.
 
@@ -67,10 +70,12 @@ class NaturalTransitionsSetMixin:
     def clear_events(self):
         """Removes all the `Problem` `Events`."""
         self._events = []
+        self._notify_modification()
 
     def clear_processes(self):
         """Removes all the `Problem` `Processes`."""
         self._processes = []
+        self._notify_modification()
 
     def process(self, name: str) -> "up.model.natural_transition.Process":
         """
@@ -140,6 +145,8 @@ class NaturalTransitionsSetMixin:
             else:
                 warn(msg)
         self._processes.append(process)
+        self._track_element(process)
+        self._notify_modification()
         for param in process.parameters:
             if param.type.is_user_type():
                 self._add_user_type_method(param.type)
@@ -162,6 +169,8 @@ class NaturalTransitionsSetMixin:
             else:
                 warn(msg)
         self._events.append(event)
+        self._track_element(event)
+        self._notify_modification()
         for param in event.parameters:
             if param.type.is_user_type():
                 self._add_user_type_method(param.type)
@@ -17,10 +17,13 @@ from warnings import warn
 import unified_planning as up
 from unified_planning.model.types import _UserType
 from unified_planning.exceptions import UPProblemDefinitionError, UPValueError
-from typing import Iterator, List, Union, Optional, cast, Iterable
+from typing import Dict, Iterator, List, Tuple, Union, Optional, cast, Iterable
+from unified_planning.model.mixins.modifications_tracker import (
+    ModificationsTrackerMixin,
+)
 
 
-class ObjectsSetMixin:
+class ObjectsSetMixin(ModificationsTrackerMixin):
     """
     This class is a mixin that contains a `set` of `objects` with some related methods.
 
@@ -34,6 +37,15 @@ class ObjectsSetMixin:
         self._add_user_type_method = add_user_type_method
         self._has_name_method = has_name_method
         self._objects: List["up.model.object.Object"] = []
+        # indexes of the objects by name and by type (including the objects of the
+        # heirs), updated lazily from the _objects list
+        self._indexed_objects: List["up.model.object.Object"] = self._objects
+        self._indexed_objects_count = 0
+        self._objects_by_name: Dict[str, "up.model.object.Object"] = {}
+        self._objects_by_type: Dict[
+            "up.model.types.Type",
+            Tuple[List["up.model.object.Object"], List["up.model.fnode.FNode"]],
+        ] = {}
 
     @property
     def environment(self) -> "up.environment.Environment":
@@ -80,6 +92,7 @@ class ObjectsSetMixin:
             else:
                 warn(msg)
         self._objects.append(obj)
+        self._notify_modification()
         if obj.type.is_user_type():
             self._add_user_type_method(obj.type)
         return obj
@@ -99,10 +112,11 @@ class ObjectsSetMixin:
 
         :param name: The `name` of the target `object` in the `problem`.
         """
-        for o in self._objects:
-            if o.name == name:
-                return o
-        raise UPValueError(f"Object of name: {name} is not defined!")
+        self._update_objects_indexes()
+        obj = self._objects_by_name.get(name, None)
+        if obj is None:
+            raise UPValueError(f"Object of name: {name} is not defined!")
+        return obj
 
     def has_object(self, name: str) -> bool:
         """
@@ -113,10 +127,8 @@ class ObjectsSetMixin:
         :return: `True` if an `object` with the given `name` is in the `problem`,
                 `False` otherwise.
         """
-        for o in self._objects:
-            if o.name == name:
-                return True
-        return False
+        self._update_objects_indexes()
+        return name in self._objects_by_name
 
     def objects(
         self, typename: "up.model.types.Type"
@@ -129,9 +141,54 @@ class ObjectsSetMixin:
         :return: A generator of all the `objects` in the `problem` that are compatible with the
             given `type`.
         """
-        for obj in self._objects:
-            if cast(_UserType, obj.type).is_subtype(typename):
-                yield obj
+        return iter(self._type_domain(typename)[0])
+
+    def _type_domain(
+        self, typename: "up.model.types.Type"
+    ) -> Tuple[List["up.model.object.Object"], List["up.model.fnode.FNode"]]:
+        """
+        Returns the `objects` compatible with the given `Type`, in the order they were
+        added to the `problem`, and the corresponding `ObjectExp` expressions.
+
+        The returned lists are kept up to date when `objects` are added, so they must
+        not be modified.
+
+        :param typename: The target `type` of the `objects` that are retrieved.
+        :return: The `list` of the `objects` compatible with the given `type` and the
+            `list` of their expressions.
+        """
+        self._update_objects_indexes()
+        domain = self._objects_by_type.get(typename, None)
+        if domain is None:
+            objects = [
+                o for o in self._objects if cast(_UserType, o.type).is_subtype(typename)
+            ]
+            object_exp = self._env.expression_manager.ObjectExp
+            domain = (objects, [object_exp(o) for o in objects])
+            self._objects_by_type[typename] = domain
+        return domain
+
+    def _update_objects_indexes(self):
+        """Adds the `objects` added since the last call to the indexes; if the `objects` list was replaced, the indexes are rebuilt."""
+        objects = self._objects
+        if objects is not self._indexed_objects or (
+            len(objects) < self._indexed_objects_count
+        ):
+            self._indexed_objects = objects
+            self._indexed_objects_count = 0
+            self._objects_by_name = {}
+            self._objects_by_type = {}
+        if len(objects) == self._indexed_objects_count:
+            return
+        object_exp = self._env.expression_manager.ObjectExp
+        for obj in objects[self._indexed_objects_count :]:
+            self._objects_by_name.setdefault(obj.name, obj)
+            obj_type = cast(_UserType, obj.type)
+            for t, (domain_objects, domain_exps) in self._objects_by_type.items():
+                if obj_type.is_subtype(t):
+                    domain_objects.append(obj)
+                    domain_exps.append(object_exp(obj))
+        self._indexed_objects_count = len(objects)
 
     @property
     def all_objects(self) -> List["up.model.object.Object"]:
@@ -17,9 +17,12 @@ from decimal import Decimal
 from fractions import Fraction
 from unified_planning.exceptions import UPProblemDefinitionError
 from typing import Optional, Union
+from unified_planning.model.mixins.modifications_tracker import (
+    ModificationsTrackerMixin,
+)
 
 
-class TimeModelMixin:
+class TimeModelMixin(ModificationsTrackerMixin):
     """
     This class defines the problem's mixin for the epsilon separation and the
     time-kind, that can be continuous or discrete.
@@ -65,6 +68,7 @@ class TimeModelMixin:
             if new_value < 0:
                 raise UPProblemDefinitionError("The epsilon must be a positive value!")
         self._epsilon = new_value
+        self._notify_modification()
 
     @property
     def discrete_time(self) -> bool:
@@ -74,6 +78,7 @@ class TimeModelMixin:
     @discrete_time.setter
     def discrete_time(self, new_value: bool):
         self._discrete_time = new_value
+        self._notify_modification()
 
     @property
     def self_overlapping(self) -> bool:
@@ -86,6 +91,7 @@ class TimeModelMixin:
     @self_overlapping.setter
     def self_overlapping(self, new_value: bool):
         self._self_overlapping = new_value
+        self._notify_modification()
 
     def _clone_to(self, other: "TimeModelMixin"):
         other.epsilon = self._epsilon
@@ -20,12 +20,16 @@ import unified_planning as up
 from unified_planning.environment import Environment, get_environment
 from unified_planning.exceptions import UPTypeError, UPUsageError
 from unified_planning.model.timing import Timing
+from unified_planning.model.mixins.modifications_tracker import (
+    ModificationsTrackerMixin,
+)
 
 
-class TimedCondsEffs:
+class TimedCondsEffs(ModificationsTrackerMixin):
     """A set of timed conditions of effects."""
 
     def __init__(self, _env: Optional[Environment] = None):
+        ModificationsTrackerMixin.__init__(self)
         self._environment = get_environment(_env)
         self._conditions: Dict[
             "up.model.timing.TimeInterval", List["up.model.fnode.FNode"]
@@ -118,6 +122,7 @@ class TimedCondsEffs:
 
     def clear_conditions(self):
         """Removes all `conditions`."""
+        self._notify_modification()
         self._conditions = {}
 
     @property
@@ -131,6 +136,7 @@ class TimedCondsEffs:
 
     def clear_effects(self):
         """Removes all `effects` from the `Action`."""
+        self._notify_modification()
         self._effects = {}
         self._fluents_assigned = {}
         self._fluents_inc_dec = {}
@@ -201,6 +207,7 @@ class TimedCondsEffs:
             interval = up.model.TimePointInterval(timing)  # and from Timing to Interval
         (condition_exp,) = self._environment.expression_manager.auto_promote(condition)
         assert self._environment.type_checker.get_type(condition_exp).is_bool_type()
+        self._notify_modification()
         conditions = self._conditions.setdefault(interval, [])
         if condition_exp not in conditions:
             conditions.append(condition_exp)
@@ -210,6 +217,7 @@ class TimedCondsEffs:
         interval: "up.model.timing.TimeInterval",
         conditions: List["up.model.fnode.FNode"],
     ):
+        self._notify_modification()
         self._conditions[interval] = conditions
 
     def add_effect(
@@ -354,6 +362,7 @@ class TimedCondsEffs:
         assert (
             self._environment == effect.environment
         ), "effect does not have the same environment of the action"
+        self._notify_modification()
         fluents_assigned = self._fluents_assigned.setdefault(timing, {})
         fluents_inc_dec = self._fluents_inc_dec.setdefault(timing, set())
         simulated_effect = self._simulated_effects.get(timing, None)
@@ -396,4 +405,5 @@ class TimedCondsEffs:
             raise UPUsageError(
                 "The added SimulatedEffect does not have the same environment of the Action"
             )
+        self._notify_modification()
         self._simulated_effects[timing] = simulated_effect
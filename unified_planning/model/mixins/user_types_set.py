@@ -18,9 +18,12 @@ import unified_planning as up
 from unified_planning.model.types import _UserType
 from unified_planning.exceptions import UPProblemDefinitionError, UPValueError
 from typing import List, Dict, Optional, cast
+from unified_planning.model.mixins.modifications_tracker import (
+    ModificationsTrackerMixin,
+)
 
 
-class UserTypesSetMixin:
+class UserTypesSetMixin(ModificationsTrackerMixin):
     """
     This class is a mixin that contains a `set` of `user types` with some related methods.
 
@@ -54,6 +57,7 @@ class UserTypesSetMixin:
             if ut.father is not None:
                 self._add_user_type(ut.father)
             self._user_types.append(type)
+            self._notify_modification()
 
     @property
     def user_types(self) -> List["up.model.types.Type"]:
@@ -16,6 +16,7 @@
 
 import unified_planning as up
 from unified_planning.model.mixins import (
+    ModificationsTrackerMixin,
     ActionsSetMixin,
     FluentsSetMixin,
 )
@@ -37,6 +38,7 @@ class Agent(
         name: str,
         ma_problem: "up.model.multi_agent.ma_problem.MultiAgentProblem",
     ):
+        ModificationsTrackerMixin.__init__(self)
         FluentsSetMixin.__init__(
             self,
             ma_problem.environment,
@@ -122,6 +124,7 @@ class Agent(
             **kwargs,
         )
         self._public_fluents.append(fluent)
+        self._notify_modification()
         return fluent
 
     def add_private_fluent(
@@ -204,6 +207,7 @@ class Agent(
         if goal_exp != self._env.expression_manager.TRUE():
             if goal_exp not in goal_list:
                 goal_list.append(goal_exp)
+                self._notify_modification()
 
         return goal_exp
 
@@ -249,6 +253,7 @@ class Agent(
         """Removes all the `goals` from the `Agent`."""
         self._private_goals = []
         self._public_goals = []
+        self._notify_modification()
 
     def __repr__(self) -> str:
         s = []
@@ -15,6 +15,7 @@
 """This module defines an ma_environment class."""
 import unified_planning as up
 from unified_planning.model.mixins import (
+    ModificationsTrackerMixin,
     FluentsSetMixin,
 )
 
@@ -30,6 +31,7 @@ class MAEnvironment(
         self,
         ma_problem: "up.model.multi_agent.ma_problem.MultiAgentProblem",
     ):
+        ModificationsTrackerMixin.__init__(self)
         FluentsSetMixin.__init__(
             self,
             ma_problem.environment,
@@ -62,6 +62,7 @@ class MultiAgentProblem(  # type: ignore[misc]
 
         self._initial_defaults = initial_defaults
         self._env_ma = up.model.multi_agent.ma_environment.MAEnvironment(self)
+        self._track_element(self._env_ma)
         self._goals: List["up.model.fnode.FNode"] = list()
         self._initial_value: Dict["up.model.fnode.FNode", "up.model.fnode.FNode"] = {}
         self._operators_extractor = up.model.walkers.OperatorsExtractor()
@@ -147,6 +148,10 @@ class MultiAgentProblem(  # type: ignore[misc]
             self.ma_environment._fluents_defaults.copy()
         )
         new_p._agents = [ag.clone(new_p) for ag in self._agents]
+        for ag in new_p._agents:
+            new_p._track_element(ag)
+            for action in ag.actions:
+                new_p._track_element(action)
         new_p._user_types = self._user_types[:]
         new_p._user_types_hierarchy = self._user_types_hierarchy.copy()
         new_p._objects = self._objects[:]
@@ -212,6 +217,7 @@ class MultiAgentProblem(  # type: ignore[misc]
         if not fluent_exp.type.is_compatible(value_exp.type):
             raise UPTypeError("Initial value assignment has not compatible types!")
         self._initial_value[fluent_exp] = value_exp
+        self._notify_modification()
 
     def initial_value(
         self, fluent: Union["up.model.fnode.FNode", "up.model.fluent.Fluent"]
@@ -298,6 +304,7 @@ class MultiAgentProblem(  # type: ignore[misc]
         ).is_bool_type(), "A goal must be a boolean expression"
         if goal_exp != self._env.expression_manager.TRUE():
             self._goals.append(goal_exp)
+            self._notify_modification()
 
     def add_goals(
         self,
@@ -319,10 +326,12 @@ class MultiAgentProblem(  # type: ignore[misc]
     def clear_goals(self):
         """Removes all the `goals` from the `MultiAgentProblem`."""
         self._goals = []
+        self._notify_modification()
 
     def clear_agents(self):
         """Removes all the `goals` from the `MultiAgentProblem`."""
         self._agents = []
+        self._notify_modification()
 
     @property
     def kind(self) -> "up.model.problem_kind.ProblemKind":
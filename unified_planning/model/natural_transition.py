@@ -125,6 +125,7 @@ class Process(NaturalTransition):
 
     def clear_effects(self):
         """Removes all the `Process's effects`."""
+        self._notify_modification()
         self._effects = []
         self._fluents_assigned = {}
         self._fluents_inc_dec = set()
@@ -134,6 +135,7 @@ class Process(NaturalTransition):
             effect.environment == self._environment
         ), "effect does not have the same environment of the Process"
 
+        self._notify_modification()
         self._effects.append(effect)
 
     def _add_continuous_effect(
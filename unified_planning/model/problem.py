@@ -107,6 +107,8 @@ class Problem(  # type: ignore[misc]
         self._fluents_inc_dec: Dict[
             "up.model.timing.Timing", Set["up.model.fnode.FNode"]
         ] = {}
+        # map from the id to the transitions shared with the problem this one is cloned from
+        self._shared_transitions: Dict[int, "up.model.transition.Transition"] = {}
 
     def __repr__(self) -> str:
         s = []
@@ -121,15 +123,15 @@ class Problem(  # type: ignore[misc]
         s.extend(map(custom_str, self.fluents))
         s.append("]\n\n")
         s.append("actions = [\n")
-        s.extend(map(custom_str, self.actions))
+        s.extend(map(custom_str, self._actions))
         s.append("]\n\n")
-        if len(self.processes) > 0:
+        if len(self._processes) > 0:
             s.append("processes = [\n")
-            s.extend(map(custom_str, self.processes))
+            s.extend(map(custom_str, self._processes))
             s.append("]\n\n")
-        if len(self.events) > 0:
+        if len(self._events) > 0:
             s.append("events = [\n")
-            s.extend(map(custom_str, self.events))
+            s.extend(map(custom_str, self._events))
             s.append("]\n\n")
         if len(self.user_types) > 0:
             s.append("objects = [\n")
@@ -241,6 +243,15 @@ class Problem(  # type: ignore[misc]
         return res
 
     def clone(self):
+        """
+        Returns an equivalent `Problem`.
+
+        The clone is copy-on-write: the `Actions`, `Events` and `Processes` are shared with
+        this `Problem` until the clone or one of them is modified, when the clone copies
+        them. So the transitions read from a clone that was not modified are the ones of
+        this `Problem`, and modifying them modifies this `Problem`. The initial values are
+        copied by the first `Problem` setting one of them.
+        """
         new_p = Problem(self._name, self._env)
         UserTypesSetMixin._clone_to(self, new_p)
         ObjectsSetMixin._clone_to(self, new_p)
@@ -248,9 +259,12 @@ class Problem(  # type: ignore[misc]
         InitialStateMixin._clone_to(self, new_p)
         TimeModelMixin._clone_to(self, new_p)
 
-        new_p._actions = [a.clone() for a in self._actions]
-        new_p._events = [a.clone() for a in self._events]
-        new_p._processes = [a.clone() for a in self._processes]
+        new_p._actions = self._actions[:]
+        new_p._events = self._events[:]
+        new_p._processes = self._processes[:]
+        for transition in chain(self._actions, self._events, self._processes):
+            new_p._shared_transitions[id(transition)] = transition
+            transition._add_copy_on_write_observer(new_p)
         new_p._timed_effects = {
             t: [e.clone() for e in el] for t, el in self._timed_effects.items()
         }
@@ -261,10 +275,46 @@ class Problem(  # type: ignore[misc]
             t: d.copy() for t, d in self._fluents_assigned.items()
         }
 
-        # last as it requires actions to be cloned already
-        MetricsMixin._clone_to(self, new_p, new_actions=new_p)
+        # the metrics are cloned with the shared actions
+        new_p._metrics = self._metrics[:]
+        self._copy_memoized_to(new_p, "kind", "static_and_unused_fluents")
         return new_p
 
+    def _notify_modification(self):
+        # a modified clone stops sharing the transitions, so they can be modified in place
+        self._copy_shared_elements()
+        super()._notify_modification()
+
+    def _copy_shared_elements(self):
+        shared = self._shared_transitions
+        if not shared:
+            return
+        self._shared_transitions = {}
+        copies: Dict[int, "up.model.transition.Transition"] = {}
+
+        def copy(transition):
+            if shared.get(id(transition), None) is not transition:
+                return transition
+            new_transition = copies.get(id(transition), None)
+            if new_transition is None:
+                new_transition = transition.clone()
+                self._track_element(new_transition)
+                copies[id(transition)] = new_transition
+            return new_transition
+
+        self._actions = [copy(a) for a in self._actions]
+        self._events = [copy(e) for e in self._events]
+        self._processes = [copy(p) for p in self._processes]
+        # the shared actions in the metrics are replaced with their copies
+        for i, m in enumerate(self._metrics):
+            if isinstance(m, up.model.metrics.MinimizeActionCosts):
+                self._metrics[i] = up.model.metrics.MinimizeActionCosts(
+                    {copy(a): c for a, c in m.costs.items()},
+                    default=m.default,
+                    environment=self._env,
+                )
+        self._memoized_views.pop("causal_graph", None)
+
     def has_name(self, name: str) -> bool:
         """
         Returns `True` if the given `name` is already in the `Problem`, `False` otherwise.
@@ -395,13 +445,21 @@ class Problem(  # type: ignore[misc]
         appear in the :func:`fluent <unified_planning.model.Effect.fluent>` field of an `Effect`, therefore there are no :func:`Actions <unified_planning.model.Problem.actions>`
         in the `Problem` that can change their value.
         """
-        return self._get_static_and_unused_fluents()[0]
+        return set(
+            self._get_memoized(
+                "static_and_unused_fluents", self._get_static_and_unused_fluents
+            )[0]
+        )
 
     def get_unused_fluents(self) -> Set["up.model.fluent.Fluent"]:
         """
         Returns the set of `fluents` that are never used in the problem.
         """
-        return self._get_static_and_unused_fluents()[1]
+        return set(
+            self._get_memoized(
+                "static_and_unused_fluents", self._get_static_and_unused_fluents
+            )[1]
+        )
 
     @property
     def timed_goals(
@@ -438,10 +496,12 @@ class Problem(  # type: ignore[misc]
         goals = self._timed_goals.setdefault(interval, [])
         if goal_exp not in goals:
             goals.append(goal_exp)
+            self._notify_modification()
 
     def clear_timed_goals(self):
         """Removes all the `timed goals` from the `Problem`."""
         self._timed_goals = {}
+        self._notify_modification()
 
     @property
     def timed_effects(
@@ -589,12 +649,14 @@ class Problem(  # type: ignore[misc]
             "problem",
         )
         self._timed_effects.setdefault(timing, []).append(effect)
+        self._notify_modification()
 
     def clear_timed_effects(self):
         """Removes all the `timed effects` from the `Problem`."""
         self._timed_effects = {}
         self._fluents_assigned = {}
         self._fluents_inc_dec = {}
+        self._notify_modification()
 
     @property
     def goals(self) -> List["up.model.fnode.FNode"]:
@@ -617,10 +679,12 @@ class Problem(  # type: ignore[misc]
         assert self._env.type_checker.get_type(goal_exp).is_bool_type()
         if goal_exp != self._env.expression_manager.TRUE():
             self._goals.append(goal_exp)
+            self._notify_modification()
 
     def clear_goals(self):
         """Removes all the `goals` from the `Problem`."""
         self._goals = []
+        self._notify_modification()
 
     @property
     def trajectory_constraints(self) -> List["up.model.fnode.FNode"]:
@@ -655,10 +719,12 @@ class Problem(  # type: ignore[misc]
                 or constraint.is_always()
             ), "trajectory constraint not in the correct form"
         self._trajectory_constraints.append(constraint.simplify())
+        self._notify_modification()
 
     def clear_trajectory_constraints(self):
         """Removes the trajectory_constraints."""
         self._trajectory_constraints = []
+        self._notify_modification()
 
     @property
     def state_invariants(self) -> List["up.model.fnode.FNode"]:
@@ -714,9 +780,9 @@ class Problem(  # type: ignore[misc]
         for goal in chain(*self._timed_goals.values(), self._goals):
             factory.update_problem_kind_expression(goal)
         factory.update_problem_kind_initial_state(self)
-        if len(list(self.processes)) > 0:
+        if len(self._processes) > 0:
             factory.kind.set_time("PROCESSES")
-        if len(list(self.events)) > 0:
+        if len(self._events) > 0:
             factory.kind.set_time("EVENTS")
 
         return factory
@@ -727,10 +793,12 @@ class Problem(  # type: ignore[misc]
         Calculates and returns the `problem kind` of this `planning problem`.
         If the `Problem` is modified, this method must be called again in order to be reliable.
 
-        IMPORTANT NOTE: this property does a lot of computation, so it should be called as
-        seldom as possible.
+        The `problem kind` is computed once and then reused until the `Problem` (or one
+        of its `Actions`, `Processes` or `Events`) is modified.
         """
-        return self._kind_factory().finalize()
+        return self._get_memoized(
+            "kind", lambda: self._kind_factory().finalize()
+        ).clone()
 
 
 class _KindFactory:
@@ -1239,7 +1307,25 @@ def generate_causal_graph(
         the first node to the second; every element of the set is composed by 2 elements, the
         first one is the lifted action, the second one is the tuple of parameters used to ground
         the action.
+
+    The causal graph is computed once and then reused until the problem is modified.
     """
+    graph, edge_actions = problem._get_memoized(
+        "causal_graph", lambda: _compute_causal_graph(problem)
+    )
+    return graph.copy(), {edge: set(ais) for edge, ais in edge_actions.items()}
+
+
+def _compute_causal_graph(
+    problem: Problem,
+) -> Tuple[
+    nx.DiGraph,
+    Dict[
+        Tuple["up.model.fnode.FNode", "up.model.fnode.FNode"],
+        Set["up.plans.ActionInstance"],
+    ],
+]:
+    """Computes the result of :func:`~unified_planning.model.generate_causal_graph`."""
     if isinstance(
         problem, (up.model.htn.HierarchicalProblem, up.model.ContingentProblem)
     ):
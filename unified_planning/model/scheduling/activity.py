@@ -112,6 +112,7 @@ class Activity(Chronicle):
                 f"{duration} is an empty interval duration of action: {self.name}."
             )
         self._duration = duration
+        self._notify_modification()
 
     def uses(self, resource: Union[Fluent, FNode], amount: NumericExpression = 1):
         """Asserts that the activity borrows a given amount (1 by default) of the resource.
@@ -140,6 +140,7 @@ class Chronicle(TimedCondsEffs):
             raise ValueError(f"Name '{name}' already used in chronicle '{self.name}'")
         param = Parameter(scoped_name, tpe)
         self._parameters[name] = param
+        self._notify_modification()
         return param
 
     def get_parameter(self, name: str) -> Parameter:
@@ -173,6 +174,7 @@ class Chronicle(TimedCondsEffs):
         assert self._environment.type_checker.get_type(constraint_exp).is_bool_type()
         if constraint_exp not in self._constraints:
             self._constraints.append(constraint_exp)
+            self._notify_modification()
 
     @property
     def constraints(self) -> List[FNode]:
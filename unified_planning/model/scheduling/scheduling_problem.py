@@ -86,6 +86,7 @@ class SchedulingProblem(  # type: ignore[misc]
 
         # the base chronicle contains all timed goals and timed effects
         self._base: Chronicle = Chronicle(":", _env=environment)
+        self._track_element(self._base)
         self._activities: List[Activity] = []
 
         self._metrics: List["up.model.metrics.PlanQualityMetric"] = []
@@ -217,6 +218,9 @@ class SchedulingProblem(  # type: ignore[misc]
 
         new_p._base = self._base.clone()
         new_p._activities = [a.clone() for a in self._activities]
+        new_p._track_element(new_p._base)
+        for activity in new_p._activities:
+            new_p._track_element(activity)
         return new_p
 
     def add_variable(self, name: str, tpe: Type) -> Parameter:
@@ -244,6 +248,8 @@ class SchedulingProblem(  # type: ignore[misc]
             raise ValueError(f"An activity with name '{name}' already exists.")
         act = Activity(name=name, duration=duration)
         self._activities.append(act)
+        self._track_element(act)
+        self._notify_modification()
         return act
 
     @property
@@ -14,9 +14,11 @@
 #
 
 from abc import ABC, abstractmethod
+from array import array
+from fractions import Fraction
 from functools import reduce
 from operator import xor
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union, cast
 import unified_planning as up
 from unified_planning.exceptions import UPUsageError, UPValueError
 
@@ -159,3 +161,323 @@ class UPState(State):
             return UPState(complete_values)
         # Otherwise just return a new UPState with self as ancestor
         return UPState(updated_values, self)
+
+
+class StateLayout:
+    """
+    Slot table used by the :class:`~unified_planning.model.UPCompiledState`.
+
+    Every grounded fluent expression is indexed once in one of three tables,
+    depending on its type:
+
+    * boolean fluents are mapped to a bit of an integer bitset;
+    * numeric fluents are mapped to a position of a tuple of exact numbers;
+    * user-type fluents are mapped to a position of an `array` of object indexes.
+
+    The layout is shared by all the states derived from the same initial state,
+    so the cost of indexing the fluents is paid only once.
+    """
+
+    BOOL, NUMERIC, OBJECT = 0, 1, 2
+
+    def __init__(self, fluents: Sequence["up.model.FNode"]):
+        """
+        Creates the slot table for the given fluent expressions.
+
+        :param fluents: The grounded fluent expressions that the states using this
+            layout define.
+        """
+        self._slots: Dict["up.model.FNode", Tuple[int, int]] = {}
+        self._bool_fluents: List["up.model.FNode"] = []
+        self._numeric_fluents: List["up.model.FNode"] = []
+        self._object_fluents: List["up.model.FNode"] = []
+        # For every numeric slot, whether the values must be returned as Real constants
+        self._real_slots: List[bool] = []
+        self._objects: List["up.model.FNode"] = []
+        self._objects_ids: Dict["up.model.FNode", int] = {}
+        self._environment: Optional["up.environment.Environment"] = None
+        for fluent in fluents:
+            if not fluent.is_fluent_exp():
+                raise UPValueError(
+                    f"The fluent '{fluent}' is not a fluent expression, but a '{fluent.node_type.name}'"
+                )
+            if fluent in self._slots:
+                continue
+            self._environment = fluent.environment
+            f_type = fluent.fluent().type
+            if f_type.is_bool_type():
+                self._slots[fluent] = (StateLayout.BOOL, len(self._bool_fluents))
+                self._bool_fluents.append(fluent)
+            elif f_type.is_int_type() or f_type.is_real_type():
+                self._slots[fluent] = (StateLayout.NUMERIC, len(self._numeric_fluents))
+                self._numeric_fluents.append(fluent)
+                self._real_slots.append(f_type.is_real_type())
+            else:
+                assert f_type.is_user_type(), "Unexpected fluent type"
+                self._slots[fluent] = (StateLayout.OBJECT, len(self._object_fluents))
+                self._object_fluents.append(fluent)
+        # Keys used to incrementally maintain the hash of the boolean bitset
+        self._bool_keys: List[int] = [
+            hash((StateLayout.BOOL, i, None)) for i in range(len(self._bool_fluents))
+        ]
+
+    @property
+    def fluents(self) -> List["up.model.FNode"]:
+        """Returns all the fluent expressions indexed by this layout."""
+        return self._bool_fluents + self._numeric_fluents + self._object_fluents
+
+    def slot(self, fluent: "up.model.FNode") -> Tuple[int, int]:
+        """
+        Returns the slot of the given fluent expression, as a couple made of the
+        slot kind (one of `BOOL`, `NUMERIC` or `OBJECT`) and the index in the
+        storage of that kind.
+
+        :param fluent: The grounded fluent expression to retrieve.
+        :return: The slot of the given fluent.
+        """
+        slot = self._slots.get(fluent, None)
+        if slot is None:
+            raise UPUsageError(f"The fluent {fluent} is not part of the state layout")
+        return slot
+
+    def object_id(self, obj: "up.model.FNode") -> int:
+        """
+        Returns the index that represents the given object expression in the
+        object slots; unseen objects are indexed on the fly.
+
+        :param obj: The `ObjectExp` to index.
+        :return: The index of the given object.
+        """
+        obj_id = self._objects_ids.get(obj, None)
+        if obj_id is None:
+            if not obj.is_object_exp():
+                raise UPValueError(
+                    f"The value '{obj}' is not an object constant, but a '{obj.node_type.name}'"
+                )
+            obj_id = len(self._objects)
+            self._objects.append(obj)
+            self._objects_ids[obj] = obj_id
+        return obj_id
+
+    def numeric_constant(
+        self, idx: int, value: Union[int, Fraction]
+    ) -> "up.model.FNode":
+        """Returns the constant expression of the given value for the numeric slot `idx`."""
+        assert self._environment is not None
+        em = self._environment.expression_manager
+        if self._real_slots[idx]:
+            return em.Real(Fraction(value))
+        if isinstance(value, Fraction):
+            if value.denominator == 1:
+                return em.Int(value.numerator)
+            return em.Real(value)
+        return em.Int(value)
+
+
+class UPCompiledState(State):
+    """
+    Array-backed implementation of the `State` interface.
+
+    Differently from the :class:`~unified_planning.model.UPState`, this class indexes
+    every grounded fluent once in a :class:`~unified_planning.model.state.StateLayout`
+    shared by all the states derived from the same root; the values are stored in
+    an integer bitset (for boolean fluents), a tuple of exact numbers (for numeric fluents)
+    and an `array` of object indexes (for user-type fluents).
+
+    Retrieving a value is a single dictionary lookup, creating a child state copies
+    the flat storages without walking any ancestor and the hash of a child is updated
+    incrementally from the hash of its father.
+
+    NOTE: Every state derived from a `UPCompiledState` can only define the fluents
+    of the initial state.
+    """
+
+    __slots__ = ["_layout", "_bits", "_numerics", "_objects", "_hash", "_changed"]
+
+    def __init__(
+        self,
+        values: Dict["up.model.FNode", "up.model.FNode"],
+        layout: Optional[StateLayout] = None,
+    ):
+        """
+        Creates a new `UPCompiledState` where the map values represents the get_value method.
+
+        :param values: The mapping from every fluent expression to its constant value.
+        :param layout: Optionally, the `StateLayout` to use; by default a new layout indexing
+            all the keys of `values` is created.
+        """
+        if layout is None:
+            layout = StateLayout(list(values.keys()))
+        self._layout = layout
+        bits = 0
+        numerics: List[Union[int, Fraction]] = [0] * len(layout._numeric_fluents)
+        objects = array("l", [0] * len(layout._object_fluents))
+        defined = 0
+        for fluent, value in values.items():
+            if not value.is_constant():
+                raise UPValueError(
+                    f"The value '{value}' assigned to the fluent '{fluent}' is not a constant, but a '{value.node_type.name}'"
+                )
+            kind, idx = layout.slot(fluent)
+            if kind == StateLayout.BOOL:
+                if value.bool_constant_value():
+                    bits |= 1 << idx
+            elif kind == StateLayout.NUMERIC:
+                numerics[idx] = value.constant_value()
+            else:
+                objects[idx] = layout.object_id(value)
+            defined += 1
+        if defined != len(layout._slots):
+            raise UPUsageError(
+                "A UPCompiledState must define a value for every fluent of its layout"
+            )
+        self._bits = bits
+        self._numerics = tuple(numerics)
+        self._objects = objects
+        self._hash = reduce(xor, map(hash, enumerate(self._numerics)), 0)
+        self._hash ^= reduce(xor, map(hash, zip(range(-len(objects), 0), objects)), 0)
+        for i, key in enumerate(layout._bool_keys):
+            if (bits >> i) & 1:
+                self._hash ^= key
+        self._changed: Optional[Tuple[Tuple[int, int], ...]] = None
+
+    @property
+    def layout(self) -> StateLayout:
+        """Returns the `StateLayout` shared by this state."""
+        return self._layout
+
+    @property
+    def changed_slots(self) -> Optional[Tuple[Tuple[int, int], ...]]:
+        """
+        Returns the slots whose value differs from the state this state was created from
+        with the `make_child` method; `None` if this state was created from scratch.
+        """
+        return self._changed
+
+    @property
+    def bool_bits(self) -> int:
+        """
+        Returns the bitset of the boolean fluents of this state; the bit `i` is set
+        if the boolean fluent in the slot `(StateLayout.BOOL, i)` of the layout is `True`.
+        """
+        return self._bits
+
+    def _as_dict(self) -> Dict["up.model.FNode", "up.model.FNode"]:
+        return {f: self.get_value(f) for f in self._layout.fluents}
+
+    def __repr__(self) -> str:
+        return str(self._as_dict())
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, oth: object) -> bool:
+        if not isinstance(oth, UPCompiledState) or self._hash != oth._hash:
+            return False
+        if self._layout is not oth._layout:
+            return self._as_dict() == oth._as_dict()
+        return (
+            self._bits == oth._bits
+            and self._numerics == oth._numerics
+            and self._objects == oth._objects
+        )
+
+    def get_value(self, fluent: "up.model.FNode") -> "up.model.FNode":
+        """
+        This method retrieves the value of the given fluent in the `State`.
+        NOTE that the searched fluent must be part of the state layout otherwise an
+        exception is raised.
+
+        :params fluent: The fluent searched for in the `UPCompiledState`.
+        :return: The value set for the given fluent.
+        """
+        layout = self._layout
+        slot = layout._slots.get(fluent, None)
+        if slot is None:
+            raise UPUsageError(
+                f"The state {self} does not have a value for the value {fluent}"
+            )
+        kind, idx = slot
+        if kind == StateLayout.BOOL:
+            assert layout._environment is not None
+            return layout._environment.expression_manager.Bool(
+                bool((self._bits >> idx) & 1)
+            )
+        elif kind == StateLayout.NUMERIC:
+            return layout.numeric_constant(idx, self._numerics[idx])
+        return layout._objects[self._objects[idx]]
+
+    def make_child(
+        self,
+        updated_values: Dict["up.model.FNode", "up.model.FNode"],
+    ) -> "UPCompiledState":
+        """
+        Returns a different `UPCompiledState` in which every value in updated_values.keys() is evaluated as his mapping
+        in new the `updated_values` dict and every other value is evaluated as in `self`.
+
+        :param updated_values: The dictionary that contains the `values` that need to be updated in the new `UPCompiledState`.
+        :return: The new `UPCompiledState` created.
+        """
+        layout = self._layout
+        updates: Dict[Tuple[int, int], Union[bool, int, Fraction]] = {}
+        for fluent, value in updated_values.items():
+            if not value.is_constant():
+                raise UPValueError(
+                    f"The value '{value}' assigned to the fluent '{fluent}' is not a constant, but a '{value.node_type.name}'"
+                )
+            slot = layout.slot(fluent)
+            if slot[0] == StateLayout.OBJECT:
+                updates[slot] = layout.object_id(value)
+            else:
+                updates[slot] = value.constant_value()
+        return self.make_child_from_slots(updates)
+
+    def make_child_from_slots(
+        self,
+        updates: Dict[Tuple[int, int], Union[bool, int, Fraction]],
+    ) -> "UPCompiledState":
+        """
+        Same as :func:`make_child <unified_planning.model.UPCompiledState.make_child>`, but the
+        updated values are given directly on the slots of the layout; booleans and numbers are
+        given as python values and objects as the index returned by
+        :func:`StateLayout.object_id <unified_planning.model.state.StateLayout.object_id>`.
+
+        :param updates: The map from the slots to update to their new value.
+        :return: The new `UPCompiledState` created.
+        """
+        layout = self._layout
+        bits = self._bits
+        new_hash = self._hash
+        numerics: Optional[List[Union[int, Fraction]]] = None
+        objects: Optional[array] = None
+        changed: List[Tuple[int, int]] = []
+        for slot, value in updates.items():
+            kind, idx = slot
+            if kind == StateLayout.BOOL:
+                if bool((bits >> idx) & 1) != value:
+                    bits ^= 1 << idx
+                    new_hash ^= layout._bool_keys[idx]
+                    changed.append(slot)
+            elif kind == StateLayout.NUMERIC:
+                if numerics is None:
+                    numerics = list(self._numerics)
+                if numerics[idx] != value:
+                    new_hash ^= hash((idx, numerics[idx])) ^ hash((idx, value))
+                    numerics[idx] = value
+                    changed.append(slot)
+            else:
+                if objects is None:
+                    objects = array("l", self._objects)
+                if objects[idx] != value:
+                    pos = idx - len(objects)
+                    new_hash ^= hash((pos, objects[idx])) ^ hash((pos, value))
+                    objects[idx] = cast(int, value)
+                    changed.append(slot)
+        child = UPCompiledState.__new__(UPCompiledState)
+        child._layout = layout
+        child._bits = bits
+        child._numerics = self._numerics if numerics is None else tuple(numerics)
+        child._objects = self._objects if objects is None else objects
+        child._hash = new_hash
+        child._changed = tuple(changed)
+        return child
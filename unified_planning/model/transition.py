@@ -28,12 +28,15 @@ from unified_planning.exceptions import (
     UPUsageError,
 )
 from unified_planning.model.mixins.timed_conds_effs import TimedCondsEffs
+from unified_planning.model.mixins.modifications_tracker import (
+    ModificationsTrackerMixin,
+)
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Set, Union, Optional, Iterable
 from collections import OrderedDict
 
 
-class Transition(ABC):
+class Transition(ModificationsTrackerMixin, ABC):
     """This is the `Transition` interface."""
 
     def __init__(
@@ -43,6 +46,7 @@ class Transition(ABC):
         _env: Optional[Environment] = None,
         **kwargs: "up.model.types.Type",
     ):
+        ModificationsTrackerMixin.__init__(self)
         self._environment = get_environment(_env)
         self._name = _name
         self._parameters: "OrderedDict[str, up.model.parameter.Parameter]" = (
@@ -107,6 +111,7 @@ class Transition(ABC):
     @name.setter
     def name(self, new_name: str):
         """Sets the `Transition` `name`."""
+        self._notify_modification()
         self._name = new_name
 
     @property
@@ -154,7 +159,7 @@ class Transition(ABC):
         return self._parameters[parameter_name]
 
 
-class PreconditionMixin:
+class PreconditionMixin(ModificationsTrackerMixin):
     def __init__(self, _env):
         self._preconditions: List["up.model.fnode.FNode"] = []
         self._environment = get_environment(_env)
@@ -166,6 +171,7 @@ class PreconditionMixin:
 
     def clear_preconditions(self):
         """Removes all the `Action preconditions`"""
+        self._notify_modification()
         self._preconditions = []
 
     def add_precondition(
@@ -196,13 +202,15 @@ class PreconditionMixin:
                 f"The precondition {str(precondition_exp)} has unbounded variables:\n{str(free_vars)}"
             )
         if precondition_exp not in self._preconditions:
+            self._notify_modification()
             self._preconditions.append(precondition_exp)
 
     def _set_preconditions(self, preconditions: List["up.model.fnode.FNode"]):
+        self._notify_modification()
         self._preconditions = preconditions
 
 
-class UntimedEffectMixin:
+class UntimedEffectMixin(ModificationsTrackerMixin):
     def __init__(self, _env):
         self._environment = get_environment(_env)
         self._effects: List[up.model.effect.Effect] = []
@@ -221,6 +229,7 @@ class UntimedEffectMixin:
 
     def clear_effects(self):
         """Removes all the `Action's effects`."""
+        self._notify_modification()
         self._effects = []
         self._fluents_assigned = {}
         self._fluents_inc_dec = set()
@@ -379,6 +388,7 @@ class UntimedEffectMixin:
         assert (
             effect.environment == self._environment
         ), "effect does not have the same environment of the action"
+        self._notify_modification()
         up.model.effect.check_conflicting_effects(
             effect,
             None,
@@ -412,4 +422,5 @@ class UntimedEffectMixin:
             raise UPUsageError(
                 "The added SimulatedEffect does not have the same environment of the Action"
             )
+        self._notify_modification()
         self._simulated_effect = simulated_effect
@@ -70,6 +70,10 @@ class _BoolType(Type):
     def __repr__(self) -> str:
         return "bool"
 
+    # The type is a singleton compared by identity, so it is pickled by reference
+    def __reduce__(self):
+        return "BOOL"
+
     def is_bool_type(self) -> bool:
         """Returns true iff is boolean type."""
         return True
@@ -81,6 +85,10 @@ class _TimeType(Type):
     def __repr__(self) -> str:
         return "time"
 
+    # The type is a singleton compared by identity, so it is pickled by reference
+    def __reduce__(self):
+        return "TIME"
+
     def is_time_type(self) -> bool:
         """Returns true iff is boolean type."""
         return True
@@ -244,7 +252,7 @@ def domain_size(
     if typename.is_bool_type():
         return 2
     elif typename.is_user_type():
-        return len(list(objects_set.objects(typename)))
+        return len(objects_set._type_domain(typename)[0])
     elif typename.is_int_type():
         typename = cast(_IntType, typename)
         lb = typename.lower_bound
@@ -272,9 +280,7 @@ def domain_item(
     if typename.is_bool_type():
         return objects_set.environment.expression_manager.Bool(idx == 0)
     elif typename.is_user_type():
-        return objects_set.environment.expression_manager.ObjectExp(
-            list(objects_set.objects(typename))[idx]
-        )
+        return objects_set._type_domain(typename)[1][idx]
     elif typename.is_int_type():
         typename = cast(_IntType, typename)
         lb = typename.lower_bound
@@ -25,6 +25,7 @@ from unified_planning.model.walkers.operators_extractor import OperatorsExtracto
 from unified_planning.model.walkers.quantifier_simplifier import QuantifierSimplifier
 from unified_planning.model.walkers.simplifier import Simplifier
 from unified_planning.model.walkers.state_evaluator import StateEvaluator
+from unified_planning.model.walkers.expression_compiler import ExpressionCompiler
 from unified_planning.model.walkers.substituter import Substituter
 from unified_planning.model.walkers.type_checker import TypeChecker
 from unified_planning.model.walkers.free_vars import FreeVarsExtractor
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import Optional
 from unified_planning.model.walkers.generic import Walker
 from unified_planning.model.fnode import FNode
 
@@ -27,6 +28,9 @@ class DagWalker(Walker):
     :func _get_key needs to be defined if additional arguments via
     keywords need to be shared. This function should return the key to
     be used in memoization. See substituter for an example.
+
+    If ``memoization_limit`` is set, the cache is cleared after a walk that leaves
+    more than ``memoization_limit`` results in it.
     """
 
     def __init__(self, invalidate_memoization=False):
@@ -37,6 +41,7 @@ class DagWalker(Walker):
 
         self.memoization = {}
         self.invalidate_memoization = invalidate_memoization
+        self.memoization_limit: Optional[int] = None
         self.stack = []
         return
 
@@ -102,6 +107,13 @@ class DagWalker(Walker):
 
         if self.invalidate_memoization:
             self.memoization.clear()
+        elif (
+            self.memoization_limit is not None
+            and len(self.memoization) > self.memoization_limit
+            and not self.stack
+        ):
+            # the cache is cleared only if this walk is not nested in another one
+            self.memoization.clear()
         return res
 
     def _get_key(self, expression: FNode, **kwargs):
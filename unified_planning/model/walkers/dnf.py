@@ -16,11 +16,16 @@
 
 import unified_planning.environment
 import unified_planning.model.walkers as walkers
-from unified_planning.exceptions import UPUnreachableCodeError
+from unified_planning.exceptions import UPExpressionTooLargeError
 from unified_planning.model.fnode import FNode
 from unified_planning.model.operators import OperatorKind
-from typing import List, Tuple
-from itertools import product
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from itertools import combinations, product
+from math import comb
+
+
+# A conjunction of literals, without repetitions
+Clause = Tuple[FNode, ...]
 
 
 class Nnf:
@@ -30,11 +35,18 @@ class Nnf:
 
     This is done first by removing all the Implications and Equalities,
     then by pushing all the not to the leaves of the Tree representing the expression.
+
+    The NNF of every sub-expression, with a positive or negative polarity, is memoized,
+    so the sub-expressions shared by different expressions are transformed once; if
+    ``memoization_limit`` is set, the memoization is cleared after a transformation that
+    leaves more than ``memoization_limit`` results in it.
     """
 
     def __init__(self, environment: "unified_planning.environment.Environment"):
         self.environment = environment
         self.manager = environment.expression_manager
+        self.memoization: Dict[Tuple[FNode, bool], FNode] = {}
+        self.memoization_limit: Optional[int] = None
 
     def get_nnf_expression(self, expression: FNode) -> FNode:
         """Function used to transform a logic expression into the equivalent
@@ -49,71 +61,127 @@ class Nnf:
         :param expression: The expression that must be returned in NNF form.
         :return: The expression semantically equivalent to the given expression, but in NNF form.
         """
-        stack: List[Tuple[bool, FNode, bool]] = []
-        stack.append((True, expression, False))
-        solved: List[FNode] = []
-        while len(stack) > 0:
-            p, e, status = stack.pop()
-            if status:
-                if e.is_and():
-                    args = [solved.pop() for _ in range(len(e.args))]
-                    if p:
-                        new_e = self.manager.And(args)
-                    else:
-                        new_e = self.manager.Or(args)
-                    solved.append(new_e)
-                elif e.is_or():
-                    args = [solved.pop() for _ in range(len(e.args))]
-                    if p:
-                        new_e = self.manager.Or(args)
-                    else:
-                        new_e = self.manager.And(args)
-                    solved.append(new_e)
-                else:
-                    raise UPUnreachableCodeError(
-                        "This code branch should never be reached!"
-                    )
+        memoization = self.memoization
+        res = memoization.get((expression, True), None)
+        if res is not None:
+            return res
+        # the stack contains the expressions to transform, with their polarity and
+        # a flag that tells if the children of the expression are already transformed
+        stack: List[Tuple[FNode, bool, bool]] = [(expression, True, False)]
+        while stack:
+            e, p, expanded = stack.pop()
+            if (e, p) in memoization:
+                continue
+            children = self._get_children(e, p)
+            if expanded:
+                args = [memoization[c] for c in children]
+                memoization[(e, p)] = self._combine(e, p, args)
             else:
-                if e.is_not():
-                    stack.append((not p, e.arg(0), False))
-                elif e.is_and() or e.is_or():
-                    stack.append((p, e, True))
-                    for arg in e.args:
-                        stack.append((p, arg, False))
-                elif e.is_implies():
-                    na1 = self.manager.Not(e.arg(0))
-                    new_e = self.manager.Or(na1, e.arg(1))
-                    # stack.append((p, new_e, False)) would be enough.
-                    # but this requires more iterations on the stack
-                    # while the arguments can be expanded in this
-                    # iteration.
-                    stack.append((p, new_e, True))
-                    stack.append((not p, e.arg(0), False))
-                    stack.append((p, e.arg(1), False))
-                elif e.is_iff():
-                    na1 = self.manager.Not(e.arg(0))
-                    na2 = self.manager.Not(e.arg(1))
-                    e1 = self.manager.And(e.arg(0), e.arg(1))
-                    e2 = self.manager.And(na1, na2)
-                    new_e = self.manager.Or(e1, e2)
-                    # stack.append((p, new_e, False)) would be enough.
-                    # but this requires more iterations on the stack
-                    # while the arguments can be expanded in this
-                    # iteration.
-                    stack.append((p, new_e, True))
-                    stack.append((p, e1, True))
-                    stack.append((p, e.arg(0), False))
-                    stack.append((p, e.arg(1), False))
-                    stack.append((p, e2, True))
-                    stack.append((not p, e.arg(0), False))
-                    stack.append((not p, e.arg(1), False))
-                else:
-                    if p:
-                        solved.append(e)
-                    else:
-                        solved.append(self.manager.Not(e))
-        assert len(solved) == 1  # sanity check
-        return solved.pop()
+                stack.append((e, p, True))
+                for c, cp in children:
+                    if (c, cp) not in memoization:
+                        stack.append((c, cp, False))
+        res = memoization[(expression, True)]
+        if (
+            self.memoization_limit is not None
+            and len(memoization) > self.memoization_limit
+        ):
+            memoization.clear()
+        return res
+
+    def _get_children(self, e: FNode, p: bool) -> List[Tuple[FNode, bool]]:
+        """Returns the sub-expressions, with their polarity, whose NNF is needed to
+        create the NNF of the given expression with the given polarity."""
+        if e.is_not():
+            return [(e.arg(0), not p)]
+        elif e.is_and() or e.is_or():
+            return [(arg, p) for arg in e.args]
+        elif e.is_implies():
+            return [(e.arg(0), not p), (e.arg(1), p)]
+        elif e.is_iff():
+            return [
+                (e.arg(0), True),
+                (e.arg(1), True),
+                (e.arg(0), False),
+                (e.arg(1), False),
+            ]
+        return []
+
+    def _combine(self, e: FNode, p: bool, args: List[FNode]) -> FNode:
+        """Returns the NNF of the given expression with the given polarity, given
+        the NNFs of the sub-expressions returned by `_get_children`."""
+        if e.is_not():
+            return args[0]
+        elif e.is_and():
+            return self.manager.And(args) if p else self.manager.Or(args)
+        elif e.is_or():
+            return self.manager.Or(args) if p else self.manager.And(args)
+        elif e.is_implies():
+            # a => b is !a || b, !(a => b) is a && !b
+            return self.manager.Or(args) if p else self.manager.And(args)
+        elif e.is_iff():
+            a, b, na, nb = args
+            if p:
+                return self.manager.Or(self.manager.And(a, b), self.manager.And(na, nb))
+            else:
+                return self.manager.And(self.manager.Or(na, nb), self.manager.Or(a, b))
+        return e if p else self.manager.Not(e)
+
+
+class _Clauses:
+    """
+    An ordered set of clauses where no clause contains another one: a clause that
+    contains (so is subsumed by) a clause of the set is not added and the clauses
+    that contain an added clause are removed.
+    """
+
+    def __init__(self):
+        self._clauses: Dict[FrozenSet[FNode], Clause] = {}
+        # the clauses containing every literal
+        self._index: Dict[FNode, Set[FrozenSet[FNode]]] = {}
+        # the number of clauses of every size
+        self._sizes: Dict[int, int] = {}
+
+    def add(self, clause: Clause):
+        key = frozenset(clause)
+        if key in self._clauses:
+            return
+        size = len(key)
+        smaller_sizes = [s for s in self._sizes if s < size]
+        if smaller_sizes and self._contains_subset_of(key, smaller_sizes):
+            return
+        if any(s > size for s in self._sizes):
+            if key:
+                # the clauses containing all the literals of the added one
+                candidates = sorted((self._index.get(l, set()) for l in key), key=len)
+                subsumed = set.intersection(*candidates)
+            else:
+                subsumed = set(self._clauses)
+            for other in subsumed:
+                self._remove(other)
+        self._clauses[key] = clause
+        for l in key:
+            self._index.setdefault(l, set()).add(key)
+        self._sizes[size] = self._sizes.get(size, 0) + 1
+
+    def _contains_subset_of(self, key: FrozenSet[FNode], sizes: List[int]) -> bool:
+        clauses = self._clauses
+        if sum(comb(len(key), s) for s in sizes) <= len(clauses):
+            return any(
+                frozenset(sub) in clauses for s in sizes for sub in combinations(key, s)
+            )
+        return any(other < key for other in clauses)
+
+    def _remove(self, key: FrozenSet[FNode]):
+        del self._clauses[key]
+        for l in key:
+            self._index[l].discard(key)
+        self._sizes[len(key)] -= 1
+        if self._sizes[len(key)] == 0:
+            del self._sizes[len(key)]
+
+    def clauses(self) -> List[Clause]:
+        return list(self._clauses.values())
 
 
 class Dnf(walkers.dag.DagWalker):
@@ -124,16 +192,25 @@ class Dnf(walkers.dag.DagWalker):
     and then every And and Or are propagated to be a unique equivalent Or of
     Ands or Atomic expressions, where 'atomic expressions' could also be a
     Not of an atomic expression.
+
+    While the DNF is built, the repeated conjunctions and the conjunctions that contain
+    another conjunction of the same disjunction are removed. The DNF of every
+    sub-expression is memoized, as the NNF, so the sub-expressions shared by different
+    expressions are transformed once.
     """
 
     def __init__(self, environment: "unified_planning.environment.Environment"):
-        walkers.dag.DagWalker.__init__(self, True)
+        walkers.dag.DagWalker.__init__(self)
         self.environment = environment
         self.manager = environment.expression_manager
-        self._nnf = Nnf(self.environment)
+        # the NNFs are memoized by the environment
+        self._nnf = environment.nnf_converter
         self._simplifier = walkers.simplifier.Simplifier(self.environment)
+        self._max_disjuncts: Optional[int] = None
 
-    def get_dnf_expression(self, expression: FNode) -> FNode:
+    def get_dnf_expression(
+        self, expression: FNode, max_disjuncts: Optional[int] = None
+    ) -> FNode:
         """Function used to transform a logic expression into the equivalent
         Disjunctive Normal Form expression.
 
@@ -144,43 +221,120 @@ class Dnf(walkers.dag.DagWalker):
 
         For example, the form: !(a => (b && c)) becomes:
         a && (!b || !c), in NNF form, and then:
-        (a && !b) || (a && !c), therefore a DNF expression."""
+        (a && !b) || (a && !c), therefore a DNF expression.
+
+        The size of the DNF can be exponential in the size of the given expression;
+        if `max_disjuncts` is set, the transformation is aborted as soon as a
+        sub-expression has more than `max_disjuncts` disjuncts.
+
+        :param expression: The expression that must be returned in DNF form.
+        :param max_disjuncts: The maximum number of disjuncts of the sub-expressions;
+            None means no limit.
+        :return: The expression semantically equivalent to the given expression, but in DNF form.
+        :raises UPExpressionTooLargeError: If a sub-expression has more than `max_disjuncts` disjuncts.
+        """
         nnf_exp = self._nnf.get_nnf_expression(expression)
-        tuples = self.walk(nnf_exp)
-        return self.manager.Or(self.manager.And(and_args) for and_args in tuples)
+        self._max_disjuncts = max_disjuncts
+        try:
+            clauses = self.walk(nnf_exp)
+            # the memoized DNF of the expression is not checked during the walk
+            self._check_size(len(clauses))
+        except UPExpressionTooLargeError:
+            # the results computed before the interruption are kept, the pending
+            # expressions are discarded
+            self.stack.clear()
+            raise
+        finally:
+            self._max_disjuncts = None
+        return self.manager.Or(self.manager.And(clause) for clause in clauses)
 
     def walk_and(
-        self, expression: FNode, args: List[List[List[FNode]]], **kwargs
-    ) -> List[List[FNode]]:
-        res: List[List[FNode]] = []
-        tuples = product(*args)
-        # tuples is an iterable of tuples, where each tuple
-        # represents one son of the resulting Or.
-        # list will contain each son of the resulting And.
+        self, expression: FNode, args: List[List[Clause]], **kwargs
+    ) -> List[Clause]:
+        size = 1
+        for disjuncts in args:
+            size *= len(disjuncts)
+        self._check_size(size)
+        if self._independent(args):
+            # the conjunctions of independent disjunctions never contain a literal
+            # and its negation or another conjunction of the product
+            return [
+                tuple(lit for conj in conj_list for lit in conj)
+                for conj_list in product(*args)
+            ]
+        res = _Clauses()
+        # every element of the product represents one son of the resulting Or,
+        # made of the union of the literals of the sons of the And.
         # for example:
-        #   tuples = ([a, b], [c]) ([d])
+        #   args = [[(a, b), (c,)], [(d,)]]
         # will result in
-        #   Or(And(a, b, c), And(d))
-        for conj_list in tuples:
-            big_conjunction = [lit for conj in conj_list for lit in conj]
-            simp = self._simplifier.simplify(self.manager.And(big_conjunction))
-            if simp.is_true():
-                return []
-            elif simp.is_false():
-                pass
-            elif simp.is_and():
-                res.append(simp.args)
-            else:
-                res.append([simp])
-        return res
+        #   Or(And(a, b, d), And(c, d))
+        for conj_list in product(*args):
+            clause = self._conjoin(conj_list)
+            if clause is not None:
+                res.add(clause)
+        return res.clauses()
 
     def walk_or(
-        self, expression: FNode, args: List[List[List[FNode]]], **kwargs
-    ) -> List[List[FNode]]:
-        return [conjunction for disjunction in args for conjunction in disjunction]
+        self, expression: FNode, args: List[List[Clause]], **kwargs
+    ) -> List[Clause]:
+        self._check_size(sum(len(disjuncts) for disjuncts in args))
+        if self._independent(args):
+            return [conjunction for disjunction in args for conjunction in disjunction]
+        res = _Clauses()
+        for disjunction in args:
+            for conjunction in disjunction:
+                res.add(conjunction)
+        return res.clauses()
 
     @walkers.handles(set(OperatorKind) - set({OperatorKind.AND, OperatorKind.OR}))
     def walk_all(
-        self, expression: FNode, args: List[List[List[FNode]]], **kwargs
-    ) -> List[List[FNode]]:
-        return [[expression]]
+        self, expression: FNode, args: List[List[Clause]], **kwargs
+    ) -> List[Clause]:
+        literal = self._simplifier.simplify(expression)
+        if literal.is_true():
+            return [()]
+        elif literal.is_false():
+            return []
+        elif literal.is_and():
+            return [tuple(literal.args)]
+        elif literal.is_or():
+            return [(arg,) for arg in literal.args]
+        return [(literal,)]
+
+    def _independent(self, args: List[List[Clause]]) -> bool:
+        """Returns True if the given disjunctions, that do not contain a conjunction
+        containing another one, have no atoms in common and are not trivially true."""
+        seen: Set[FNode] = set()
+        for disjunction in args:
+            atoms = set()
+            for conjunction in disjunction:
+                if len(conjunction) == 0:
+                    return False
+                for literal in conjunction:
+                    atoms.add(literal.arg(0) if literal.is_not() else literal)
+            if not seen.isdisjoint(atoms):
+                return False
+            seen.update(atoms)
+        return True
+
+    def _conjoin(self, clauses: Tuple[Clause, ...]) -> Optional[Clause]:
+        """Returns the conjunction of the given clauses, or None if it contains a
+        literal and its negation."""
+        literals: Dict[FNode, None] = {}
+        for clause in clauses:
+            for literal in clause:
+                if literal.is_not():
+                    negation = literal.arg(0)
+                else:
+                    negation = self.manager.Not(literal)
+                if negation in literals:
+                    return None
+                literals[literal] = None
+        return tuple(literals)
+
+    def _check_size(self, size: int):
+        if self._max_disjuncts is not None and size > self._max_disjuncts:
+            raise UPExpressionTooLargeError(
+                f"The DNF of the expression has more than {self._max_disjuncts} disjuncts."
+            )
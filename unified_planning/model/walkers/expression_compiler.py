@@ -0,0 +1,233 @@
+# Copyright 2021-2023 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from fractions import Fraction
+from typing import Any, Callable, List, Optional
+import unified_planning.model.walkers as walkers
+from unified_planning.model.fnode import FNode
+from unified_planning.model.operators import OperatorKind
+from unified_planning.model.state import StateLayout, UPCompiledState
+from unified_planning.exceptions import UPUsageError
+
+
+CompiledExpression = Callable[[UPCompiledState], Any]
+
+COMPILABLE_OPERATORS = frozenset(
+    [
+        OperatorKind.BOOL_CONSTANT,
+        OperatorKind.INT_CONSTANT,
+        OperatorKind.REAL_CONSTANT,
+        OperatorKind.OBJECT_EXP,
+        OperatorKind.FLUENT_EXP,
+        OperatorKind.AND,
+        OperatorKind.OR,
+        OperatorKind.NOT,
+        OperatorKind.IMPLIES,
+        OperatorKind.IFF,
+        OperatorKind.EQUALS,
+        OperatorKind.LE,
+        OperatorKind.LT,
+        OperatorKind.PLUS,
+        OperatorKind.MINUS,
+        OperatorKind.TIMES,
+        OperatorKind.DIV,
+    ]
+)
+
+
+class ExpressionCompiler(walkers.dag.DagWalker):
+    """
+    This expression walker compiles grounded expressions into python closures that are
+    evaluated directly on the slots of a :class:`~unified_planning.model.UPCompiledState`
+    with the given :class:`~unified_planning.model.state.StateLayout`, without walking the
+    expression or creating new expressions at every evaluation.
+
+    The compiled closures return python values: `bool` for boolean expressions, `int` or
+    `Fraction` for numeric expressions and the index given by the layout for objects.
+
+    Expressions that can't be compiled (for example quantifiers or fluents with non-constant
+    arguments) are compiled to `None`, so the caller can fall back to the
+    :class:`~unified_planning.model.walkers.StateEvaluator`.
+    """
+
+    def __init__(self, layout: StateLayout):
+        walkers.dag.DagWalker.__init__(self)
+        self._layout = layout
+
+    def compile(self, expression: FNode) -> Optional[CompiledExpression]:
+        """
+        Compiles the given expression.
+
+        :param expression: The grounded expression to compile.
+        :return: The closure evaluating the given expression on a `UPCompiledState` or
+            `None` if the expression can't be compiled.
+        """
+        return self.walk(expression)
+
+    @walkers.handles(set(OperatorKind) - COMPILABLE_OPERATORS)
+    def walk_unsupported(
+        self, expression: FNode, args: List[Optional[CompiledExpression]]
+    ) -> Optional[CompiledExpression]:
+        return None
+
+    @walkers.handles(
+        OperatorKind.BOOL_CONSTANT,
+        OperatorKind.INT_CONSTANT,
+        OperatorKind.REAL_CONSTANT,
+    )
+    def walk_constant(
+        self, expression: FNode, args: List[Optional[CompiledExpression]]
+    ) -> Optional[CompiledExpression]:
+        value = expression.constant_value()
+        return lambda _: value
+
+    def walk_object_exp(
+        self, expression: FNode, args: List[Optional[CompiledExpression]]
+    ) -> Optional[CompiledExpression]:
+        obj_id = self._layout.object_id(expression)
+        return lambda _: obj_id
+
+    def walk_fluent_exp(
+        self, expression: FNode, args: List[Optional[CompiledExpression]]
+    ) -> Optional[CompiledExpression]:
+        if not all(a.is_constant() for a in expression.args):
+            return None
+        try:
+            kind, idx = self._layout.slot(expression)
+        except UPUsageError:
+            return None
+        if kind == StateLayout.BOOL:
+            mask = 1 << idx
+            return lambda s: (s._bits & mask) != 0
+        elif kind == StateLayout.NUMERIC:
+            return lambda s: s._numerics[idx]
+        return lambda s: s._objects[idx]
+
+    def walk_and(
+        self, expression: FNode, args: List[Optional[CompiledExpression]]
+    ) -> Optional[CompiledExpression]:
+        if None in args:
+            return None
+        functions = tuple(args)
+
+        def _and(state: UPCompiledState) -> bool:
+            for f in functions:
+                if not f(state):  # type: ignore[misc]
+                    return False
+            return True
+
+        return _and
+
+    def walk_or(
+        self, expression: FNode, args: List[Optional[CompiledExpression]]
+    ) -> Optional[CompiledExpression]:
+        if None in args:
+            return None
+        functions = tuple(args)
+
+        def _or(state: UPCompiledState) -> bool:
+            for f in functions:
+                if f(state):  # type: ignore[misc]
+                    return True
+            return False
+
+        return _or
+
+    def walk_not(
+        self, expression: FNode, args: List[Optional[CompiledExpression]]
+    ) -> Optional[CompiledExpression]:
+        (arg,) = args
+        if arg is None:
+            return None
+        return lambda s: not arg(s)
+
+    def walk_implies(
+        self, expression: FNode, args: List[Optional[CompiledExpression]]
+    ) -> Optional[CompiledExpression]:
+        left, right = args
+        if left is None or right is None:
+            return None
+        return lambda s: not left(s) or bool(right(s))
+
+    def walk_iff(
+        self, expression: FNode, args: List[Optional[CompiledExpression]]
+    ) -> Optional[CompiledExpression]:
+        left, right = args
+        if left is None or right is None:
+            return None
+        return lambda s: bool(left(s)) == bool(right(s))
+
+    def walk_equals(
+        self, expression: FNode, args: List[Optional[CompiledExpression]]
+    ) -> Optional[CompiledExpression]:
+        left, right = args
+        if left is None or right is None:
+            return None
+        return lambda s: left(s) == right(s)
+
+    def walk_le(
+        self, expression: FNode, args: List[Optional[CompiledExpression]]
+    ) -> Optional[CompiledExpression]:
+        left, right = args
+        if left is None or right is None:
+            return None
+        return lambda s: left(s) <= right(s)
+
+    def walk_lt(
+        self, expression: FNode, args: List[Optional[CompiledExpression]]
+    ) -> Optional[CompiledExpression]:
+        left, right = args
+        if left is None or right is None:
+            return None
+        return lambda s: left(s) < right(s)
+
+    def walk_plus(
+        self, expression: FNode, args: List[Optional[CompiledExpression]]
+    ) -> Optional[CompiledExpression]:
+        if None in args:
+            return None
+        functions = tuple(args)
+        return lambda s: sum(f(s) for f in functions)  # type: ignore[misc]
+
+    def walk_minus(
+        self, expression: FNode, args: List[Optional[CompiledExpression]]
+    ) -> Optional[CompiledExpression]:
+        left, right = args
+        if left is None or right is None:
+            return None
+        return lambda s: left(s) - right(s)
+
+    def walk_times(
+        self, expression: FNode, args: List[Optional[CompiledExpression]]
+    ) -> Optional[CompiledExpression]:
+        if None in args:
+            return None
+        functions = tuple(args)
+
+        def _times(state: UPCompiledState):
+            res = 1
+            for f in functions:
+                res *= f(state)  # type: ignore[misc]
+            return res
+
+        return _times
+
+    def walk_div(
+        self, expression: FNode, args: List[Optional[CompiledExpression]]
+    ) -> Optional[CompiledExpression]:
+        left, right = args
+        if left is None or right is None:
+            return None
+        return lambda s: Fraction(left(s)) / right(s)
@@ -658,7 +658,7 @@ def SequentialSimulator(
     problem: "up.model.AbstractProblem",
     *,
     name: Optional[str] = None,
-    params: Optional[Dict[str, str]] = None,
+    params: Optional[Dict[str, Any]] = None,
 ) -> "up.engines.engine.Engine":
     """
     Returns a sequential simulator. There are two ways to call this method:
@@ -57,3 +57,28 @@ class TestAnytimePlanning(unittest_TestCase):
 
         self.assertEqual(len(solutions), 2)
         self.assertGreater(len(solutions[0].actions), len(solutions[1].actions))
+
+    @skipIfNoAnytimePlannerForProblemKind(
+        simple_numeric_kind.union(quality_metrics_kind),
+        up.engines.AnytimeGuarantee.INCREASING_QUALITY,
+    )
+    def test_counters_validate_plans(self):
+        reader = PDDLReader()
+        domain_filename = os.path.join(PDDL_DOMAINS_PATH, "counters", "domain.pddl")
+        problem_filename = os.path.join(PDDL_DOMAINS_PATH, "counters", "problem2.pddl")
+        problem = reader.parse_problem(domain_filename, problem_filename)
+        problem.add_quality_metric(MinimizeSequentialPlanLength())
+
+        with AnytimePlanner(
+            problem_kind=problem.kind, anytime_guarantee="INCREASING_QUALITY"
+        ) as planner:
+            solutions = []
+            for p in planner.get_solutions(problem, validate_plans=True):
+                self.assertTrue(p.plan is not None)
+                assert p.log_messages is not None
+                self.assertIn("The plan is valid", p.log_messages[-1].message)
+                solutions.append(p.plan)
+                if len(solutions) == 2:
+                    break
+
+        self.assertEqual(len(solutions), 2)
@@ -0,0 +1,128 @@
+# Copyright 2021-2023 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import tracemalloc
+import unified_planning as up
+from unified_planning.shortcuts import *
+from unified_planning.engines import BestFirstSearchPlanner, PlanGenerationResultStatus
+from unified_planning.exceptions import UPUsageError
+from unified_planning.test import unittest_TestCase, main
+from unified_planning.test.examples import get_example_problems
+
+
+class TestBestFirstSearch(unittest_TestCase):
+    def setUp(self):
+        unittest_TestCase.setUp(self)
+        self.problems = get_example_problems()
+
+    def test_example_problems(self):
+        for name in [
+            "basic",
+            "complex_conditional",
+            "counter_to_50",
+            "robot_loader_adv",
+            "robot_loader_weak_bridge",
+            "hierarchical_blocks_world",
+            "basic_bounded_int_action_param",
+        ]:
+            problem = self.problems[name].problem
+            for search in ["gbfs", "astar", "wastar"]:
+                with OneshotPlanner(
+                    name="up_best_first_search", params={"search": search}
+                ) as planner:
+                    self.assertEqual(planner.name, "up_best_first_search")
+                    res = planner.solve(problem)
+                self.assertEqual(
+                    res.status, PlanGenerationResultStatus.SOLVED_SATISFICING
+                )
+                assert res.plan is not None
+                with PlanValidator(problem_kind=problem.kind) as validator:
+                    self.assertTrue(validator.validate(problem, res.plan))
+
+    def test_optimality(self):
+        for name in ["basic_with_costs", "locations_connected_cost_minimize"]:
+            test_case = self.problems[name]
+            with OneshotPlanner(
+                name="up_best_first_search", params={"search": "astar"}
+            ) as planner:
+                # the plans are optimal, but they are never reported as optimal
+                self.assertFalse(
+                    planner.satisfies(OptimalityGuarantee.SOLVED_OPTIMALLY)
+                )
+                res = planner.solve(test_case.problem)
+            self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_SATISFICING)
+            assert isinstance(res.plan, up.plans.SequentialPlan)
+            with PlanValidator(problem_kind=test_case.problem.kind) as validator:
+                val_res = validator.validate(test_case.problem, res.plan)
+            self.assertTrue(val_res)
+            self.assertEqual(
+                val_res.metric_evaluations[test_case.problem.quality_metrics[0]],
+                test_case.optimum,
+            )
+
+    def test_unsolvable_and_limits(self):
+        x = Fluent("x")
+        y = Fluent("y")
+        a = InstantaneousAction("a")
+        a.add_precondition(Not(x))
+        a.add_effect(x, True)
+        problem = Problem("unsolvable")
+        problem.add_fluent(x, default_initial_value=False)
+        problem.add_fluent(y, default_initial_value=False)
+        problem.add_action(a)
+        problem.add_goal(y)
+
+        planner = BestFirstSearchPlanner()
+        res = planner.solve(problem)
+        self.assertEqual(res.status, PlanGenerationResultStatus.UNSOLVABLE_PROVEN)
+        self.assertIsNone(res.plan)
+        assert res.metrics is not None
+        self.assertEqual(res.metrics["expanded_nodes"], "2")
+
+        # A heuristic pruning dead-ends makes the search incomplete
+        res = planner.solve(problem, heuristic=lambda s: None)
+        self.assertEqual(res.status, PlanGenerationResultStatus.UNSOLVABLE_INCOMPLETELY)
+
+        counter_problem = self.problems["counter_to_50"].problem
+        res = BestFirstSearchPlanner(max_nodes=10).solve(counter_problem)
+        self.assertEqual(res.status, PlanGenerationResultStatus.UNSOLVABLE_INCOMPLETELY)
+
+        # The memory limit only counts the memory allocated by the search
+        res = BestFirstSearchPlanner(max_memory=0).solve(counter_problem)
+        self.assertEqual(res.status, PlanGenerationResultStatus.MEMOUT)
+        self.assertFalse(tracemalloc.is_tracing())
+        res = BestFirstSearchPlanner(max_memory=1024).solve(counter_problem)
+        self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_SATISFICING)
+
+        with self.assertRaises(UPUsageError):
+            BestFirstSearchPlanner(search="dfs")
+
+    def test_user_heuristic(self):
+        problem = self.problems["robot_loader_adv"].problem
+        evaluated_states = []
+
+        def heuristic(state):
+            evaluated_states.append(state)
+            return 0
+
+        planner = BestFirstSearchPlanner(search="wastar", weight=5)
+        res = planner.solve(problem, heuristic=heuristic)
+        self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_SATISFICING)
+        self.assertTrue(len(evaluated_states) > 0)
+        for state in evaluated_states:
+            self.assertIsInstance(state, up.model.UPCompiledState)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# Copyright 2021-2023 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import os
+import pickle
+import tempfile
+from unified_planning.shortcuts import *
+from unified_planning.engines import CompilationCache, CompilerResult
+from unified_planning.engines.compilers import Grounder
+from unified_planning.plans import ActionInstance
+from unified_planning.test import unittest_TestCase, skipIfModuleNotInstalled
+from unified_planning.test.examples import get_example_problems
+
+
+class CountingGrounder(Grounder):
+    compilations = 0
+
+    def _compile(self, problem, compilation_kind):
+        CountingGrounder.compilations += 1
+        return super()._compile(problem, compilation_kind)
+
+
+class TestCompilationCache(unittest_TestCase):
+    @skipIfModuleNotInstalled("google.protobuf")
+    def setUp(self):
+        unittest_TestCase.setUp(self)
+        self.problems = get_example_problems()
+        self.directory = tempfile.TemporaryDirectory()
+        self.environment = get_environment()
+        self.environment.compilation_cache = CompilationCache(self.directory.name)
+
+    def tearDown(self):
+        self.environment.compilation_cache = None
+        self.directory.cleanup()
+
+    def assertSameMapBack(self, result: CompilerResult, cached_result: CompilerResult):
+        assert isinstance(result.problem, Problem)
+        assert isinstance(cached_result.problem, Problem)
+        assert result.map_back_action_instance is not None
+        assert cached_result.map_back_action_instance is not None
+        for action in result.problem.actions:
+            cached_action = cached_result.problem.action(action.name)
+            self.assertEqual(
+                str(result.map_back_action_instance(ActionInstance(action))),
+                str(
+                    cached_result.map_back_action_instance(
+                        ActionInstance(cached_action)
+                    )
+                ),
+            )
+
+    def test_grounding(self):
+        problem = self.problems["robot_loader_mod"].problem
+        CountingGrounder.compilations = 0
+        result = CountingGrounder().compile(problem, CompilationKind.GROUNDING)
+        self.assertEqual(CountingGrounder.compilations, 1)
+        cached_result = CountingGrounder().compile(problem, CompilationKind.GROUNDING)
+        self.assertEqual(CountingGrounder.compilations, 1)
+        self.assertEqual(result.problem, cached_result.problem)
+        self.assertEqual(result.engine_name, cached_result.engine_name)
+        self.assertSameMapBack(result, cached_result)
+
+        # different options or problems are compiled again
+        CountingGrounder(prune_actions=False).compile(
+            problem, CompilationKind.GROUNDING
+        )
+        self.assertEqual(CountingGrounder.compilations, 2)
+        modified_problem = problem.clone()
+        modified_problem.add_object(Object("l3", problem.user_type("Location")))
+        CountingGrounder().compile(modified_problem, CompilationKind.GROUNDING)
+        self.assertEqual(CountingGrounder.compilations, 3)
+
+    def test_pipeline(self):
+        problem = self.problems["basic_conditional"].problem
+        kinds = [
+            CompilationKind.CONDITIONAL_EFFECTS_REMOVING,
+            CompilationKind.GROUNDING,
+        ]
+        with Compiler(problem_kind=problem.kind, compilation_kinds=kinds) as compiler:
+            result = compiler.compile(problem)
+        # the pipeline and every compiler of the pipeline are cached
+        self.assertEqual(len(os.listdir(self.directory.name)), 3)
+        with Compiler(problem_kind=problem.kind, compilation_kinds=kinds) as compiler:
+            cached_result = compiler.compile(problem)
+        self.assertEqual(result.problem, cached_result.problem)
+        self.assertSameMapBack(result, cached_result)
+
+    def test_eviction(self):
+        problem = self.problems["robot_loader_mod"].problem
+        Grounder().compile(problem, CompilationKind.GROUNDING)
+        (first_file,) = os.listdir(self.directory.name)
+        first_path = os.path.join(self.directory.name, first_file)
+        os.utime(first_path, (0, 0))
+        size = os.path.getsize(first_path)
+        self.environment.compilation_cache = CompilationCache(
+            self.directory.name, max_size=size + size // 2
+        )
+        Grounder(prune_actions=False).compile(problem, CompilationKind.GROUNDING)
+        files = os.listdir(self.directory.name)
+        self.assertEqual(len(files), 1)
+        self.assertNotIn(first_file, files)
+
+    def test_invalid_files(self):
+        problem = self.problems["robot_loader_mod"].problem
+        CountingGrounder.compilations = 0
+        CountingGrounder().compile(problem, CompilationKind.GROUNDING)
+        (file_name,) = os.listdir(self.directory.name)
+        path = os.path.join(self.directory.name, file_name)
+        with open(path, "rb") as file:
+            data = file.read()
+        header_length = int.from_bytes(data[:4], "big")
+        header = json.loads(data[4 : 4 + header_length])
+        self.assertEqual(header["engine_name"], "grounder")
+
+        # the files that are not valid are compiled again and replaced
+        invalid_header = json.dumps({"engine_name": "grounder", "map_back": {}})
+        for content in [
+            pickle.dumps({"engine_name": "grounder"}),
+            len(invalid_header).to_bytes(4, "big")
+            + invalid_header.encode()
+            + data[4 + header_length :],
+        ]:
+            with open(path, "wb") as file:
+                file.write(content)
+            compilations = CountingGrounder.compilations
+            CountingGrounder().compile(problem, CompilationKind.GROUNDING)
+            self.assertEqual(CountingGrounder.compilations, compilations + 1)
+            with open(path, "rb") as file:
+                self.assertEqual(file.read(), data)
@@ -24,6 +24,17 @@ from unified_planning.test import (
 )
 from unified_planning.test.examples import get_example_problems
 from unified_planning.engines import CompilationKind
+from unified_planning.engines.compilers import (
+    CompilersPipeline,
+    ConditionalEffectsRemover,
+)
+from unified_planning.exceptions import UPException
+
+
+class WrongKindConditionalEffectsRemover(ConditionalEffectsRemover):
+    @staticmethod
+    def resulting_problem_kind(problem_kind, compilation_kind=None):
+        return ProblemKind(version=problem_kind.version)
 
 
 class TestCompilersPipeline(unittest_TestCase):
@@ -59,3 +70,35 @@ class TestCompilersPipeline(unittest_TestCase):
                 problem_kind=problem.kind, plan_kind=new_plan.kind
             ) as pv:
                 self.assertTrue(pv.validate(problem, new_plan))
+
+    def test_problem_kinds(self):
+        problem = self.problems["robot_locations_connected"].problem
+        compilation_kinds = [
+            CompilationKind.BOUNDED_TYPES_REMOVING,
+            CompilationKind.QUANTIFIERS_REMOVING,
+            CompilationKind.DISJUNCTIVE_CONDITIONS_REMOVING,
+            CompilationKind.GROUNDING,
+        ]
+        with Compiler(
+            problem_kind=problem.kind, compilation_kinds=compilation_kinds
+        ) as compiler:
+            assert isinstance(compiler, CompilersPipeline)
+            new_problem = compiler.compile(problem).problem
+            assert isinstance(new_problem, Problem)
+            # the kind of the compiled problem is predicted, not computed
+            self.assertNotIn("kind", new_problem._memoized_views)
+            compiler.check_problem_kinds = True
+            checked_problem = compiler.compile(problem).problem
+        self.assertEqual(new_problem, checked_problem)
+        self.assertFalse(new_problem.kind.has_disjunctive_conditions())
+        self.assertFalse(new_problem.kind.has_existential_conditions())
+
+        # a wrong prediction is found only when checking the kinds
+        problem = self.problems["basic_conditional"].problem
+        remover = WrongKindConditionalEffectsRemover()
+        remover.default = CompilationKind.CONDITIONAL_EFFECTS_REMOVING
+        pipeline = CompilersPipeline([remover])
+        self.assertIsNotNone(pipeline.compile(problem).problem)
+        pipeline.check_problem_kinds = True
+        with self.assertRaises(UPException):
+            pipeline.compile(problem)
@@ -14,6 +14,7 @@
 
 
 import unified_planning
+import unified_planning as up
 from unified_planning.shortcuts import *
 from unified_planning.exceptions import UPProblemDefinitionError
 from unified_planning.model import GlobalStartTiming
@@ -141,3 +142,59 @@ class TestConditionalEffectsRemover(unittest_TestCase):
             "The condition of effect: if y then x := 5\ncould not be removed without changing the problem.",
             str(e.exception),
         )
+
+    def test_polynomial(self):
+        for name in ["basic_conditional", "complex_conditional"]:
+            test_case = self.problems[name]
+            problem = test_case.problem
+            cer = ConditionalEffectsRemover(polynomial=True)
+            res = cer.compile(problem, CompilationKind.CONDITIONAL_EFFECTS_REMOVING)
+            chain_problem = res.problem
+            assert isinstance(chain_problem, Problem)
+            assert res.map_back_action_instance is not None
+            self.assertFalse(chain_problem.kind.has_conditional_effects())
+            expected_actions = len(problem.unconditional_actions) + sum(
+                4 * len(a.conditional_effects) + 1 for a in problem.conditional_actions
+            )
+            self.assertEqual(len(chain_problem.actions), expected_actions)
+
+            for plan in test_case.valid_plans:
+                assert isinstance(plan, up.plans.SequentialPlan)
+                # every action is followed by the only applicable actions of its chain
+                actions = []
+                with SequentialSimulator(chain_problem) as simulator:
+                    state = simulator.get_initial_state()
+                    for ai in plan.actions:
+                        chain = [chain_problem.action(ai.action.name)]
+                        chain.extend(
+                            a
+                            for a in chain_problem.actions
+                            if a.name.startswith(
+                                (
+                                    f"{ai.action.name}_evaluate_",
+                                    f"{ai.action.name}_apply_",
+                                )
+                            )
+                        )
+                        applicable = [chain[0]]
+                        while applicable:
+                            new_ai = up.plans.ActionInstance(
+                                applicable[0], ai.actual_parameters
+                            )
+                            state = simulator.apply(state, new_ai)
+                            actions.append(new_ai)
+                            applicable = [
+                                a
+                                for a in chain[1:]
+                                if simulator.is_applicable(
+                                    state, a, ai.actual_parameters
+                                )
+                            ]
+                            self.assertLessEqual(len(applicable), 1)
+                chain_plan = up.plans.SequentialPlan(actions)
+                with PlanValidator(name="sequential_plan_validator") as validator:
+                    self.assertTrue(validator.validate(chain_problem, chain_plan))
+                mapped_plan = chain_plan.replace_action_instances(
+                    res.map_back_action_instance
+                )
+                self.assertEqual(str(mapped_plan), str(plan))
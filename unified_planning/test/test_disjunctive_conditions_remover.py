@@ -29,6 +29,7 @@ from unified_planning.test import (
     skipIfNoOneshotPlannerForProblemKind,
 )
 from unified_planning.test.examples import get_example_problems
+from unified_planning.plans import ActionInstance, SequentialPlan
 from unified_planning.engines import CompilationKind
 from unified_planning.engines.compilers import (
     DisjunctiveConditionsRemover,
@@ -325,3 +326,95 @@ class TestDisjunctiveConditionsRemover(unittest_TestCase):
                 self.assertEqual(
                     valid_res.status, up.engines.results.ValidationResultStatus.VALID
                 )
+
+    def test_polynomial(self):
+        Location = UserType("Location")
+        n = 4
+        x = [Fluent(f"x_{i}", l=Location) for i in range(n)]
+        y = [Fluent(f"y_{i}") for i in range(n)]
+        visited = Fluent("visited", l=Location)
+        visit = InstantaneousAction("visit", l=Location)
+        l = visit.parameter("l")
+        for i in range(n):
+            visit.add_precondition(Or(x[i](l), And(y[i], Or(Not(x[i](l)), y[i - 1]))))
+        visit.add_effect(visited(l), True)
+        set_x = InstantaneousAction("set_x", l=Location)
+        set_x.add_effect(x[0](set_x.parameter("l")), True)
+        problem = Problem("nested_disjunctions")
+        for f in x + y:
+            problem.add_fluent(f, default_initial_value=False)
+        problem.add_fluent(visited, default_initial_value=False)
+        locations = [Object(f"l{i}", Location) for i in range(n)]
+        problem.add_objects(locations)
+        for f in y[1:]:
+            problem.set_initial_value(f, True)
+        problem.add_action(visit)
+        problem.add_action(set_x)
+        problem.add_goal(And(Or(visited(o), x[1](o)) for o in locations[:2]))
+        problem.add_goal(And(Or(x[1](o), Not(x[2](o))) for o in locations[2:]))
+
+        dnf_res = DisjunctiveConditionsRemover().compile(
+            problem, CompilationKind.DISJUNCTIVE_CONDITIONS_REMOVING
+        )
+        assert isinstance(dnf_res.problem, Problem)
+        res = DisjunctiveConditionsRemover(polynomial=True).compile(
+            problem, CompilationKind.DISJUNCTIVE_CONDITIONS_REMOVING
+        )
+        compiled_problem = res.problem
+        assert isinstance(compiled_problem, Problem)
+        self.assertFalse(compiled_problem.kind.has_disjunctive_conditions())
+        # in DNF, 24 actions for visit (the ones of the 3^4 conjunctions that do not
+        # contain another one) and 2^4 for the goal; 2 + 16 actions for the chain of
+        # visit and 8 achievers for the goal otherwise
+        self.assertEqual(len(dnf_res.problem.actions), 24 + 1 + 16)
+        self.assertEqual(len(compiled_problem.actions), 18 + 1 + 8)
+
+        # every visit is expanded in its chain, applying the achievers that are
+        # applicable, then the achievers of the goal are applied
+        with SequentialSimulator(compiled_problem) as simulator:
+            state = simulator.get_initial_state()
+            compiled_actions: List[ActionInstance] = []
+
+            def apply_achievers(prefix, parameters):
+                nonlocal state
+                changed = True
+                while changed:
+                    changed = False
+                    for a in compiled_problem.actions:
+                        if not a.name.startswith(prefix):
+                            continue
+                        assert isinstance(a, InstantaneousAction)
+                        ai = ActionInstance(a, parameters)
+                        fluent = a.effects[0].fluent.fluent()(*parameters)
+                        if not state.get_value(fluent).is_true() and (
+                            simulator.is_applicable(state, ai)
+                        ):
+                            apply(a.name, parameters)
+                            changed = True
+
+            def apply(name, parameters):
+                nonlocal state
+                ai = ActionInstance(compiled_problem.action(name), parameters)
+                self.assertTrue(simulator.is_applicable(state, ai))
+                state = simulator.apply(state, ai)
+                compiled_actions.append(ai)
+
+            for o in locations[:2]:
+                apply("set_x", [o])
+                apply("visit", [o])
+                apply_achievers("visit_achieve", [o])
+                apply("visit_end", [o])
+            apply_achievers("dcrm_goal_achieve", [])
+            self.assertTrue(simulator.is_goal(state))
+        compiled_plan = SequentialPlan(compiled_actions)
+        assert res.map_back_action_instance is not None
+        with PlanValidator(name="sequential_plan_validator") as validator:
+            self.assertTrue(validator.validate(compiled_problem, compiled_plan))
+            plan = compiled_plan.replace_action_instances(res.map_back_action_instance)
+            assert isinstance(plan, SequentialPlan)
+            self.assertEqual(len(plan.actions), 4)
+            self.assertEqual(
+                [a.action.name for a in plan.actions],
+                ["set_x", "visit", "set_x", "visit"],
+            )
+            self.assertTrue(validator.validate(problem, plan))
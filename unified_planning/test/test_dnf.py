@@ -15,6 +15,7 @@
 
 import unified_planning
 from unified_planning.shortcuts import *
+from unified_planning.exceptions import UPExpressionTooLargeError
 from unified_planning.test import unittest_TestCase, main
 from unified_planning.environment import get_environment
 from unified_planning.model.walkers import Dnf, Nnf, Substituter
@@ -56,6 +57,40 @@ class TestDnf(unittest_TestCase):
         dnf2 = dnf.get_dnf_expression(e2)
         self.assertIn("((a and (not b)) or (a and (not c) and d))", str(dnf2))
 
+    def test_max_disjuncts(self):
+        dnf = Dnf(get_environment())
+
+        fluents = [FluentExp(Fluent(f"f{i}")) for i in range(40)]
+        # the DNF has 2^20 disjuncts
+        e = And(Or(fluents[i], fluents[i + 20]) for i in range(20))
+        with self.assertRaises(UPExpressionTooLargeError):
+            dnf.get_dnf_expression(e, max_disjuncts=100)
+        small = And(Or(fluents[0], fluents[1]), Or(fluents[2], fluents[3]))
+        self.assertEqual(len(dnf.get_dnf_expression(small, max_disjuncts=4).args), 4)
+        with self.assertRaises(UPExpressionTooLargeError):
+            dnf.get_dnf_expression(small, max_disjuncts=3)
+        self.assertTrue(dnf.get_dnf_expression(And(TRUE(), TRUE())).is_true())
+
+    def test_memoization(self):
+        environment = get_environment()
+        nnf = environment.nnf_converter
+        dnf = environment.dnf_converter
+
+        a = FluentExp(Fluent("a"))
+        b = FluentExp(Fluent("b"))
+        c = FluentExp(Fluent("c"))
+        shared = Implies(a, Or(b, c))
+        # the NNF of the shared sub-expression is memoized with both polarities
+        nnf.get_nnf_expression(And(shared, c))
+        nnf.get_nnf_expression(Not(And(shared, b)))
+        self.assertIn((shared, True), nnf.memoization)
+        self.assertIn((shared, False), nnf.memoization)
+        self.assertIs(dnf._nnf, nnf)
+        # the repeated and subsumed conjunctions are removed
+        e = And(Or(a, And(a, b), b), Or(a, c))
+        self.assertEqual(str(dnf.get_dnf_expression(e)), "(a or (b and c))")
+        self.assertIn(nnf.get_nnf_expression(e), dnf.memoization)
+
     def test_nnf_dnf_3(self):
         n = Nnf(get_environment())
         dnf = Dnf(get_environment())
@@ -71,8 +106,9 @@ class TestDnf(unittest_TestCase):
             "(((not a) or b) and ((not a) or c)) or ((a and (not b)) and (a and (not c)))",
             str(nnf3),
         )
-        self.assertIn(
-            "(not a) or ((not a) and c) or (b and (not a)) or (b and c) or (a and (not b) and (not c)",
+        # the conjunctions containing (not a) are subsumed by it
+        self.assertEqual(
+            "((not a) or (b and c) or (a and (not b) and (not c)))",
             str(dnf3),
         )
 
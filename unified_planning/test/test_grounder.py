@@ -33,7 +33,7 @@ from unified_planning.test import (
 )
 from unified_planning.test.examples import get_example_problems
 from unified_planning.engines import CompilationKind
-from unified_planning.engines.compilers import Grounder
+from unified_planning.engines.compilers import Grounder, GrounderHelper
 
 
 class TestGrounder(unittest_TestCase):
@@ -308,6 +308,199 @@ class TestGrounder(unittest_TestCase):
         for a in grounded_problem.actions:
             self.assertEqual(len(a.parameters), 0)
 
+    def test_static_fluents_join(self):
+        # Every location is connected to some other location, so pruning every
+        # parameter on its own would keep all the pairs of locations
+        problem = Problem("ring")
+        Location = UserType("Location")
+        at = Fluent("at", BoolType(), position=Location)
+        connected = Fluent("connected", BoolType(), l_from=Location, l_to=Location)
+        blocked = Fluent("blocked", BoolType(), l_from=Location, l_to=Location)
+        move = InstantaneousAction("move", l_from=Location, l_to=Location)
+        l_from, l_to = move.parameters
+        move.add_precondition(at(l_from))
+        move.add_precondition(connected(l_from, l_to))
+        move.add_precondition(Not(blocked(l_from, l_to)))
+        move.add_precondition(connected(l_to, l_to))
+        move.add_effect(at(l_from), False)
+        move.add_effect(at(l_to), True)
+        problem.add_fluent(at, default_initial_value=False)
+        problem.add_fluent(connected, default_initial_value=False)
+        problem.add_fluent(blocked, default_initial_value=True)
+        problem.add_action(move)
+        locations = [Object(f"l{i}", Location) for i in range(6)]
+        problem.add_objects(locations)
+        for i, loc in enumerate(locations):
+            problem.set_initial_value(
+                connected(loc, locations[(i + 1) % len(locations)]), True
+            )
+            problem.set_initial_value(connected(loc, loc), True)
+            problem.set_initial_value(blocked(loc, loc), False)
+            problem.set_initial_value(
+                blocked(loc, locations[(i + 1) % len(locations)]), False
+            )
+        problem.set_initial_value(at(locations[0]), True)
+        problem.add_goal(at(locations[3]))
+
+        helper = GrounderHelper(problem)
+        groundings = list(helper.get_possible_parameters(move))
+        expected = []
+        for i, loc in enumerate(locations):
+            expected.append((loc, loc))
+            expected.append((loc, locations[(i + 1) % len(locations)]))
+        self.assertEqual(
+            set(groundings), {(ObjectExp(a), ObjectExp(b)) for a, b in expected}
+        )
+        self.assertEqual(len(groundings), len(expected))
+        res = Grounder().compile(problem, CompilationKind.GROUNDING)
+        assert isinstance(res.problem, Problem)
+        self.assertEqual(len(res.problem.actions), 12)
+
+    def test_static_fluents_without_pruning(self):
+        problem = Problem("no_pruning")
+        Location = UserType("Location")
+        at = Fluent("at", BoolType(), position=Location)
+        connected = Fluent("connected", BoolType(), l_from=Location, l_to=Location)
+        move = InstantaneousAction("move", l_from=Location, l_to=Location)
+        l_from, l_to = move.parameters
+        move.add_precondition(at(l_from))
+        move.add_precondition(connected(l_from, l_to))
+        move.add_effect(at(l_from), False)
+        move.add_effect(at(l_to), True)
+        problem.add_fluent(at, default_initial_value=False)
+        problem.add_fluent(connected, default_initial_value=False)
+        problem.add_action(move)
+        locations = [Object(f"l{i}", Location) for i in range(3)]
+        problem.add_objects(locations)
+        problem.set_initial_value(connected(locations[0], locations[1]), True)
+        problem.set_initial_value(at(locations[0]), True)
+        problem.add_goal(at(locations[1]))
+
+        # without pruning all the combinations of parameters are grounded
+        helper = GrounderHelper(problem, prune_actions=False)
+        self.assertEqual(len(list(helper.get_possible_parameters(move))), 9)
+        res = Grounder(prune_actions=False).compile(problem, CompilationKind.GROUNDING)
+        assert isinstance(res.problem, Problem)
+        self.assertEqual(len(res.problem.actions), 9)
+        res = Grounder().compile(problem, CompilationKind.GROUNDING)
+        assert isinstance(res.problem, Problem)
+        self.assertEqual(len(res.problem.actions), 1)
+
+    def test_reachability_analysis(self):
+        # Two disconnected chains of locations; the robot starts in the first
+        # one, so the moves in the second one are never applicable
+        problem = Problem("two_chains")
+        Location = UserType("Location")
+        at = Fluent("at", BoolType(), position=Location)
+        visited = Fluent("visited", BoolType(), position=Location)
+        connected = Fluent("connected", BoolType(), l_from=Location, l_to=Location)
+        move = InstantaneousAction("move", l_from=Location, l_to=Location)
+        l_from, l_to = move.parameters
+        move.add_precondition(at(l_from))
+        move.add_precondition(connected(l_from, l_to))
+        move.add_effect(at(l_from), False)
+        move.add_effect(at(l_to), True)
+        move.add_effect(visited(l_to), True)
+        problem.add_fluent(at, default_initial_value=False)
+        problem.add_fluent(visited, default_initial_value=False)
+        problem.add_fluent(connected, default_initial_value=False)
+        problem.add_action(move)
+        first = [Object(f"a{i}", Location) for i in range(4)]
+        second = [Object(f"b{i}", Location) for i in range(4)]
+        problem.add_objects(first + second)
+        for chain in [first, second]:
+            for loc_from, loc_to in zip(chain, chain[1:]):
+                problem.set_initial_value(connected(loc_from, loc_to), True)
+        problem.set_initial_value(at(first[0]), True)
+        problem.add_goal(visited(first[-1]))
+
+        full_res = Grounder().compile(problem, CompilationKind.GROUNDING)
+        res = Grounder(reachability_analysis=True).compile(
+            problem, CompilationKind.GROUNDING
+        )
+        assert isinstance(full_res.problem, Problem)
+        assert isinstance(res.problem, Problem)
+        self.assertEqual(len(full_res.problem.actions), 6)
+        self.assertEqual(len(res.problem.actions), 3)
+        map_back = res.map_back_action_instance
+        assert map_back is not None
+        for grounded_action in res.problem.actions:
+            self.assertEqual(len(grounded_action.parameters), 0)
+            original = map_back(unified_planning.plans.ActionInstance(grounded_action))
+            assert original is not None
+            self.assertEqual(original.action, move)
+            self.assertIn(original.actual_parameters[0].object(), first)
+
+        # The instances of the fluents that are never reachable are simplified to False
+        helper = GrounderHelper(problem, reachability_analysis=True)
+        self.assertEqual(helper.simplifier.simplify(at(second[0])), FALSE())
+        self.assertEqual(helper.simplifier.simplify(visited(first[0])), FALSE())
+        self.assertEqual(helper.simplifier.simplify(at(first[1])), at(first[1]))
+
+    def test_reachability_analysis_examples(self):
+        for name in [
+            "robot_locations_connected",
+            "hierarchical_blocks_world",
+            "matchcellar",
+            "logistic",
+        ]:
+            test_case = self.problems[name]
+            problem = test_case.problem
+            full_res = Grounder().compile(problem, CompilationKind.GROUNDING)
+            res = Grounder(reachability_analysis=True).compile(
+                problem, CompilationKind.GROUNDING
+            )
+            assert isinstance(full_res.problem, Problem)
+            assert isinstance(res.problem, Problem)
+            full_names = {a.name for a in full_res.problem.actions}
+            self.assertLessEqual(len(res.problem.actions), len(full_names))
+            map_back = res.map_back_action_instance
+            assert map_back is not None
+            groundings = set()
+            for grounded_action in res.problem.actions:
+                self.assertIn(grounded_action.name, full_names)
+                original = map_back(
+                    unified_planning.plans.ActionInstance(grounded_action)
+                )
+                assert original is not None
+                groundings.add((original.action, original.actual_parameters))
+            # The valid plans only use reachable groundings
+            for plan in test_case.valid_plans:
+                if isinstance(plan, unified_planning.plans.SequentialPlan):
+                    actions = plan.actions
+                elif isinstance(plan, unified_planning.plans.TimeTriggeredPlan):
+                    actions = [ai for _, ai, _ in plan.timed_actions]
+                else:
+                    continue
+                for ai in actions:
+                    self.assertIn((ai.action, ai.actual_parameters), groundings)
+
+    def test_parallel_grounding(self):
+        for name in [
+            "robot_locations_connected",
+            "hierarchical_blocks_world",
+            "matchcellar",
+            "locations_connected_cost_minimize",
+        ]:
+            problem = self.problems[name].problem
+            for reachability_analysis in [False, True]:
+                res = Grounder(reachability_analysis=reachability_analysis).compile(
+                    problem, CompilationKind.GROUNDING
+                )
+                parallel_res = Grounder(
+                    reachability_analysis=reachability_analysis, max_workers=2
+                ).compile(problem, CompilationKind.GROUNDING)
+                self.assertEqual(res.problem, parallel_res.problem)
+                assert isinstance(parallel_res.problem, Problem)
+                map_back = res.map_back_action_instance
+                parallel_map_back = parallel_res.map_back_action_instance
+                assert map_back is not None and parallel_map_back is not None
+                for grounded_action in parallel_res.problem.actions:
+                    ai = unified_planning.plans.ActionInstance(grounded_action)
+                    lifted, parallel_lifted = map_back(ai), parallel_map_back(ai)
+                    assert lifted is not None and parallel_lifted is not None
+                    self.assertTrue(lifted.is_semantically_equivalent(parallel_lifted))
+
     @skipIfEngineNotAvailable("pyperplan")
     def test_pyperplan_grounder(self):
         problem = self.problems["robot_no_negative_preconditions"].problem
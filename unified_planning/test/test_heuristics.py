@@ -0,0 +1,161 @@
+# Copyright 2021-2023 AIPlan4EU project
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import typing
+import unified_planning as up
+from unified_planning.shortcuts import *
+from unified_planning.engines import (
+    BestFirstSearchPlanner,
+    PlanGenerationResultStatus,
+    UPSequentialSimulator,
+)
+from unified_planning.engines.heuristics import (
+    RelaxedTask,
+    Heuristic,
+    HAdd,
+    HMax,
+    HFF,
+    LandmarkCount,
+)
+from unified_planning.test import unittest_TestCase, main
+from unified_planning.test.examples import get_example_problems
+
+
+class TestHeuristics(unittest_TestCase):
+    def setUp(self):
+        unittest_TestCase.setUp(self)
+        self.problems = get_example_problems()
+
+    def _chain_problem(self, length: int) -> Problem:
+        # A chain of locations where the robot must reach the last one
+        Location = UserType("Location")
+        at = Fluent("at", BoolType(), l=Location)
+        connected = Fluent("connected", BoolType(), l_from=Location, l_to=Location)
+        move = InstantaneousAction("move", l_from=Location, l_to=Location)
+        l_from, l_to = move.parameters
+        move.add_precondition(at(l_from))
+        move.add_precondition(connected(l_from, l_to))
+        move.add_effect(at(l_from), False)
+        move.add_effect(at(l_to), True)
+        problem = Problem("chain")
+        problem.add_fluent(at, default_initial_value=False)
+        problem.add_fluent(connected, default_initial_value=False)
+        problem.add_action(move)
+        locations = [Object(f"l{i}", Location) for i in range(length)]
+        problem.add_objects(locations)
+        for l1, l2 in zip(locations, locations[1:]):
+            problem.set_initial_value(connected(l1, l2), True)
+        problem.set_initial_value(at(locations[0]), True)
+        problem.add_goal(at(locations[-1]))
+        return problem
+
+    def test_chain(self):
+        problem = self._chain_problem(5)
+        task = RelaxedTask(problem)
+        heuristics = [HAdd(task), HMax(task), HFF(task), LandmarkCount(task)]
+        simulator = UPSequentialSimulator(problem)
+        compiled_simulator = UPSequentialSimulator(problem, compiled_state=True)
+        for sim in [simulator, compiled_simulator]:
+            state = sim.get_initial_state()
+            self.assertEqual([h(state) for h in heuristics], [4, 4, 4, 4])
+            move = problem.action("move")
+            l0, l1 = problem.object("l0"), problem.object("l1")
+            next_state = sim.apply(state, move, (l0, l1))
+            assert next_state is not None
+            self.assertEqual([h(next_state) for h in heuristics], [3, 3, 3, 3])
+
+        # Going back is not possible, so the goal is not reachable
+        reversed_problem = problem.clone()
+        reversed_problem.clear_goals()
+        reversed_problem.add_goal(
+            reversed_problem.fluent("at")(reversed_problem.object("l0"))
+        )
+        initial_state = UPSequentialSimulator(reversed_problem).get_initial_state()
+        assert isinstance(initial_state, up.model.UPState)
+        state = initial_state.make_child(
+            {
+                reversed_problem.fluent("at")(reversed_problem.object("l0")): FALSE(),
+                reversed_problem.fluent("at")(reversed_problem.object("l2")): TRUE(),
+            }
+        )
+        heuristic_classes: typing.List[typing.Type[Heuristic]] = [
+            HAdd,
+            HMax,
+            HFF,
+            LandmarkCount,
+        ]
+        for h_class in heuristic_classes:
+            self.assertIsNone(h_class(reversed_problem)(state))
+
+    def test_heuristic_values(self):
+        problem = self.problems["robot_locations_visited"].problem
+        task = RelaxedTask(problem)
+        simulator = UPSequentialSimulator(problem, compiled_state=True)
+        state = simulator.get_initial_state()
+        h_add, h_max, h_ff = HAdd(task)(state), HMax(task)(state), HFF(task)(state)
+        assert h_add is not None and h_max is not None and h_ff is not None
+        self.assertLessEqual(h_max, h_ff)
+        self.assertLessEqual(h_ff, h_add)
+        # h_max is admissible: the optimal plan has 4 actions
+        self.assertLessEqual(h_max, 4)
+        self.assertGreater(h_max, 0)
+
+        # Costs are given by the MinimizeActionCosts metric
+        test_case = self.problems["locations_connected_cost_minimize"]
+        problem = test_case.problem
+        state = UPSequentialSimulator(problem).get_initial_state()
+        self.assertEqual(HMax(problem)(state), test_case.optimum)
+
+    def test_search(self):
+        problem = self.problems["hierarchical_blocks_world"].problem
+        heuristic_classes: typing.List[typing.Type[Heuristic]] = [
+            HAdd,
+            HMax,
+            HFF,
+            LandmarkCount,
+        ]
+        for h_class in heuristic_classes:
+            planner = BestFirstSearchPlanner()
+            res = planner.solve(problem, heuristic=h_class(problem))
+            self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_SATISFICING)
+            assert res.plan is not None
+            with PlanValidator(problem_kind=problem.kind) as validator:
+                self.assertTrue(validator.validate(problem, res.plan))
+
+        test_case = self.problems["locations_connected_cost_minimize"]
+        with OneshotPlanner(
+            name="up_best_first_search",
+            params={"search": "astar", "heuristic": "hmax"},
+        ) as planner:
+            res = planner.solve(test_case.problem)
+        # the plan is optimal, but it is not reported as optimal
+        self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_SATISFICING)
+        assert res.plan is not None
+        with PlanValidator(problem_kind=test_case.problem.kind) as validator:
+            val_res = validator.validate(test_case.problem, res.plan)
+        self.assertEqual(
+            val_res.metric_evaluations[test_case.problem.quality_metrics[0]],
+            test_case.optimum,
+        )
+        for heuristic_name in ["hadd", "hff", "lmcount"]:
+            with OneshotPlanner(
+                name="up_best_first_search", params={"heuristic": heuristic_name}
+            ) as planner:
+                res = planner.solve(test_case.problem)
+            self.assertEqual(res.status, PlanGenerationResultStatus.SOLVED_SATISFICING)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 
+import gc
+import pickle
 import unified_planning
 from unified_planning.shortcuts import *
 from unified_planning.exceptions import (
@@ -61,6 +63,31 @@ class TestModel(unittest_TestCase):
             "type of the object does not belong to the same environment of the object",
         )
 
+    def test_bounded_memory_environment(self):
+        env = up.environment.Environment(bounded_memory=True)
+        em = env.expression_manager
+        x = Fluent("x", env.type_manager.IntType(), environment=env)
+        self.assertIs(em.Plus(x, 1), em.Plus(x, 1))
+        env.type_checker.memoization_limit = 10
+        env.simplifier.memoization_limit = 10
+        for i in range(1000):
+            env.simplifier.simplify(em.Plus(em.Times(x, i), i))
+        gc.collect()
+        # only the expressions still referenced are kept
+        self.assertLess(len(em.expressions), 100)
+        expression = em.Plus(x, 1)
+        self.assertIs(expression, em.Plus(x, 1))
+        self.assertEqual(env.simplifier.simplify(em.Plus(expression, 0)), expression)
+
+        problem = Problem("bounded", env)
+        problem.add_fluent(x, default_initial_value=0)
+        problem.add_goal(em.GE(x, 1))
+        pickled_problem = pickle.loads(pickle.dumps(problem))
+        pickled_em = pickled_problem.environment.expression_manager
+        self.assertTrue(pickled_problem.environment.bounded_memory)
+        pickled_x = pickled_problem.fluent("x")
+        self.assertIs(pickled_problem.goals[0], pickled_em.GE(pickled_x, 1))
+
     def test_clone_problem_and_action(self):
         for example in self.problems.values():
             problem = example.problem
@@ -68,9 +95,12 @@ class TestModel(unittest_TestCase):
                 continue
             problem_clone_1 = problem.clone()
             problem_clone_2 = problem.clone()
-            for action_1, action_2 in zip(
-                problem_clone_1.actions, problem_clone_2.actions
-            ):
+            # the actions of a clone are shared with the problem until the clone is
+            # modified, so the actions modified below are copies
+            actions_2 = [a.clone() for a in problem_clone_2.actions]
+            problem_clone_2.clear_actions()
+            problem_clone_2.add_actions(actions_2)
+            for action_1, action_2 in zip(problem_clone_1.actions, actions_2):
                 if isinstance(action_2, InstantaneousAction):
                     action_2._effects = []
                     action_1_clone = action_1.clone()
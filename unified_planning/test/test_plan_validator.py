@@ -13,6 +13,8 @@
 # limitations under the License.
 
 
+from typing import List, Optional, Tuple
+
 import unified_planning
 from unified_planning.shortcuts import *
 from unified_planning.test import unittest_TestCase, main
@@ -21,6 +23,7 @@ from unified_planning.engines import (
     SequentialPlanValidator,
     ValidationResultStatus,
     TimeTriggeredPlanValidator,
+    FailedValidationReason,
 )
 from unified_planning.environment import get_environment
 
@@ -58,6 +61,87 @@ class TestProblem(unittest_TestCase):
                         validation_result.status, ValidationResultStatus.INVALID
                     )
 
+    def test_validate_many(self):
+        spv = SequentialPlanValidator(environment=get_environment())
+        for name in [
+            "robot_locations_connected",
+            "locations_connected_cost_minimize",
+            "counter",
+        ]:
+            test_case = self.problems[name]
+            problem = test_case.problem
+            plans: List[up.plans.Plan] = []
+            for plan in test_case.valid_plans + test_case.invalid_plans:
+                assert isinstance(plan, up.plans.SequentialPlan)
+                plans.append(plan)
+                # the prefixes of the plan share their states with the plan
+                for i in range(len(plan.actions)):
+                    plans.append(up.plans.SequentialPlan(plan.actions[:i]))
+                plans.append(up.plans.SequentialPlan(plan.actions[::-1]))
+            for processes in [None, 2]:
+                results = spv.validate_many(problem, plans, processes=processes)
+                self.assertEqual(len(results), len(plans))
+                for plan, result in zip(plans, results):
+                    expected = spv.validate(problem, plan)
+                    self.assertEqual(result.status, expected.status)
+                    self.assertEqual(result.reason, expected.reason)
+                    self.assertEqual(
+                        result.metric_evaluations, expected.metric_evaluations
+                    )
+                    self.assertIs(
+                        result.inapplicable_action, expected.inapplicable_action
+                    )
+                    if result.reason == FailedValidationReason.INAPPLICABLE_ACTION:
+                        self.assertIsNotNone(result.inapplicable_action)
+                    if processes is None:
+                        assert isinstance(result.trace, list)
+                        assert isinstance(expected.trace, list)
+                        self.assertEqual(len(result.trace), len(expected.trace))
+                    else:
+                        self.assertIsNone(result.trace)
+
+        # the default implementation validates the plans one by one
+        ttpv = TimeTriggeredPlanValidator(environment=get_environment())
+        test_case = self.problems["matchcellar"]
+        plans = test_case.valid_plans + test_case.invalid_plans
+        results = ttpv.validate_many(test_case.problem, plans)
+        self.assertEqual(
+            [r.status for r in results],
+            [ttpv.validate(test_case.problem, p).status for p in plans],
+        )
+
+    def test_incremental(self):
+        test_case = self.problems["robot_locations_connected"]
+        problem = test_case.problem.clone()
+        plan = test_case.valid_plans[0]
+        assert isinstance(plan, up.plans.SequentialPlan)
+        prefixes = [
+            up.plans.SequentialPlan(plan.actions[:i])
+            for i in range(len(plan.actions) + 1)
+        ]
+        with PlanValidator(
+            name="sequential_plan_validator", params={"incremental": "true"}
+        ) as pv:
+            results = [pv.validate(problem, p) for p in reversed(prefixes)]
+            self.assertEqual(results[0].status, ValidationResultStatus.VALID)
+            for result in results[1:]:
+                self.assertEqual(result.status, ValidationResultStatus.INVALID)
+            # the states of the prefixes are the ones reached by the whole plan
+            assert isinstance(results[0].trace, list)
+            for i, result in enumerate(reversed(results)):
+                assert isinstance(result.trace, list)
+                self.assertEqual(len(result.trace), i + 1)
+                self.assertIs(result.trace[-1], results[0].trace[i])
+
+            # the problem is modified, so the plan is simulated again
+            problem.clear_goals()
+            result = pv.validate(problem, prefixes[0])
+            self.assertEqual(result.status, ValidationResultStatus.VALID)
+            result = pv.validate(problem, plan)
+            self.assertEqual(result.status, ValidationResultStatus.VALID)
+            assert isinstance(result.trace, list)
+            self.assertIsNot(result.trace[-1], results[0].trace[-1])
+
     def test_all_from_factory(self):
         with PlanValidator(name="sequential_plan_validator") as pv:
             self.assertEqual(pv.name, "sequential_plan_validator")
@@ -365,6 +449,60 @@ class TestProblem(unittest_TestCase):
                 self.assertIsInstance(qm, MinimizeActionCosts)
                 self.assertEqual(val, expected_cost)
 
+    def test_temporal_long_plan(self):
+        # A robot moving along a chain of locations, with an action per location
+        length = 100
+        Location = UserType("Location")
+        at = Fluent("at", BoolType(), l=Location)
+        connected = Fluent("connected", BoolType(), l_from=Location, l_to=Location)
+        free = Fluent("free", BoolType())
+        move = DurativeAction("move", l_from=Location, l_to=Location)
+        l_from, l_to = move.parameters
+        move.set_fixed_duration(2)
+        move.add_condition(StartTiming(), at(l_from))
+        move.add_condition(ClosedTimeInterval(StartTiming(), EndTiming()), free)
+        move.add_condition(
+            ClosedTimeInterval(StartTiming(), EndTiming()), connected(l_from, l_to)
+        )
+        move.add_effect(StartTiming(), at(l_from), False)
+        move.add_effect(EndTiming(), at(l_to), True)
+        problem = Problem("chain")
+        problem.add_fluent(at, default_initial_value=False)
+        problem.add_fluent(connected, default_initial_value=False)
+        problem.add_fluent(free, default_initial_value=True)
+        problem.add_action(move)
+        locations = [Object(f"l{i}", Location) for i in range(length)]
+        problem.add_objects(locations)
+        for l1, l2 in zip(locations, locations[1:]):
+            problem.set_initial_value(connected(l1, l2), True)
+        problem.set_initial_value(at(locations[0]), True)
+        problem.add_goal(at(locations[-1]))
+        # the robot is not free in the middle of the plan, while it is moving
+        busy_time = Fraction(3 * (length // 2) + 1)
+        problem.add_timed_effect(GlobalStartTiming(busy_time), free, False)
+        problem.add_timed_effect(GlobalStartTiming(busy_time + 1), free, True)
+
+        moves: List[Tuple[Fraction, up.plans.ActionInstance, Optional[Fraction]]] = [
+            (Fraction(3 * i), move(l1, l2), Fraction(2))
+            for i, (l1, l2) in enumerate(zip(locations, locations[1:]))
+        ]
+        pv = TimeTriggeredPlanValidator()
+        res = pv.validate(problem, up.plans.TimeTriggeredPlan(moves[: length // 2]))
+        self.assertEqual(res.status, ValidationResultStatus.INVALID)
+        self.assertIsNone(res.inapplicable_action)
+        self.assertEqual(res.reason, FailedValidationReason.UNSATISFIED_GOALS)
+
+        res = pv.validate(problem, up.plans.TimeTriggeredPlan(moves))
+        self.assertEqual(res.status, ValidationResultStatus.INVALID)
+        self.assertEqual(res.reason, FailedValidationReason.INAPPLICABLE_ACTION)
+        self.assertEqual(res.inapplicable_action, moves[length // 2][1])
+
+        problem.clear_timed_effects()
+        res = pv.validate(problem, up.plans.TimeTriggeredPlan(moves))
+        self.assertEqual(res.status, ValidationResultStatus.VALID)
+        assert res.trace is not None
+        self.assertEqual(len(res.trace), 2 * (length - 1) + 1)
+
     def test_state_invariants(self):
         problem = self.problems["robot_loader_weak_bridge"].problem
         move = problem.action("move")
@@ -13,7 +13,7 @@
 # limitations under the License.
 
 
-from typing import Callable
+from typing import Callable, List, cast
 import warnings
 import unified_planning as up
 from unified_planning.shortcuts import *
@@ -28,8 +28,12 @@ from unified_planning.model.problem_kind import (
 from unified_planning.test import unittest_TestCase, main, skipIfEngineNotAvailable
 from unified_planning.test import skipIfNoOneshotPlannerForProblemKind
 from unified_planning.test.examples import get_example_problems
-from unified_planning.engines import PlanGenerationResultStatus, CompilationKind
-from unified_planning.engines.results import POSITIVE_OUTCOMES
+from unified_planning.engines import (
+    PlanGenerationResult,
+    PlanGenerationResultStatus,
+    CompilationKind,
+)
+from unified_planning.engines.results import POSITIVE_OUTCOMES, Result
 from unified_planning.engines.mixins.oneshot_planner import OneshotPlannerMixin
 from unified_planning.exceptions import UPUsageError
 from unified_planning.model.metrics import MinimizeSequentialPlanLength
@@ -318,6 +322,81 @@ class TestPlanner(unittest_TestCase):
             plan = res.plan
             self.assertEqual(len(plan.actions), 10)
 
+    def test_parallel_streaming(self):
+        problem = self.problems["robot_locations_connected"].problem
+        names = ["up_best_first_search", "up_best_first_search"]
+        params = [
+            {"heuristic": "hff"},
+            {"search": "astar", "heuristic": "hmax"},
+        ]
+        with OneshotPlanner(names=names, params=params) as planner:
+            assert isinstance(planner, up.engines.Parallel)
+            streamed: List[Result] = []
+            planner.result_callback = streamed.append
+            final_report = planner.solve(problem)
+            # the satisficing plans are not definitive, so all the results are awaited
+            self.assertEqual(
+                final_report.status, PlanGenerationResultStatus.SOLVED_SATISFICING
+            )
+            self.assertEqual(len(streamed), 2)
+
+            # the first plan found is accepted and the other engine is terminated
+            streamed.clear()
+            planner.accept_result = (
+                lambda res: cast(PlanGenerationResult, res).plan is not None
+            )
+            final_report = planner.solve(problem)
+            self.assertEqual(len(streamed), 1)
+            self.assertEqual(
+                final_report.status, cast(PlanGenerationResult, streamed[0]).status
+            )
+            assert final_report.plan is not None
+            with PlanValidator(problem_kind=problem.kind) as validator:
+                self.assertTrue(validator.validate(problem, final_report.plan))
+
+    def test_parallel_workers(self):
+        problem = self.problems["robot_locations_connected"].problem
+        plan = self.problems["robot_locations_connected"].valid_plans[0]
+        with OneshotPlanner(
+            names=["up_best_first_search", "up_best_first_search"],
+            params=[{"heuristic": "hff"}, {"heuristic": "hadd"}],
+        ) as planner:
+            assert isinstance(planner, up.engines.Parallel)
+            planner.start_workers()
+            assert planner._workers is not None
+            workers_processes = [w.process for w in planner._workers]
+            for _ in range(3):
+                final_report = planner.solve(problem)
+                self.assertEqual(
+                    final_report.status, PlanGenerationResultStatus.SOLVED_SATISFICING
+                )
+                assert final_report.plan is not None
+                with PlanValidator(problem_kind=problem.kind) as validator:
+                    self.assertTrue(validator.validate(problem, final_report.plan))
+            # the workers are reused between the calls
+            self.assertEqual(workers_processes, [w.process for w in planner._workers])
+
+            # when a result is accepted, the workers still running are restarted
+            planner.accept_result = lambda res: True
+            final_report = planner.solve(problem)
+            self.assertIsNotNone(final_report.plan)
+            planner.accept_result = None
+            # the log messages contain the results of both the engines
+            log_messages = planner.solve(problem).log_messages
+            assert log_messages is not None
+            self.assertEqual(len(log_messages), 2)
+        self.assertIsNone(planner._workers)
+        self.assertTrue(all(not p.is_alive() for p in workers_processes))
+
+        with PlanValidator(
+            names=["sequential_plan_validator", "sequential_plan_validator"]
+        ) as validator:
+            assert isinstance(validator, up.engines.Parallel)
+            validator.start_workers()
+            self.assertTrue(validator.validate(problem, plan))
+            validator.shutdown()
+            self.assertTrue(validator.validate(problem, plan))
+
     def test_engine_class(self):
         with self.assertRaises(TypeError):
             Engine()  # type: ignore[abstract]
@@ -17,7 +17,8 @@ import unified_planning as up
 from unified_planning.shortcuts import *
 from unified_planning.test import unittest_TestCase, main, examples
 from unified_planning.test.examples import get_example_problems
-from unified_planning.exceptions import UPTypeError
+from unified_planning.model.types import domain_size, domain_item
+from unified_planning.exceptions import UPTypeError, UPValueError
 
 
 class TestProblem(unittest_TestCase):
@@ -628,6 +629,139 @@ class TestProblem(unittest_TestCase):
         self.assertFalse(p.kind.has_events())
         self.assertFalse(p.kind.has_processes())
 
+    def test_memoized_views(self):
+        problem = self.problems["robot"].problem
+        robot_at = problem.fluent("robot_at")
+        battery_charge = problem.fluent("battery_charge")
+        move = problem.action("move")
+        l1, l2 = problem.object("l1"), problem.object("l2")
+
+        # repeated reads reuse the computed results
+        self.assertIs(problem.initial_values, problem.initial_values)
+        kind = problem.kind
+        self.assertEqual(kind, problem.kind)
+        kind.set_problem_class("HIERARCHICAL")
+        self.assertFalse(problem.kind.has_hierarchical())
+        static_fluents = problem.get_static_fluents()
+        self.assertEqual(static_fluents, set())
+        static_fluents.add(robot_at)
+        self.assertEqual(problem.get_static_fluents(), set())
+        self.assertEqual(problem.clone().kind, problem.kind)
+
+        # the problem modifications are seen by the memoized results
+        self.assertEqual(problem.initial_values[robot_at(l2)], FALSE())
+        problem.set_initial_value(robot_at(l2), True)
+        self.assertEqual(problem.initial_values[robot_at(l2)], TRUE())
+        self.assertFalse(problem.kind.has_conditional_effects())
+        move.add_effect(robot_at(l1), True, robot_at(l2))
+        self.assertTrue(problem.kind.has_conditional_effects())
+        move.clear_effects()
+        move.add_effect(robot_at(l1), False)
+        self.assertEqual(problem.get_static_fluents(), {battery_charge})
+        self.assertEqual(problem.get_unused_fluents(), set())
+        cloned_move = problem.clone().action("move")
+        problem.clear_actions()
+        self.assertEqual(problem.get_unused_fluents(), {battery_charge})
+        self.assertFalse(problem.kind.has_conditional_effects())
+
+        # the actions of a cloned problem notify their modifications to the clone
+        new_problem = Problem("new", problem.environment)
+        new_problem.add_fluent(robot_at, default_initial_value=False)
+        self.assertEqual(new_problem.get_static_fluents(), {robot_at})
+        new_problem.add_action(cloned_move)
+        self.assertEqual(new_problem.get_static_fluents(), set())
+        cloned_problem = new_problem.clone()
+        self.assertEqual(cloned_problem.get_static_fluents(), set())
+        # the modified clone copies the shared actions
+        cloned_problem.clear_goals()
+        cloned_problem.action("move").clear_effects()
+        self.assertEqual(cloned_problem.get_static_fluents(), {robot_at})
+        self.assertEqual(new_problem.get_static_fluents(), set())
+
+    def test_copy_on_write_clone(self):
+        problem = self.problems["robot"].problem
+        robot_at = problem.fluent("robot_at")
+        l1, l2 = problem.object("l1"), problem.object("l2")
+        move = problem.action("move")
+        problem.add_quality_metric(MinimizeActionCosts({move: 2}))
+        original = problem.clone()
+
+        # the actions are shared, also when they are read from the clone
+        cloned = problem.clone()
+        self.assertEqual(cloned, original)
+        self.assertEqual(cloned.kind, problem.kind)
+        self.assertIs(cloned.actions[0], move)
+        self.assertIs(cloned.action("move"), move)
+        metric = cloned.quality_metrics[0]
+        assert isinstance(metric, MinimizeActionCosts)
+        self.assertEqual(list(metric.costs), [move])
+
+        # the clone copies the shared actions before they are modified
+        cloned_of_cloned = cloned.clone()
+        move.add_precondition(robot_at(l1))
+        self.assertEqual(cloned, original)
+        self.assertEqual(cloned_of_cloned, original)
+        self.assertNotEqual(problem, original)
+        self.assertIsNot(cloned.action("move"), move)
+        self.assertEqual(len(cloned.action("move").preconditions), 4)
+        self.assertEqual(len(problem.action("move").preconditions), 5)
+        metric = cloned.quality_metrics[0]
+        assert isinstance(metric, MinimizeActionCosts)
+        self.assertEqual(list(metric.costs), [cloned.action("move")])
+
+        # a modified clone copies the shared actions, that can then be modified
+        cloned = problem.clone()
+        cloned.clear_goals()
+        cloned_move = cloned.action("move")
+        self.assertIsNot(cloned_move, move)
+        cloned_move.add_precondition(robot_at(l2))
+        self.assertEqual(len(cloned.action("move").preconditions), 6)
+        self.assertEqual(len(problem.action("move").preconditions), 5)
+
+        # the initial values are copied by the first problem modifying them
+        cloned = problem.clone()
+        cloned.set_initial_value(robot_at(l2), True)
+        self.assertEqual(problem.initial_value(robot_at(l2)), FALSE())
+        self.assertEqual(cloned.initial_value(robot_at(l2)), TRUE())
+        problem.set_initial_value(robot_at(l1), False)
+        self.assertEqual(cloned.initial_value(robot_at(l1)), TRUE())
+        self.assertEqual(problem.initial_value(robot_at(l1)), FALSE())
+
+    def test_objects_index(self):
+        Vehicle = UserType("Vehicle")
+        Car = UserType("Car", Vehicle)
+        Truck = UserType("Truck", Vehicle)
+        problem = Problem("vehicles")
+        car1, truck1, car2 = (
+            Object("car1", Car),
+            Object("t1", Truck),
+            Object("car2", Car),
+        )
+        problem.add_objects([car1, truck1, car2])
+
+        self.assertEqual(list(problem.objects(Vehicle)), [car1, truck1, car2])
+        self.assertEqual(list(problem.objects(Car)), [car1, car2])
+        self.assertEqual(domain_size(problem, Vehicle), 3)
+        self.assertEqual(domain_item(problem, Vehicle, 1), ObjectExp(truck1))
+
+        # the objects added after a query are added to the indexes
+        truck2 = problem.add_object("t2", Truck)
+        self.assertEqual(list(problem.objects(Vehicle)), [car1, truck1, car2, truck2])
+        self.assertEqual(list(problem.objects(Truck)), [truck1, truck2])
+        self.assertEqual(domain_size(problem, Truck), 2)
+        self.assertEqual(domain_item(problem, Truck, 1), ObjectExp(truck2))
+        self.assertTrue(problem.has_object("t2"))
+        self.assertFalse(problem.has_object("t3"))
+        self.assertEqual(problem.object("car2"), car2)
+        with self.assertRaises(UPValueError):
+            problem.object("t3")
+
+        cloned = problem.clone()
+        cloned.add_object("t3", Truck)
+        self.assertEqual(len(list(cloned.objects(Vehicle))), 5)
+        self.assertEqual(len(list(problem.objects(Vehicle))), 4)
+        self.assertFalse(problem.has_object("t3"))
+
 
 if __name__ == "__main__":
     main()
@@ -20,7 +20,7 @@ import pytest
 from itertools import product
 from unified_planning.shortcuts import *
 from unified_planning.engines import UPSequentialSimulator, SequentialSimulatorMixin
-from unified_planning.model import State
+from unified_planning.model import State, UPCompiledState
 from unified_planning.plans import ActionInstance
 from unified_planning.test import unittest_TestCase, main
 from unified_planning.test.examples import get_example_problems
@@ -131,6 +131,75 @@ class TestSimulator(unittest_TestCase):
         simulator = UPSequentialSimulator(problem)
         self.simulate_on_hierarchical_blocks_world(simulator, problem)
 
+    def test_with_compiled_state(self):
+        problem = self.problems["hierarchical_blocks_world"].problem
+        simulator = UPSequentialSimulator(problem, compiled_state=True)
+        self.assertIsInstance(simulator.get_initial_state(), UPCompiledState)
+        self.simulate_on_hierarchical_blocks_world(simulator, problem)
+
+    def test_compiled_state_equivalence(self):
+        for name in [
+            "robot",
+            "robot_loader_weak_bridge",
+            "basic_bounded_int_action_param",
+        ]:
+            example = self.problems[name]
+            problem, plan = example.problem, example.valid_plans[0]
+            dict_simulator = UPSequentialSimulator(problem)
+            compiled_simulator = UPSequentialSimulator(problem, compiled_state=True)
+            dict_state: Optional[State] = dict_simulator.get_initial_state()
+            compiled_state: Optional[State] = compiled_simulator.get_initial_state()
+            for ai in plan.actions:
+                assert dict_state is not None and compiled_state is not None
+                self.assertEqual(
+                    set(dict_simulator.get_applicable_actions(dict_state)),
+                    set(compiled_simulator.get_applicable_actions(compiled_state)),
+                )
+                dict_state = dict_simulator.apply(dict_state, ai)
+                compiled_state = compiled_simulator.apply(compiled_state, ai)
+                assert dict_state is not None and compiled_state is not None
+                for fe in problem.initial_values:
+                    self.assertEqual(
+                        dict_state.get_value(fe).constant_value(),
+                        compiled_state.get_value(fe).constant_value(),
+                    )
+            assert compiled_state is not None
+            self.assertTrue(compiled_simulator.is_goal(compiled_state))
+            # every action of the plan is evaluated through its compiled version
+            self.assertTrue(compiled_simulator._compiled_actions)
+            self.assertTrue(
+                all(
+                    ca is not None
+                    for ca in compiled_simulator._compiled_actions.values()
+                )
+            )
+
+    def test_incremental_applicable_actions(self):
+        for name in [
+            "hierarchical_blocks_world",
+            "robot_loader_weak_bridge",
+            "robot_fluent_of_user_type",
+        ]:
+            problem = self.problems[name].problem
+            simulator = UPSequentialSimulator(problem, compiled_state=True)
+            init = simulator.get_initial_state()
+            frontier = [(init, list(simulator.get_applicable_actions(init)))]
+            seen = {init}
+            while frontier:
+                state, applicable = frontier.pop()
+                for action, params in applicable:
+                    child = simulator.apply(state, action, params)
+                    assert child is not None
+                    child_applicable = list(
+                        simulator.get_applicable_actions_from_parent(child, applicable)
+                    )
+                    self.assertEqual(
+                        child_applicable, list(simulator.get_applicable_actions(child))
+                    )
+                    if child not in seen:
+                        seen.add(child)
+                        frontier.append((child, child_applicable))
+
     def test_with_simulator_from_factory(self):
         problem = self.problems["hierarchical_blocks_world"].problem
         with SequentialSimulator(problem) as simulator:
@@ -166,6 +235,27 @@ class TestSimulator(unittest_TestCase):
             double_dec_state = simulator.apply(dec_state, decrease)
             self.assertIsNone(double_dec_state)
 
+    def test_bounded_types_compiled_state(self):
+        counter = Fluent("counter", IntType(0))
+        increase = InstantaneousAction("increase")
+        increase.add_increase_effect(counter, 1)
+        decrease = InstantaneousAction("decrease")
+        decrease.add_decrease_effect(counter, 1)
+        problem = Problem("simple_counter")
+        problem.add_fluent(counter, default_initial_value=1)
+        problem.add_action(increase)
+        problem.add_action(decrease)
+
+        with SequentialSimulator(problem, params={"compiled_state": True}) as simulator:
+            init = simulator.get_initial_state()
+            self.assertTrue(simulator.is_applicable(init, increase))
+
+            dec_state = simulator.apply(init, decrease)
+            assert dec_state is not None
+            self.assertFalse(simulator.is_applicable(dec_state, decrease))
+            double_dec_state = simulator.apply(dec_state, decrease)
+            self.assertIsNone(double_dec_state)
+
     def test_exceptions(self):
         condition1 = Fluent("condition1")
         condition2 = Fluent("condition2")
@@ -203,6 +293,45 @@ class TestSimulator(unittest_TestCase):
             test_state = simulator.apply(new_state, test_int)
             self.assertIsNotNone(test_state)
 
+    def test_exceptions_compiled_state(self):
+        condition1 = Fluent("condition1")
+        condition2 = Fluent("condition2")
+        condition3 = Fluent("condition3")
+        fluent = Fluent("fluent", IntType())
+
+        test_int = InstantaneousAction("test_int")
+        test_int.add_effect(fluent, 5, condition1)
+        test_int.add_effect(fluent, 6, condition2)
+        test_int.add_increase_effect(fluent, 5, condition3)
+        unset_cond_1 = InstantaneousAction("unset_cond_1")
+        unset_cond_1.add_effect(condition1, False)
+        unset_cond_2 = InstantaneousAction("unset_cond_2")
+        unset_cond_2.add_effect(condition2, False)
+        unset_cond_3 = InstantaneousAction("unset_cond_3")
+        unset_cond_3.add_effect(condition3, False)
+
+        problem = Problem("test_problem")
+        problem.add_actions([test_int, unset_cond_1, unset_cond_2, unset_cond_3])
+        problem.add_fluent(condition1, default_initial_value=True)
+        problem.add_fluent(condition2, default_initial_value=True)
+        problem.add_fluent(condition3, default_initial_value=True)
+        problem.add_fluent(fluent, default_initial_value=0)
+
+        with SequentialSimulator(
+            problem=problem, params={"compiled_state": True}
+        ) as simulator:
+            init = simulator.get_initial_state()
+
+            self.assertFalse(simulator.is_applicable(init, test_int))
+            self.assertIsNone(simulator.apply(init, test_int))
+
+            new_state = simulator.apply(init, unset_cond_2)
+            self.assertIsNone(simulator.apply(new_state, test_int))
+
+            new_state = simulator.apply(new_state, unset_cond_3)
+            test_state = simulator.apply(new_state, test_int)
+            self.assertIsNotNone(test_state)
+
     def test_add_after_delete(self):
         bf = Fluent("bool_fluent")
 
@@ -224,6 +353,29 @@ class TestSimulator(unittest_TestCase):
 
             self.assertTrue(simulator.is_goal(goal_state))
 
+    def test_add_after_delete_compiled_state(self):
+        bf = Fluent("bool_fluent")
+
+        act = InstantaneousAction("act")
+        act.add_effect(bf, True)
+        act.add_effect(bf, False)
+
+        problem = Problem("test_add_after_delete")
+        problem.add_fluent(bf, default_initial_value=False)
+        problem.add_action(act)
+        problem.add_goal(bf)
+
+        with SequentialSimulator(
+            problem=problem, params={"compiled_state": True}
+        ) as simulator:
+            init = simulator.get_initial_state()
+
+            self.assertTrue(simulator.is_applicable(init, act))
+
+            goal_state = simulator.apply_unsafe(init, act)
+
+            self.assertTrue(simulator.is_goal(goal_state))
+
     def test_parameters_type(self):
         # Test that the simulator correctly handles fluents with bool parameters
         example = self.problems["basic_bool_fluent_param"]
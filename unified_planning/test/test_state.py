@@ -16,7 +16,7 @@ from random import shuffle
 import unified_planning
 from unified_planning.shortcuts import *
 from unified_planning.test import unittest_TestCase
-from unified_planning.exceptions import UPValueError
+from unified_planning.exceptions import UPUsageError, UPValueError
 
 
 class TestUPState(unittest_TestCase):
@@ -84,3 +84,41 @@ class TestUPState(unittest_TestCase):
 
         with self.assertRaises(UPValueError):
             UPState({a: n0 + b})
+
+
+class TestUPCompiledState(unittest_TestCase):
+    def setUp(self):
+        unittest_TestCase.setUp(self)
+
+    def test_state(self):
+        Location = UserType("Location")
+        l1, l2 = Object("l1", Location), Object("l2", Location)
+        a = FluentExp(Fluent("a", IntType()))
+        b = FluentExp(Fluent("b", RealType()))
+        c = FluentExp(Fluent("c"))
+        pos = FluentExp(Fluent("pos", Location))
+        values = {a: Int(0), b: Real(Fraction(1, 2)), c: FALSE(), pos: ObjectExp(l1)}
+
+        state_1 = UPCompiledState(values)
+        state_1_copy = UPCompiledState(values, state_1.layout)
+        self.assertEqual(state_1, state_1_copy)
+        self.assertEqual(hash(state_1), hash(state_1_copy))
+        for fluent, value in values.items():
+            self.assertEqual(state_1.get_value(fluent), value)
+
+        state_2 = state_1.make_child({a: Int(3), c: TRUE(), pos: ObjectExp(l2)})
+        self.assertNotEqual(state_1, state_2)
+        self.assertEqual(state_2.get_value(a), Int(3))
+        self.assertEqual(state_2.get_value(b), Real(Fraction(1, 2)))
+        self.assertEqual(state_2.get_value(c), TRUE())
+        self.assertEqual(state_2.get_value(pos), ObjectExp(l2))
+        self.assertEqual(state_1.get_value(c), FALSE())
+
+        state_3 = state_2.make_child({a: Int(0), c: FALSE(), pos: ObjectExp(l1)})
+        self.assertEqual(state_1, state_3)
+        self.assertEqual(hash(state_1), hash(state_3))
+
+        with self.assertRaises(UPUsageError):
+            state_1.make_child({FluentExp(Fluent("d")): TRUE()})
+        with self.assertRaises(UPValueError):
+            state_1.make_child({a: a + 1})
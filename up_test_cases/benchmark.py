@@ -0,0 +1,380 @@
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import unified_planning
+from unified_planning.shortcuts import *
+from unified_planning.engines import CompilationKind, UPSequentialSimulator
+from unified_planning.engines.mixins import CompilerMixin, PlanValidatorMixin
+from unified_planning.environment import get_environment
+from unified_planning.exceptions import UPException
+from unified_planning.io import PDDLReader, PDDLWriter
+from unified_planning.plans import SequentialPlan
+from unified_planning.test import TestCase
+
+from utils import _get_test_cases  # type: ignore
+
+
+get_environment().credits_stream = None  # silence credits
+
+# A benchmark is a function returning the number of operations it performs
+Benchmark = Callable[[], int]
+
+
+def pddl_benchmarks(test_case: TestCase) -> Iterator[Tuple[str, Benchmark]]:
+    """Writes the problem in PDDL and parses it back."""
+    problem = test_case.problem
+    if not isinstance(problem, Problem):
+        return
+    try:
+        writer = PDDLWriter(problem)
+        domain_str, problem_str = writer.get_domain(), writer.get_problem()
+    except UPException:
+        return
+
+    def write() -> int:
+        writer = PDDLWriter(problem)
+        writer.get_domain()
+        writer.get_problem()
+        return 1
+
+    def parse() -> int:
+        PDDLReader().parse_problem_string(domain_str, problem_str)
+        return 1
+
+    yield "pddl_writer", write
+    yield "pddl_parsing", parse
+
+
+def protobuf_benchmarks(test_case: TestCase) -> Iterator[Tuple[str, Benchmark]]:
+    """Converts the problem to protobuf, serializes it and converts it back."""
+    try:
+        import unified_planning.grpc.generated.unified_planning_pb2 as proto
+        from unified_planning.grpc.proto_reader import ProtobufReader  # type: ignore[attr-defined]
+        from unified_planning.grpc.proto_writer import ProtobufWriter  # type: ignore[attr-defined]
+    except ImportError:
+        return
+    problem = test_case.problem
+    try:
+        ProtobufWriter().convert(problem)
+    except (KeyError, ValueError, UPException):
+        return
+
+    def round_trip() -> int:
+        payload = ProtobufWriter().convert(problem).SerializeToString()
+        ProtobufReader().convert(proto.Problem.FromString(payload), problem.environment)  # type: ignore[attr-defined]
+        return 1
+
+    yield "protobuf_round_trip", round_trip
+
+
+def compiler_benchmarks(test_case: TestCase) -> Iterator[Tuple[str, Benchmark]]:
+    """Compiles the problem with every compiler of the library supporting it."""
+    problem = test_case.problem
+    factory = problem.environment.factory
+    for name in factory.engines:
+        engine_class = factory.engine(name)
+        if not issubclass(engine_class, CompilerMixin) or not (
+            engine_class.__module__.startswith("unified_planning.engines.compilers")
+        ):
+            continue
+        for kind in CompilationKind:
+            if engine_class.supports_compilation(kind) and engine_class.supports(
+                problem.kind
+            ):
+                yield f"compile:{name}", partial(_compile, problem, name, kind)
+
+
+def _compile(problem: AbstractProblem, name: str, kind: CompilationKind) -> int:
+    with Compiler(name=name) as compiler:
+        compiler.compile(problem, kind)
+    return 1
+
+
+def simulation_benchmarks(test_case: TestCase) -> Iterator[Tuple[str, Benchmark]]:
+    """Simulates the first valid sequential plan and validates all the valid plans."""
+    problem = test_case.problem
+    sequential_plans = [
+        p for p in test_case.valid_plans if isinstance(p, SequentialPlan)
+    ]
+    if (
+        sequential_plans
+        and isinstance(problem, Problem)
+        and UPSequentialSimulator.supports(problem.kind)
+    ):
+        simulated_plan = sequential_plans[0]
+
+        def simulate() -> int:
+            simulator = UPSequentialSimulator(problem)
+            state: Optional[State] = simulator.get_initial_state()
+            for ai in simulated_plan.actions:
+                assert state is not None
+                state = simulator.apply(state, ai)
+            assert state is not None
+            return len(simulated_plan.actions)
+
+        yield "simulator_steps", simulate
+    plans = test_case.valid_plans
+    if plans:
+        try:
+            validator = PlanValidator(
+                problem_kind=problem.kind, plan_kind=plans[0].kind
+            )
+        except UPException:
+            return
+        assert isinstance(validator, PlanValidatorMixin)
+
+        def validate() -> int:
+            for plan in plans:
+                validator.validate(problem, plan)
+            return len(plans)
+
+        yield "plan_validation", validate
+
+
+BENCHMARKS: Dict[str, Callable[[TestCase], Iterator[Tuple[str, Benchmark]]]] = {
+    "pddl": pddl_benchmarks,
+    "protobuf": protobuf_benchmarks,
+    "compilers": compiler_benchmarks,
+    "simulation": simulation_benchmarks,
+}
+
+
+def measure(benchmark: Benchmark, repeat: int, memory: bool) -> Dict[str, Any]:
+    """
+    Runs the given benchmark `repeat` times and returns the best time, the number of
+    operations and, if `memory` is set, the peak memory allocated in an additional run.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operations = benchmark()
+        times.append(time.perf_counter() - start)
+    result: Dict[str, Any] = {"time": min(times), "operations": operations}
+    if memory:
+        tracemalloc.start()
+        try:
+            benchmark()
+            result["peak_memory"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run_benchmarks(
+    test_cases: Dict[str, TestCase],
+    groups: List[str],
+    repeat: int,
+    memory: bool,
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    results: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    header = ["benchmark", "time", "ops/s", "peak"]
+    print(f"{header[0]:70s}" + "".join(h.rjust(14) for h in header[1:]))
+    for name, test_case in test_cases.items():
+        for group in groups:
+            try:
+                benchmarks = list(BENCHMARKS[group](test_case))
+            except Exception as e:
+                print(f"{name + ' ' + group:70s} {type(e).__name__}: {e}")
+                continue
+            for benchmark_name, benchmark in benchmarks:
+                full_name = f"{name} {benchmark_name}"
+                try:
+                    result = measure(benchmark, repeat, memory)
+                except Exception as e:
+                    print(f"{full_name:70s} {type(e).__name__}: {e}")
+                    continue
+                results.setdefault(name, {})[benchmark_name] = result
+                throughput = result["operations"] / max(result["time"], 1e-9)
+                peak = result.get("peak_memory", None)
+                peak_str = "-" if peak is None else f"{peak / 2**20:.2f}MB"
+                print(
+                    f"{full_name:70s}{result['time']:13.4f}s{throughput:14.1f}{peak_str:>14s}"
+                )
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, Dict[str, Any]]],
+    baseline: Dict[str, Dict[str, Dict[str, Any]]],
+    time_threshold: float,
+    memory_threshold: float,
+    min_time: float,
+    min_memory: float,
+) -> List[str]:
+    """
+    Returns the regressions of the given results with respect to the baseline: the
+    benchmarks slower or using more memory than the baseline by more than the given
+    relative thresholds; the times below `min_time` and the peaks below `min_memory`
+    are too noisy to be compared.
+    """
+    regressions = []
+    for name, benchmarks in results.items():
+        for benchmark_name, result in benchmarks.items():
+            expected = baseline.get(name, {}).get(benchmark_name, None)
+            if expected is None:
+                continue
+            full_name = f"{name} {benchmark_name}"
+            old_time, new_time = expected["time"], result["time"]
+            if new_time >= min_time and new_time > old_time * (1 + time_threshold):
+                regressions.append(
+                    f"{full_name}: time {old_time:.4f}s -> {new_time:.4f}s"
+                )
+            old_peak = expected.get("peak_memory", None)
+            new_peak = result.get("peak_memory", None)
+            if (
+                old_peak is not None
+                and new_peak is not None
+                and new_peak >= min_memory
+                and new_peak > old_peak * (1 + memory_threshold)
+            ):
+                regressions.append(
+                    f"{full_name}: peak memory {old_peak / 2**20:.2f}MB -> {new_peak / 2**20:.2f}MB"
+                )
+    return regressions
+
+
+def main(args: List[str]) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks the time and the memory used by the library on the test cases.",
+        allow_abbrev=False,
+    )
+    parser.add_argument(
+        "-p",
+        "--packages",
+        type=str,
+        nargs="+",
+        help="gathers the tests by searching the get_test_cases method inside given packages",
+        dest="packages",
+        default=["performance", "builtin"],
+    )
+    parser.add_argument(
+        "-f",
+        "--filter",
+        "--filters",
+        type=str,
+        nargs="+",
+        help="Runs only the test that contains one of the given filters.",
+        dest="filters",
+        default=[],
+    )
+    parser.add_argument(
+        "-b",
+        "--benchmarks",
+        type=str,
+        nargs="+",
+        choices=list(BENCHMARKS),
+        help="Runs only the given groups of benchmarks; defaults to all of them.",
+        dest="benchmarks",
+        default=list(BENCHMARKS),
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        help="The number of runs of every benchmark; the best time is reported.",
+        dest="repeat",
+        default=3,
+    )
+    parser.add_argument(
+        "--no-memory",
+        action="store_false",
+        dest="memory",
+        help="Does not measure the peak memory, that requires an additional traced run.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        help="Writes the results in the given JSON file.",
+        dest="output",
+        default=None,
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        help="Compares the results with the ones in the given JSON file and fails on regressions.",
+        dest="baseline",
+        default=None,
+    )
+    parser.add_argument(
+        "--time-threshold",
+        type=float,
+        help="The relative slowdown considered a regression, defaults to 0.2.",
+        dest="time_threshold",
+        default=0.2,
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        help="The relative peak memory increase considered a regression, defaults to 0.1.",
+        dest="memory_threshold",
+        default=0.1,
+    )
+    parser.add_argument(
+        "--min-time",
+        type=float,
+        help="The times below this value (in seconds) are not compared, defaults to 0.01.",
+        dest="min_time",
+        default=0.01,
+    )
+    parser.add_argument(
+        "--min-memory",
+        type=float,
+        help="The peaks of memory below this value (in MB) are not compared, defaults to 1.",
+        dest="min_memory",
+        default=1.0,
+    )
+    parsed_args = parser.parse_args(args)
+
+    test_cases: Dict[str, TestCase] = {}
+    for package in parsed_args.packages:
+        for name, test_case in partial(_get_test_cases, package)().items():
+            test_cases[f"{package}:{name}"] = test_case
+    if parsed_args.filters:
+        test_cases = {
+            name: test_case
+            for name, test_case in test_cases.items()
+            if any(f in name for f in parsed_args.filters)
+        }
+    results = run_benchmarks(
+        test_cases, parsed_args.benchmarks, parsed_args.repeat, parsed_args.memory
+    )
+
+    if parsed_args.output is not None:
+        with open(parsed_args.output, "w") as output:
+            json.dump(
+                {
+                    "unified_planning": unified_planning.__version__,
+                    "python": platform.python_version(),
+                    "results": results,
+                },
+                output,
+                indent=2,
+            )
+    if parsed_args.baseline is not None:
+        with open(parsed_args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        regressions = compare(
+            results,
+            baseline,
+            parsed_args.time_threshold,
+            parsed_args.memory_threshold,
+            parsed_args.min_time,
+            parsed_args.min_memory * 2**20,
+        )
+        if regressions:
+            print("\nRegressions with respect to the baseline:")
+            print("   ", "\n    ".join(regressions))
+            return 1
+        print("\nNo regressions with respect to the baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,286 @@
+import argparse
+import copyreg
+import gc
+import io
+import json
+import pickle
+import platform
+import sys
+import time
+import tracemalloc
+from functools import partial
+from typing import Any, Dict, List
+
+import unified_planning
+from unified_planning.shortcuts import *
+from unified_planning.environment import Environment, get_environment
+from unified_planning.exceptions import UPException
+from unified_planning.io import PDDLReader, PDDLWriter
+from unified_planning.model.fnode import FNode
+from unified_planning.test import TestCase
+
+from utils import _get_test_cases  # type: ignore
+
+
+get_environment().credits_stream = None  # silence credits
+
+
+class PlainFNode:
+    """
+    A node with the fields of the `FNode` stored in a per-instance dict instead of the
+    slots, used as the reference layout of the nodes.
+    """
+
+    def __init__(self, node: FNode):
+        self._content = node._content
+        self._node_id = node._node_id
+        self._env = node._env
+
+
+class DefaultStatePickler(pickle.Pickler):
+    """
+    Pickler storing the `FNodes` with the default state of the slotted objects, the
+    dict of the slots, instead of the tuple returned by `FNode.__getstate__`.
+    """
+
+    def reducer_override(self, obj):
+        if type(obj) is FNode:
+            slots = {"_content": obj._content, "_node_id": obj._node_id}
+            slots["_env"] = obj._env
+            return (copyreg.__newobj__, (FNode,), (None, slots))  # type: ignore[attr-defined]
+        return NotImplemented
+
+
+def content_size(node: FNode) -> int:
+    content = node._content
+    size = sys.getsizeof(content)
+    if content.args:
+        size += sys.getsizeof(content.args)
+    return size
+
+
+def expressions_size(environment: Environment) -> Dict[str, int]:
+    """
+    Returns the number of the expressions interned in the given environment and the
+    bytes they use, with the `FNode` layout and with the `PlainFNode` one.
+    """
+    nodes = list(environment.expression_manager.expressions.values())
+    size, plain_size = 0, 0
+    for node in nodes:
+        plain_node = PlainFNode(node)
+        size += sys.getsizeof(node) + content_size(node)
+        plain_size += sys.getsizeof(plain_node) + sys.getsizeof(plain_node.__dict__)
+        plain_size += content_size(node)
+    return {"nodes": len(nodes), "nodes_size": size, "plain_nodes_size": plain_size}
+
+
+def default_pickle_size(obj: Any) -> int:
+    stream = io.BytesIO()
+    DefaultStatePickler(stream, pickle.HIGHEST_PROTOCOL).dump(obj)
+    return len(stream.getvalue())
+
+
+def in_new_environment(problem: "up.model.Problem") -> "up.model.Problem":
+    """
+    Returns a copy of the given problem in a new `Environment`, written and parsed back
+    in PDDL, so the expressions counted for it are not shared with the other problems.
+    """
+    writer = PDDLWriter(problem)
+    environment = Environment()
+    environment.credits_stream = None
+    return PDDLReader(environment).parse_problem_string(
+        writer.get_domain(), writer.get_problem()
+    )
+
+
+def report_memory(
+    problem_test_cases: Dict[str, TestCase], grounder_name: str, trace: bool
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Grounds every problem of the given test cases in a new `Environment` and reports
+    the expressions of the problem and of its grounding, their size in memory and the
+    size of the pickled grounded problem, compared with the ones of the reference
+    layout: the `PlainFNode` and the default pickling of the slotted objects.
+    """
+    print("Memory report of the grounded problems")
+    header = [
+        "test case",
+        "nodes",
+        "nodes size",
+        "plain size",
+        "pickle size",
+        "default pickle",
+        "peak",
+        "time",
+    ]
+    print(f"{header[0]:50s}" + "".join(h.rjust(15) for h in header[1:]))
+    results: Dict[str, Dict[str, Any]] = {}
+    for name, test_case in problem_test_cases.items():
+        try:
+            problem = in_new_environment(test_case.problem)
+        except Exception as e:
+            print(f"{name:50s} not copied in a new environment: {type(e).__name__}")
+            continue
+        gc.collect()
+        if trace:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            with Compiler(name=grounder_name, problem_kind=problem.kind) as grounder:
+                if not grounder.supports(problem.kind):
+                    print(f"{name:50s} unsupported problem kind")
+                    continue
+                grounded_problem = grounder.compile(
+                    problem, CompilationKind.GROUNDING
+                ).problem
+        except UPException as e:
+            print(f"{name:50s} {type(e).__name__}")
+            continue
+        finally:
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] if trace else None
+            if trace:
+                tracemalloc.stop()
+        result: Dict[str, Any] = expressions_size(problem.environment)
+        result["pickle_size"] = len(
+            pickle.dumps(grounded_problem, pickle.HIGHEST_PROTOCOL)
+        )
+        result["default_pickle_size"] = default_pickle_size(grounded_problem)
+        result["time"] = elapsed
+        if peak is not None:
+            result["peak_memory"] = peak
+        results[name] = result
+        peak_str = "-" if peak is None else f"{peak / 2**20:.2f}MB"
+        print(
+            f"{name:50s}{result['nodes']:15d}"
+            + "".join(
+                f"{result[key] / 2**20:13.2f}MB"
+                for key in [
+                    "nodes_size",
+                    "plain_nodes_size",
+                    "pickle_size",
+                    "default_pickle_size",
+                ]
+            )
+            + f"{peak_str:>15s}{elapsed:14.3f}s"
+        )
+    total_size = sum(r["nodes_size"] for r in results.values())
+    total_plain_size = sum(r["plain_nodes_size"] for r in results.values())
+    total_pickle = sum(r["pickle_size"] for r in results.values())
+    total_default_pickle = sum(r["default_pickle_size"] for r in results.values())
+    if total_plain_size and total_default_pickle:
+        print(
+            f"\nThe nodes use {1 - total_size / total_plain_size:.1%} less memory than "
+            f"the plain objects and the pickled problems are "
+            f"{1 - total_pickle / total_default_pickle:.1%} smaller than with the "
+            f"default pickling."
+        )
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]]
+) -> None:
+    """Prints the relative changes of the given results with respect to the baseline."""
+    keys = ["nodes", "nodes_size", "pickle_size", "peak_memory"]
+    print("\nChanges with respect to the baseline")
+    print(f"{'test case':50s}" + "".join(k.rjust(15) for k in keys))
+    for name, result in results.items():
+        expected = baseline.get(name, None)
+        if expected is None:
+            continue
+        changes = []
+        for key in keys:
+            old, new = expected.get(key, None), result.get(key, None)
+            if old is None or new is None or old == 0:
+                changes.append("-".rjust(15))
+            else:
+                changes.append(f"{new / old - 1:+15.1%}")
+        print(f"{name:50s}" + "".join(changes))
+
+
+def main(args: List[str]):
+    parser = argparse.ArgumentParser(
+        description="Reports the memory used by the expressions of the grounded problems.",
+        allow_abbrev=False,
+    )
+    parser.add_argument(
+        "-p",
+        "--packages",
+        type=str,
+        nargs="+",
+        help="gathers the tests by searching the get_test_cases method inside given packages",
+        dest="packages",
+        default=["performance"],
+    )
+    parser.add_argument(
+        "-f",
+        "--filter",
+        "--filters",
+        type=str,
+        nargs="+",
+        help="Runs only the test that contains one of the given filters.",
+        dest="filters",
+        default=[],
+    )
+    parser.add_argument(
+        "-g",
+        "--grounder",
+        type=str,
+        help="The grounder used; defaults to the up_grounder.",
+        dest="grounder",
+        default="up_grounder",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        dest="trace",
+        help="Reports the peak memory allocated during the grounding; it makes the grounding much slower.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=str,
+        help="Writes the results in the given JSON file.",
+        dest="output",
+        default=None,
+    )
+    parser.add_argument(
+        "--baseline",
+        type=str,
+        help="Compares the results with the ones in the given JSON file.",
+        dest="baseline",
+        default=None,
+    )
+    parsed_args = parser.parse_args(args)
+
+    problem_test_cases: Dict[str, TestCase] = {}
+    for package in parsed_args.packages:
+        for name, test_case in partial(_get_test_cases, package)().items():
+            problem_test_cases[f"{package}:{name}"] = test_case
+    if parsed_args.filters:
+        problem_test_cases = {
+            name: test_case
+            for name, test_case in problem_test_cases.items()
+            if any(f in name for f in parsed_args.filters)
+        }
+    results = report_memory(problem_test_cases, parsed_args.grounder, parsed_args.trace)
+
+    if parsed_args.output is not None:
+        with open(parsed_args.output, "w") as output:
+            json.dump(
+                {
+                    "unified_planning": unified_planning.__version__,
+                    "python": platform.python_version(),
+                    "results": results,
+                },
+                output,
+                indent=2,
+            )
+    if parsed_args.baseline is not None:
+        with open(parsed_args.baseline) as baseline_file:
+            compare(results, json.load(baseline_file)["results"])
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -1,9 +1,15 @@
+import hashlib
 import importlib
+import importlib.metadata
+import json
+import multiprocessing
+import os
 import sys
 import time
 from functools import partial
 from itertools import chain
-from typing import List, Tuple
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Iterator, List, NamedTuple, Tuple, cast
 import warnings
 
 from unified_planning.engines import (
@@ -251,11 +257,461 @@ def check_grounding_result(test: TestCase, result: CompilerResult) -> ResultSet:
     return validation_res
 
 
+def check_anytime_solution_improvement(
+    problem: AbstractProblem,
+    metrics_evaluations: List[Dict[PlanQualityMetric, Union[int, Fraction]]],
+) -> ResultSet:
+    if not hasattr(problem, "quality_metrics") or not problem.quality_metrics:  # type: ignore [attr-defined]
+        if any(m for m in metrics_evaluations):
+            return Warn(
+                "Validator returned metric evaluations when the problem has no quality metrics"
+            )
+        return Ok()
+    if len(problem.quality_metrics) != 1:
+        return Warn("Problem has more that 1 quality metric")
+    metric_values: Dict[PlanQualityMetric, List[Union[int, Fraction]]] = {}
+
+    for element in metrics_evaluations:
+        for metric, value in element.items():
+            metric_values.setdefault(metric, []).append(value)
+
+    output = Void()
+    for metric, values in metric_values.items():
+        metric_class_name = metric.__class__.__name__.lower()
+        must_be_reversed = "minimize" in metric_class_name
+        if values != sorted(values, reverse=must_be_reversed):
+            output += Err(f"Metric: {metric}, values: {values}")
+    return output
+
+
+def check_all_optimal_solutions(
+    test_case: TestCase,
+    metrics_evaluations: List[Dict[PlanQualityMetric, Union[int, Fraction]]],
+) -> ResultSet:
+    if test_case.optimum is None:
+        return Void()
+    for metrics_evaluation in metrics_evaluations:
+        assert len(metrics_evaluation) == 1, "Multiple metric not implemented"
+        if any(v != test_case.optimum for v in metrics_evaluation.values()):
+            return Err("Non optimal plan returned")
+    return Ok()
+
+
+class Task(NamedTuple):
+    """
+    A run of an engine on a test case in the given mode; `plan` is the name of the
+    list of plans of the test case and the index of the plan given to the engine.
+    """
+
+    mode: str
+    engine: str
+    test_case: str
+    plan: Optional[Tuple[str, int]] = None
+
+
+# The text reported after the engine name and whether the task failed
+TaskOutcome = Tuple[str, bool]
+
+
+def crash_outcome(e: Any) -> TaskOutcome:
+    return f"{bcolors.ERR}CRASH{bcolors.ENDC} {e}", True
+
+
+def run_oneshot(
+    task: Task, test_case: TestCase, timeout: Optional[float], deliverable: bool
+) -> TaskOutcome:
+    planner = OneshotPlanner(name=task.engine)
+    assert isinstance(
+        planner, OneshotPlannerMixin
+    ), "Error in oneshot planners selection"
+    start = time.time()
+    result = planner.solve(test_case.problem, timeout=timeout)
+    total_execution_time = time.time() - start
+    status = str(result.status.name).ljust(25)
+    outcome, metrics_evaluation = check_result(test_case, result, planner)
+    if (
+        result.status is PlanGenerationResultStatus.SOLVED_OPTIMALLY
+        and metrics_evaluation
+    ):
+        assert (
+            len(metrics_evaluation) == 1
+        ), "Can't support more than 1 metric in the problem"
+        value = tuple(metrics_evaluation.values())[0]
+        expected_value = test_case.optimum
+        if expected_value is not None:
+            outcome += verify(
+                value == expected_value,
+                f"Expected OPT but metric evaluation = {value} and expected optimum = {expected_value}",
+            )
+        else:
+            outcome = Warn("The optimum is not defined in the test_case") + outcome
+    runtime_report = report_runtime(
+        result.metrics,
+        total_execution_time,
+        0.10,
+        deliverable=deliverable,
+    )
+    return f"{status}      {runtime_report} {outcome}", not outcome.ok()
+
+
+def run_plan_repair(
+    task: Task, test_case: TestCase, timeout: Optional[float], deliverable: bool
+) -> TaskOutcome:
+    assert task.plan is not None
+    plan = getattr(test_case, task.plan[0])[task.plan[1]]
+    planner = PlanRepairer(name=task.engine)
+    assert isinstance(planner, PlanRepairerMixin), "Error in plan repairer selection"
+    start = time.time()
+    result = planner.repair(test_case.problem, plan)
+    total_execution_time = time.time() - start
+    status = str(result.status.name).ljust(25)
+    outcome, _ = check_result(test_case, result, planner)
+    runtime_report = report_runtime(
+        result.metrics,
+        total_execution_time,
+        0.10,
+        deliverable=deliverable,
+    )
+    return f"{status}      {runtime_report} {outcome}", not outcome.ok()
+
+
+def run_anytime(
+    task: Task, test_case: TestCase, timeout: Optional[float], deliverable: bool
+) -> TaskOutcome:
+    planner = AnytimePlanner(name=task.engine)
+    outcome: ResultSet = Void()
+    metrics_evaluations: List[Dict[PlanQualityMetric, Union[int, Fraction]]] = []
+    assert isinstance(planner, AnytimePlannerMixin), "Error in Anytime selection"
+    results = []
+    start = time.time()
+    for result in planner.get_solutions(test_case.problem, timeout=timeout):
+        results.append(result)
+    total_execution_time = time.time() - start
+    for result in results:
+        status = str(result.status.name).ljust(25)
+        validity, metrics_evaluation = check_result(test_case, result, planner)
+        outcome += validity
+        if metrics_evaluation:
+            metrics_evaluations.append(metrics_evaluation)
+    error = not outcome.ok()
+    if test_case.solvable and planner.ensures(AnytimeGuarantee.INCREASING_QUALITY):
+        outcome += check_anytime_solution_improvement(
+            test_case.problem, metrics_evaluations
+        )
+    if test_case.solvable and planner.ensures(AnytimeGuarantee.OPTIMAL_PLANS):
+        outcome += check_all_optimal_solutions(test_case, metrics_evaluations)
+    runtime_report = report_runtime(
+        result.metrics,
+        total_execution_time,
+        0.15,
+        deliverable=deliverable,
+    )
+    return f"{status}      {runtime_report} {outcome}", error
+
+
+def run_validation(
+    task: Task, test_case: TestCase, timeout: Optional[float], deliverable: bool
+) -> TaskOutcome:
+    assert task.plan is not None
+    plans_name, index = task.plan
+    plan = getattr(test_case, plans_name)[index]
+    validator = PlanValidator(name=task.engine)
+    assert isinstance(validator, PlanValidatorMixin)
+    start = time.time()
+    result = validator.validate(test_case.problem, plan)
+    total_execution_time = time.time() - start
+    status = str(result.status.name).ljust(25)
+    runtime_report = report_runtime(
+        result.metrics, total_execution_time, 0.05, deliverable=deliverable
+    )
+    if plans_name == "valid_plans":
+        expected_status, verdict = ValidationResultStatus.VALID, Ok("Valid")
+    else:
+        expected_status, verdict = ValidationResultStatus.INVALID, Ok("Invalid")
+    error = result.status != expected_status
+    if error:
+        verdict = Err(f"Incorrectly flagged as {result.status.name}")
+    return f"{status}      {runtime_report}{verdict}", error
+
+
+def run_grounding(
+    task: Task, test_case: TestCase, timeout: Optional[float], deliverable: bool
+) -> TaskOutcome:
+    compiler = Compiler(name=task.engine)
+    start = time.time()
+    assert isinstance(compiler, CompilerMixin)
+    result = compiler.compile(
+        test_case.problem, compilation_kind=CompilationKind.GROUNDING
+    )
+    end = time.time()
+    status = str("COMPILED").ljust(25)
+    outcome = check_grounding_result(test_case, result)
+    runtime = "{:.3f}s".format(end - start).ljust(15)
+    return f"{status}      {runtime} {outcome}", not outcome.ok()
+
+
+TASK_RUNNERS: Dict[
+    str, Callable[[Task, TestCase, Optional[float], bool], TaskOutcome]
+] = {
+    "oneshot": run_oneshot,
+    "repair": run_plan_repair,
+    "anytime": run_anytime,
+    "validation": run_validation,
+    "grounding": run_grounding,
+}
+
+
+def run_task(
+    task: Task, test_case: TestCase, timeout: Optional[float], deliverable: bool
+) -> TaskOutcome:
+    try:
+        return TASK_RUNNERS[task.mode](task, test_case, timeout, deliverable)
+    except Exception as e:
+        return crash_outcome(e)
+
+
+def _run_task_process(
+    conn: Connection,
+    task: Task,
+    test_case: Optional[TestCase],
+    packages: List[str],
+    timeout: Optional[float],
+    deliverable: bool,
+):
+    warnings.simplefilter("ignore")
+    if test_case is None:
+        # The process does not share the memory of the main one, so it gathers the test cases again
+        test_case = get_test_cases_from_packages(packages)[task.test_case]
+    outcome = run_task(task, test_case, timeout, deliverable)
+    conn.send(outcome)
+    conn.close()
+
+
+def engine_version(engine_name: str) -> str:
+    """Returns the version of the package defining the given engine, if it is declared."""
+    package = factory.engine(engine_name).__module__.split(".")[0]
+    version = getattr(sys.modules.get(package, None), "__version__", None)
+    if version is None:
+        try:
+            version = importlib.metadata.version(package.replace("_", "-"))
+        except importlib.metadata.PackageNotFoundError:
+            version = "unknown"
+    return str(version)
+
+
+class TaskRunner:
+    """
+    Runs the tasks of the report and returns their outcomes in the order of the tasks.
+
+    With more than 1 job, every task runs in its own process, at most `jobs` at the
+    same time, and the tasks running for more than `task_timeout` seconds are killed.
+
+    With a `cache_dir`, the outcome of every task is stored in a file named after the
+    hash of the test case, the engine name and version, and the options of the report,
+    so the tasks whose content did not change are not run again.
+    """
+
+    def __init__(
+        self,
+        test_cases: Dict[str, TestCase],
+        packages: List[str],
+        timeout: Optional[float],
+        deliverable: bool,
+        jobs: int = 1,
+        task_timeout: Optional[float] = None,
+        cache_dir: Optional[str] = None,
+    ):
+        self.test_cases = test_cases
+        self.packages = packages
+        self.timeout = timeout
+        self.deliverable = deliverable
+        self.jobs = jobs
+        self.task_timeout = task_timeout
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+        self._test_case_digests: Dict[str, str] = {}
+        self._engine_versions: Dict[str, str] = {}
+
+    def run(self, tasks: List[Task]) -> Iterator[Tuple[Task, TaskOutcome]]:
+        outcomes: Dict[int, TaskOutcome] = {}
+        to_run = []
+        for i, task in enumerate(tasks):
+            cached = self._get_cached(task)
+            if cached is None:
+                to_run.append(i)
+            else:
+                outcomes[i] = cached
+        if self.jobs <= 1:
+            completed: Iterator[Tuple[int, TaskOutcome, bool]] = (
+                (i, self._run_here(tasks[i]), True) for i in to_run
+            )
+        else:
+            completed = self._run_in_processes(tasks, to_run)
+        next_index = 0
+        while next_index < len(tasks):
+            if next_index not in outcomes:
+                i, outcome, cacheable = next(completed)
+                outcomes[i] = outcome
+                if cacheable:
+                    self._set_cached(tasks[i], outcome)
+                continue
+            yield tasks[next_index], outcomes.pop(next_index)
+            next_index += 1
+
+    def _run_here(self, task: Task) -> TaskOutcome:
+        return run_task(
+            task, self.test_cases[task.test_case], self.timeout, self.deliverable
+        )
+
+    def _run_in_processes(
+        self, tasks: List[Task], to_run: List[int]
+    ) -> Iterator[Tuple[int, TaskOutcome, bool]]:
+        # With fork the processes inherit the test cases, otherwise they gather them again
+        fork = "fork" in multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("fork" if fork else None)
+        pending = list(reversed(to_run))
+        running: Dict[Connection, Tuple[int, Any, Optional[float]]] = {}
+        try:
+            while pending or running:
+                while pending and len(running) < self.jobs:
+                    i = pending.pop()
+                    task = tasks[i]
+                    reader, writer = context.Pipe(duplex=False)
+                    test_case = self.test_cases[task.test_case] if fork else None
+                    process = context.Process(
+                        target=_run_task_process,
+                        args=(
+                            writer,
+                            task,
+                            test_case,
+                            self.packages,
+                            self.timeout,
+                            self.deliverable,
+                        ),
+                        daemon=True,
+                    )
+                    process.start()
+                    writer.close()
+                    deadline = None
+                    if self.task_timeout is not None:
+                        deadline = time.time() + self.task_timeout
+                    running[reader] = (i, process, deadline)
+                deadlines = [d for _, _, d in running.values() if d is not None]
+                wait_time = None
+                if deadlines:
+                    wait_time = max(0.0, min(deadlines) - time.time())
+                for ready in wait(list(running), timeout=wait_time):
+                    reader = cast(Connection, ready)
+                    i, process, _ = running.pop(reader)
+                    try:
+                        outcome = reader.recv()
+                        cacheable = True
+                    except EOFError:
+                        outcome = crash_outcome(
+                            f"the process exited with code {process.exitcode}"
+                        )
+                        cacheable = False
+                    reader.close()
+                    process.join()
+                    yield i, outcome, cacheable
+                now = time.time()
+                for reader, (i, process, deadline) in list(running.items()):
+                    if deadline is not None and deadline <= now:
+                        del running[reader]
+                        process.kill()
+                        process.join()
+                        reader.close()
+                        outcome = crash_outcome(
+                            f"the task did not end in {self.task_timeout}s"
+                        )
+                        yield i, outcome, False
+        finally:
+            for reader, (_, process, _) in running.items():
+                process.kill()
+                process.join()
+                reader.close()
+
+    def _cache_path(self, task: Task) -> Optional[str]:
+        if self.cache_dir is None:
+            return None
+        digest = self._test_case_digests.get(task.test_case, None)
+        test_case = self.test_cases[task.test_case]
+        if digest is None:
+            content = f"{test_case.problem}\n{test_case.solvable}\n{test_case.optimum}"
+            digest = hashlib.sha256(content.encode()).hexdigest()
+            self._test_case_digests[task.test_case] = digest
+        version = self._engine_versions.get(task.engine, None)
+        if version is None:
+            version = engine_version(task.engine)
+            self._engine_versions[task.engine] = version
+        plan = None
+        if task.plan is not None:
+            plan = str(getattr(test_case, task.plan[0])[task.plan[1]])
+        key = json.dumps(
+            [
+                task.mode,
+                task.engine,
+                version,
+                digest,
+                task.plan,
+                plan,
+                self.timeout,
+                self.deliverable,
+            ]
+        )
+        return os.path.join(
+            self.cache_dir, hashlib.sha256(key.encode()).hexdigest() + ".json"
+        )
+
+    def _get_cached(self, task: Task) -> Optional[TaskOutcome]:
+        path = self._cache_path(task)
+        if path is None or not os.path.exists(path):
+            return None
+        with open(path) as cache_file:
+            cached = json.load(cache_file)
+        return cached["output"], cached["error"]
+
+    def _set_cached(self, task: Task, outcome: TaskOutcome):
+        path = self._cache_path(task)
+        if path is not None:
+            with open(path, "w") as cache_file:
+                json.dump({"output": outcome[0], "error": outcome[1]}, cache_file)
+
+
+# A test case header and its tasks, each with the engine name to print and its error
+ReportSection = Tuple[str, List[Tuple[Task, str, Tuple[str, str]]]]
+
+
+def print_sections(
+    sections: List[ReportSection], runner: TaskRunner
+) -> List[Tuple[str, str]]:
+    """Runs the tasks of the given sections and prints their outcomes, returning the errors."""
+    errors = []
+    headers: Dict[Task, str] = {}
+    labels: Dict[Task, str] = {}
+    error_names: Dict[Task, Tuple[str, str]] = {}
+    for header, section_tasks in sections:
+        headers[section_tasks[0][0]] = header
+        for task, label, error_name in section_tasks:
+            labels[task] = label
+            error_names[task] = error_name
+    tasks = [task for _, section_tasks in sections for task, _, _ in section_tasks]
+    for task, (output, error) in runner.run(tasks):
+        if task in headers:
+            print()
+            print(headers[task].ljust(40), end="\n")
+        print("|  ", labels[task].ljust(40), end="")
+        print(output)
+        if error:
+            errors.append(error_names[task])
+    return errors
+
+
 def report_oneshot(
     engines: List[str],
     problems: Dict[str, TestCase],
-    timeout: Optional[float],
-    deliverable,
+    runner: TaskRunner,
 ) -> List[Tuple[str, str]]:
     """Run all oneshot planners on all the given problems"""
 
@@ -264,66 +720,21 @@ def report_oneshot(
     planners = list(filter(lambda name: factory.engine(name).is_oneshot_planner(), engines))  # type: ignore [attr-defined, arg-type]
 
     print("\n\nONESHOT PLANNING:")
-    errors = []
+    sections: List[ReportSection] = []
     problems_skipped = []
     for name, test_case in problems.items():
-        name_printed = False
         pb = test_case.problem
-
+        section_tasks = []
         for planner_id in planners:
             planner = OneshotPlanner(name=planner_id)
             if planner.supports(pb.kind):
-                if not name_printed:
-                    name_printed = True
-                    print()
-                    print(name.ljust(40), end="\n")
-
-                print("|  ", planner_id.ljust(40), end="")
-                try:
-                    assert isinstance(
-                        planner, OneshotPlannerMixin
-                    ), "Error in oneshot planners selection"
-                    start = time.time()
-                    result = planner.solve(pb, timeout=timeout)
-                    total_execution_time = time.time() - start
-                    status = str(result.status.name).ljust(25)
-                    outcome, metrics_evaluation = check_result(
-                        test_case, result, planner
-                    )
-                    if (
-                        result.status is PlanGenerationResultStatus.SOLVED_OPTIMALLY
-                        and metrics_evaluation
-                    ):
-                        assert (
-                            len(metrics_evaluation) == 1
-                        ), "Can't support more than 1 metric in the problem"
-                        value = tuple(metrics_evaluation.values())[0]
-                        expected_value = test_case.optimum
-                        if expected_value is not None:
-                            outcome += verify(
-                                value == expected_value,
-                                f"Expected OPT but metric evaluation = {value} and expected optimum = {expected_value}",
-                            )
-                        else:
-                            outcome = (
-                                Warn("The optimum is not defined in the test_case")
-                                + outcome
-                            )
-                    if not outcome.ok():
-                        errors.append((planner_id, name))
-                    runtime_report = report_runtime(
-                        result.metrics,
-                        total_execution_time,
-                        0.10,
-                        deliverable=deliverable,
-                    )
-                    print(status, "    ", runtime_report, outcome)
-
-                except Exception as e:
-                    print(f"{bcolors.ERR}CRASH{bcolors.ENDC}", e)
-                    errors.append((planner_id, name))
-        if not name_printed:
+                task = Task("oneshot", planner_id, name)
+                section_tasks.append((task, planner_id, (planner_id, name)))
+        if section_tasks:
+            sections.append((name, section_tasks))
+        else:
             problems_skipped.append(name)
+    errors = print_sections(sections, runner)
 
     if len(problems_skipped) == len(problems):
         print("\n\nOneshot problems skipped: ALL")
@@ -335,7 +746,7 @@ def report_oneshot(
 
 
 def report_plan_repair(
-    engines: List[str], problems: Dict[str, TestCase], deliverable: bool
+    engines: List[str], problems: Dict[str, TestCase], runner: TaskRunner
 ) -> List[Tuple[str, str]]:
     """Run all plan repairer on all the given problems"""
 
@@ -344,51 +755,25 @@ def report_plan_repair(
     planners = list(filter(lambda name: factory.engine(name).is_plan_repairer(), engines))  # type: ignore [attr-defined, arg-type]
 
     print("\n\nPLAN REPAIR:")
-    errors = []
+    sections: List[ReportSection] = []
     problems_skipped = []
-    problems_run = 0
     for name, test_case in problems.items():
         pb = test_case.problem
         for i, plan in enumerate(test_case.invalid_plans):
-            name_printed = False
+            header = f"{name} [{i}]"
+            section_tasks = []
             for planner_id in planners:
                 planner = PlanRepairer(name=planner_id)
                 if planner.supports(pb.kind) and planner.supports_plan(plan.kind):
-                    if not name_printed:
-                        problems_run += 1
-                        name_printed = True
-                        print()
-                        print(f"{name} [{i}]".ljust(40), end="\n")
-
-                    print("|  ", planner_id.ljust(40), end="")
-                    try:
-                        assert isinstance(
-                            planner, PlanRepairerMixin
-                        ), "Error in plan repairer selection"
-                        start = time.time()
-                        result = planner.repair(pb, plan)
-                        total_execution_time = time.time() - start
-                        status = str(result.status.name).ljust(25)
-                        outcome, metrics_evaluation = check_result(
-                            test_case, result, planner
-                        )
-                        if not outcome.ok():
-                            errors.append((planner_id, f"{name} [{i}]"))
-                        runtime_report = report_runtime(
-                            result.metrics,
-                            total_execution_time,
-                            0.10,
-                            deliverable=deliverable,
-                        )
-                        print(status, "    ", runtime_report, outcome)
-
-                    except Exception as e:
-                        print(f"{bcolors.ERR}CRASH{bcolors.ENDC}", e)
-                        errors.append((planner_id, f"{name} [{i}]"))
-            if not name_printed:
-                problems_skipped.append(f"{name} [{i}]")
+                    task = Task("repair", planner_id, name, ("invalid_plans", i))
+                    section_tasks.append((task, planner_id, (planner_id, header)))
+            if section_tasks:
+                sections.append((header, section_tasks))
+            else:
+                problems_skipped.append(header)
+    errors = print_sections(sections, runner)
 
-    if problems_run == 0:
+    if not sections:
         print("\n\nPlan Repair problems skipped: ALL")
     elif problems_skipped:
         print("\n\nPlan Repair problems skipped:")
@@ -397,51 +782,10 @@ def report_plan_repair(
     return errors
 
 
-def check_anytime_solution_improvement(
-    problem: AbstractProblem,
-    metrics_evaluations: List[Dict[PlanQualityMetric, Union[int, Fraction]]],
-) -> ResultSet:
-    if not hasattr(problem, "quality_metrics") or not problem.quality_metrics:  # type: ignore [attr-defined]
-        if any(m for m in metrics_evaluations):
-            return Warn(
-                "Validator returned metric evaluations when the problem has no quality metrics"
-            )
-        return Ok()
-    if len(problem.quality_metrics) != 1:
-        return Warn("Problem has more that 1 quality metric")
-    metric_values: Dict[PlanQualityMetric, List[Union[int, Fraction]]] = {}
-
-    for element in metrics_evaluations:
-        for metric, value in element.items():
-            metric_values.setdefault(metric, []).append(value)
-
-    output = Void()
-    for metric, values in metric_values.items():
-        metric_class_name = metric.__class__.__name__.lower()
-        must_be_reversed = "minimize" in metric_class_name
-        if values != sorted(values, reverse=must_be_reversed):
-            output += Err(f"Metric: {metric}, values: {values}")
-    return output
-
-
-def check_all_optimal_solutions(
-    test_case: TestCase,
-    metrics_evaluations: List[Dict[PlanQualityMetric, Union[int, Fraction]]],
-) -> ResultSet:
-    if test_case.optimum is None:
-        return Void()
-    for metrics_evaluation in metrics_evaluations:
-        assert len(metrics_evaluation) == 1, "Multiple metric not implemented"
-        if any(v != test_case.optimum for v in metrics_evaluation.values()):
-            return Err("Non optimal plan returned")
-    return Ok()
-
-
 def report_anytime(
     engines: List[str],
     problems: Dict[str, TestCase],
-    timeout: Optional[float],
-    deliverable: bool,
+    runner: TaskRunner,
 ) -> List[Tuple[str, str]]:
     """Run all anytime planners on all problems that start with the given prefix"""
 
@@ -450,70 +794,21 @@ def report_anytime(
     planners = list(filter(lambda name: factory.engine(name).is_anytime_planner(), engines))  # type: ignore [attr-defined, arg-type]
 
     print("\n\nANYTIME PLANNING:")
-    errors = []
+    sections: List[ReportSection] = []
     problems_skipped = []
     for name, test_case in problems.items():
-        name_printed = False
         pb = test_case.problem
-
+        section_tasks = []
         for planner_id in planners:
             planner = AnytimePlanner(name=planner_id)
             if planner.supports(pb.kind):
-                if not name_printed:
-                    name_printed = True
-                    print()
-                    print(name.ljust(40), end="\n")
-
-                print("|  ", planner_id.ljust(40), end="")
-                try:
-                    outcome = Void()
-                    metrics_evaluations: List[
-                        Dict[PlanQualityMetric, Union[int, Fraction]]
-                    ] = []
-                    assert isinstance(
-                        planner, AnytimePlannerMixin
-                    ), "Error in Anytime selection"
-                    results = []
-                    start = time.time()
-                    for result in planner.get_solutions(pb, timeout=timeout):
-                        results.append(result)
-                    total_execution_time = time.time() - start
-                    for result in results:
-                        status = str(result.status.name).ljust(25)
-                        validity, metrics_evaluation = check_result(
-                            test_case, result, planner
-                        )
-                        outcome += validity
-                        if metrics_evaluation:
-                            metrics_evaluations.append(metrics_evaluation)
-                    if not outcome.ok():
-                        errors.append((planner_id, name))
-                    if test_case.solvable and planner.ensures(
-                        AnytimeGuarantee.INCREASING_QUALITY
-                    ):
-                        outcome += check_anytime_solution_improvement(
-                            test_case.problem, metrics_evaluations
-                        )
-                    if test_case.solvable and planner.ensures(
-                        AnytimeGuarantee.OPTIMAL_PLANS
-                    ):
-                        outcome += check_all_optimal_solutions(
-                            test_case, metrics_evaluations
-                        )
-                    runtime_report = report_runtime(
-                        result.metrics,
-                        total_execution_time,
-                        0.15,
-                        deliverable=deliverable,
-                    )
-                    print(status, "    ", runtime_report, outcome)
-
-                except Exception as e:
-                    print(f"{bcolors.ERR}CRASH{bcolors.ENDC}", e)
-                    errors.append((planner_id, name))
-
-        if not name_printed:
+                task = Task("anytime", planner_id, name)
+                section_tasks.append((task, planner_id, (planner_id, name)))
+        if section_tasks:
+            sections.append((name, section_tasks))
+        else:
             problems_skipped.append(name)
+    errors = print_sections(sections, runner)
 
     if len(problems_skipped) == len(problems):
         print("\n\nAnytime problems skipped: ALL")
@@ -525,7 +820,7 @@ def report_anytime(
 
 
 def report_validation(
-    engines: List[str], problems: Dict[str, TestCase], deliverable: bool
+    engines: List[str], problems: Dict[str, TestCase], runner: TaskRunner
 ) -> List[Tuple[str, str]]:
     """Checks that all given plan validators produce the correct output on test-cases."""
     factory = get_environment().factory
@@ -533,69 +828,35 @@ def report_validation(
     validators = list(filter(lambda name: factory.engine(name).is_plan_validator(), engines))  # type: ignore [attr-defined, arg-type]
 
     def applicable_validators(pb, plan):
-        vals = [PlanValidator(name=validator_name) for validator_name in validators]
+        vals = [(n, PlanValidator(name=n)) for n in validators]
         return filter(
-            lambda e: e.supports(pb.kind) and e.supports_plan(plan.kind), vals
+            lambda n_e: n_e[1].supports(pb.kind) and n_e[1].supports_plan(plan.kind),
+            vals,
         )
 
     print("\n\nVALIDATION")
-    errors: List[Tuple[str, str]] = []  # all errors encountered
+    sections: List[ReportSection] = []
     problems_skipped = []
-    problems_run = 0
     for name, test_case in problems.items():
-        result: ValidationResult
-        for i, valid_plan in enumerate(test_case.valid_plans):
-            problem_name_printed = False
-            for validator in applicable_validators(test_case.problem, valid_plan):
-                if not problem_name_printed:
-                    problems_run += 1
-                    problem_name_printed = True
-                    print()
-                    print(f"{name} valid[{i}]".ljust(40), end="\n")
-
-                print("|  ", validator.name.ljust(40), end="")
-                start = time.time()
-                result = validator.validate(test_case.problem, valid_plan)
-                total_execution_time = time.time() - start
-                print(str(result.status.name).ljust(25), end="      ")
-                runtime_report = report_runtime(
-                    result.metrics, total_execution_time, 0.05, deliverable=deliverable
-                )
-                print(runtime_report, end="")
-                if result.status == ValidationResultStatus.VALID:
-                    print(Ok("Valid"))
+        for plans_name, label in (
+            ("valid_plans", "valid"),
+            ("invalid_plans", "invalid"),
+        ):
+            for i, plan in enumerate(getattr(test_case, plans_name)):
+                header = f"{name} {label}[{i}]"
+                section_tasks = []
+                for validator_name, validator in applicable_validators(
+                    test_case.problem, plan
+                ):
+                    task = Task("validation", validator_name, name, (plans_name, i))
+                    section_tasks.append((task, validator.name, (name, validator.name)))
+                if section_tasks:
+                    sections.append((header, section_tasks))
                 else:
-                    print(Err(f"Incorrectly flagged as {result.status.name}"))
-                    errors.append((name, validator.name))
-            if not problem_name_printed:
-                problems_skipped.append(f"{name} valid[{i}]")
-
-        for i, invalid_plan in enumerate(test_case.invalid_plans):
-            problem_name_printed = False
-            for validator in applicable_validators(test_case.problem, invalid_plan):
-                if not problem_name_printed:
-                    problems_run += 1
-                    problem_name_printed = True
-                    print()
-                    print(f"{name} invalid[{i}]".ljust(40), end="\n")
-                print("|  ", validator.name.ljust(40), end="")
-                start = time.time()
-                result = validator.validate(test_case.problem, invalid_plan)
-                total_execution_time = time.time() - start
-                print(str(result.status.name).ljust(25), end="      ")
-                runtime_report = report_runtime(
-                    result.metrics, total_execution_time, 0.05, deliverable=deliverable
-                )
-                print(runtime_report, end="")
-                if result.status == ValidationResultStatus.INVALID:
-                    print(Ok("Invalid"))
-                else:
-                    print(Err(f"Incorrectly flagged as {result.status.name}"))
-                    errors.append((name, validator.name))
-            if not problem_name_printed:
-                problems_skipped.append(f"{name} invalid[{i}]")
+                    problems_skipped.append(header)
+    errors = print_sections(sections, runner)
 
-    if problems_run == 0:
+    if not sections:
         print("\n\nValidation problems skipped: ALL")
     elif problems_skipped:
         print("\n\nValidation test cases skipped:")
@@ -605,7 +866,7 @@ def report_validation(
 
 
 def report_grounding(
-    engines: List[str], problems: Dict[str, TestCase]
+    engines: List[str], problems: Dict[str, TestCase], runner: TaskRunner
 ) -> List[Tuple[str, str]]:
     """Checks that all given grounders produce the correct output on test-cases."""
     factory = get_environment().factory
@@ -618,9 +879,8 @@ def report_grounding(
     grounders = list(filter(is_grounder, engines))
 
     print("\n\nGROUNDING:")
-    errors: List[Tuple[str, str]] = []
+    sections: List[ReportSection] = []
     problems_skipped = []
-    problems_run = 0
     for name, test_case in problems.items():
         pb = test_case.problem
         kind = pb.kind
@@ -628,39 +888,19 @@ def report_grounding(
         if not kind.has_action_based() or not any(a.parameters for a in pb.actions):  # type: ignore [attr-defined] # If the kind has action_based, the pb.actions is defined
             continue
 
-        name_printed = False
-
+        section_tasks = []
         for engine_id in grounders:
             compiler = Compiler(name=engine_id)
             if compiler.supports(kind):
-                if not name_printed:
-                    name_printed = True
-                    problems_run += 1
-                    print()
-                    print(name.ljust(40), end="\n")
-
-                print("|  ", engine_id.ljust(40), end="")
-                start = time.time()
-                try:
-                    assert isinstance(compiler, CompilerMixin)
-                    result = compiler.compile(
-                        pb, compilation_kind=CompilationKind.GROUNDING
-                    )
-                    end = time.time()
-                    status = str("COMPILED").ljust(25)
-                    outcome = check_grounding_result(test_case, result)
-                    if not outcome.ok():
-                        errors.append((engine_id, name))
-                    runtime = "{:.3f}s".format(end - start).ljust(15)
-                    print(status, "    ", runtime, outcome)
-
-                except Exception as e:
-                    print(f"{bcolors.ERR}CRASH{bcolors.ENDC}", e)
-                    errors.append((engine_id, name))
-        if not name_printed:
+                task = Task("grounding", engine_id, name)
+                section_tasks.append((task, engine_id, (engine_id, name)))
+        if section_tasks:
+            sections.append((name, section_tasks))
+        else:
             problems_skipped.append(name)
+    errors = print_sections(sections, runner)
 
-    if problems_run == 0:
+    if not sections:
         print("\n\nGrounding problems skipped: ALL")
     elif problems_skipped:
         print("\n\nGrounding problems skipped:")
@@ -714,27 +954,29 @@ def main():
     grounding_errors = []
     repair_errors = []
 
-    deliverable = parsed_args.deliverable
+    runner = TaskRunner(
+        problem_test_cases,
+        packages,
+        timeout,
+        parsed_args.deliverable,
+        jobs=parsed_args.jobs,
+        task_timeout=parsed_args.task_timeout,
+        cache_dir=parsed_args.cache,
+    )
 
     with warnings.catch_warnings():
         warnings.simplefilter("ignore")
 
         if "oneshot" in modes:
-            oneshot_errors = report_oneshot(
-                engines, problem_test_cases, timeout, deliverable
-            )
+            oneshot_errors = report_oneshot(engines, problem_test_cases, runner)
         if "anytime" in modes:
-            anytime_errors = report_anytime(
-                engines, problem_test_cases, timeout, deliverable
-            )
+            anytime_errors = report_anytime(engines, problem_test_cases, runner)
         if "repair" in modes:
-            repair_errors = report_plan_repair(engines, problem_test_cases, deliverable)
+            repair_errors = report_plan_repair(engines, problem_test_cases, runner)
         if "validation" in modes:
-            validation_errors = report_validation(
-                engines, problem_test_cases, deliverable
-            )
+            validation_errors = report_validation(engines, problem_test_cases, runner)
         if "grounding" in modes:
-            grounding_errors = report_grounding(engines, problem_test_cases)
+            grounding_errors = report_grounding(engines, problem_test_cases, runner)
 
     print()
     if oneshot_errors:
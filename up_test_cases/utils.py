@@ -263,6 +263,32 @@ def get_report_parser() -> argparse.ArgumentParser:
         default=DEFAULT_TIMEOUT,
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        dest="jobs",
+        help="The number of processes running the engines; with more than 1 job every run is isolated in its own process. Defaults to 1, running everything in the current process.",
+        default=1,
+    )
+
+    parser.add_argument(
+        "--task-timeout",
+        type=float,
+        dest="task_timeout",
+        help="The time in seconds after which the process of a run is killed, only used with more than 1 job; defaults to no limit.",
+        default=None,
+    )
+
+    parser.add_argument(
+        "-c",
+        "--cache",
+        type=str,
+        dest="cache",
+        help="The directory storing the outcome of every run, so the runs whose problem, engine version and options did not change are not repeated.",
+        default=None,
+    )
+
     parser.add_argument(
         "-d",
         "--deliverable",